@@ -5,8 +5,22 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
                               QLabel, QProgressBar)
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont, QColor
-from widgets import DigitalDisplay, StatusBar
-from translations import get_translator
+from widgets import DigitalDisplay, StatusBar, set_label_text, set_label_style
+from translations import get_translator, TranslatedTexts
+
+
+# Status-Flags: Label-Key → State-Key
+FLAG_STATE_KEYS = {
+    "charge_en": "vehicle_charge_enabled",
+    "discharge_en": "discharge_enabled",
+    "regen_en": "regen_brake_enabled",
+    "dc_dc_en": "dc_dc_enabled",
+    "iso_error": "iso_error",
+    "emergency": "emergency",
+}
+
+# Fehler-Flags werden rot statt grün angezeigt
+ERROR_FLAGS = ("iso_error", "emergency")
 
 
 class BatteryScreen(QWidget):
@@ -23,12 +37,11 @@ class BatteryScreen(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.translator = get_translator()
+        self.texts = TranslatedTexts(self.translator)
         self._init_ui()
     
     def _init_ui(self):
         """Erstellt UI-Layout."""
-        t = self.translator.get
-        
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(10, 10, 10, 10)
         main_layout.setSpacing(10)
@@ -38,7 +51,7 @@ class BatteryScreen(QWidget):
         main_layout.addWidget(self.status_bar)
         
         # ====== Titel ======
-        title = QLabel(t("battery_details"))
+        title = self.texts.add(QLabel(), "battery_details")
         title.setFont(QFont("Arial", 18, QFont.Bold))
         title.setStyleSheet("color: #00ffcc;")
         title.setAlignment(Qt.AlignCenter)
@@ -49,25 +62,25 @@ class BatteryScreen(QWidget):
         grid.setSpacing(10)
         
         # Zeile 1: Voltage & Current
-        self.voltage_display = DigitalDisplay(t("voltage"), "V")
+        self.voltage_display = self.texts.add(DigitalDisplay("", "V"), "voltage", setter="set_label")
         self.voltage_display.set_decimals(1)
         grid.addWidget(self.voltage_display, 0, 0)
         
-        self.current_display = DigitalDisplay(t("current"), "A")
+        self.current_display = self.texts.add(DigitalDisplay("", "A"), "current", setter="set_label")
         self.current_display.set_decimals(1)
         grid.addWidget(self.current_display, 0, 1)
         
-        self.power_display = DigitalDisplay(t("power"), "kW")
+        self.power_display = self.texts.add(DigitalDisplay("", "kW"), "power", setter="set_label")
         self.power_display.set_decimals(2)
         grid.addWidget(self.power_display, 0, 2)
         
         # Zeile 2: Temperaturen
-        self.pack_temp_display = DigitalDisplay(t("pack_temp"), "°C")
+        self.pack_temp_display = self.texts.add(DigitalDisplay("", "°C"), "pack_temp", setter="set_label")
         self.pack_temp_display.set_decimals(1)
         self.pack_temp_display.set_color(QColor(255, 140, 0))
         grid.addWidget(self.pack_temp_display, 1, 0)
         
-        self.ambient_temp_display = DigitalDisplay(t("ambient_temp"), "°C")
+        self.ambient_temp_display = self.texts.add(DigitalDisplay("", "°C"), "ambient_temp", setter="set_label")
         self.ambient_temp_display.set_decimals(1)
         self.ambient_temp_display.set_color(QColor(150, 150, 255))
         grid.addWidget(self.ambient_temp_display, 1, 1)
@@ -82,7 +95,7 @@ class BatteryScreen(QWidget):
         # ====== Zellspannungen (nur bei EnerDel) ======
         cell_group = QVBoxLayout()
         
-        cell_title = QLabel(t("cell_voltages_enerdel"))
+        cell_title = self.texts.add(QLabel(), "cell_voltages_enerdel")
         cell_title.setFont(QFont("Arial", 14, QFont.Bold))
         cell_title.setStyleSheet("color: #aaaaaa;")
         cell_group.addWidget(cell_title)
@@ -91,7 +104,7 @@ class BatteryScreen(QWidget):
         cell_grid.setSpacing(8)
         
         # Min Cell
-        self.cell_min_label = QLabel(t("min") + ":")
+        self.cell_min_label = self.texts.add(QLabel(), "min", "{}:")
         self.cell_min_label.setFont(QFont("Arial", 12))
         self.cell_min_label.setStyleSheet("color: #888888;")
         cell_grid.addWidget(self.cell_min_label, 0, 0)
@@ -102,7 +115,7 @@ class BatteryScreen(QWidget):
         cell_grid.addWidget(self.cell_min_value, 0, 1)
         
         # Max Cell
-        self.cell_max_label = QLabel(t("max") + ":")
+        self.cell_max_label = self.texts.add(QLabel(), "max", "{}:")
         self.cell_max_label.setFont(QFont("Arial", 12))
         self.cell_max_label.setStyleSheet("color: #888888;")
         cell_grid.addWidget(self.cell_max_label, 1, 0)
@@ -113,7 +126,7 @@ class BatteryScreen(QWidget):
         cell_grid.addWidget(self.cell_max_value, 1, 1)
         
         # Avg Cell
-        self.cell_avg_label = QLabel(t("avg") + ":")
+        self.cell_avg_label = self.texts.add(QLabel(), "avg", "{}:")
         self.cell_avg_label.setFont(QFont("Arial", 12))
         self.cell_avg_label.setStyleSheet("color: #888888;")
         cell_grid.addWidget(self.cell_avg_label, 0, 2)
@@ -124,7 +137,7 @@ class BatteryScreen(QWidget):
         cell_grid.addWidget(self.cell_avg_value, 0, 3)
         
         # Delta Cell
-        self.cell_delta_label = QLabel(t("delta") + ":")
+        self.cell_delta_label = self.texts.add(QLabel(), "delta", "{}:")
         self.cell_delta_label.setFont(QFont("Arial", 12))
         self.cell_delta_label.setStyleSheet("color: #888888;")
         cell_grid.addWidget(self.cell_delta_label, 1, 2)
@@ -140,7 +153,7 @@ class BatteryScreen(QWidget):
         # ====== Modulspannungen ======
         module_group = QVBoxLayout()
         
-        module_title = QLabel(t("module_voltages"))
+        module_title = self.texts.add(QLabel(), "module_voltages")
         module_title.setFont(QFont("Arial", 14, QFont.Bold))
         module_title.setStyleSheet("color: #aaaaaa;")
         module_group.addWidget(module_title)
@@ -156,7 +169,7 @@ class BatteryScreen(QWidget):
             row = i // 2
             col = (i % 2) * 2
             
-            label = QLabel(f"{t('module')} {i+1}:")
+            label = self.texts.add(QLabel(), "module", f"{{}} {i+1}:")
             label.setFont(QFont("Arial", 12))
             label.setStyleSheet("color: #888888;")
             module_grid.addWidget(label, row, col)
@@ -175,7 +188,7 @@ class BatteryScreen(QWidget):
         # ====== Status-Flags ======
         status_group = QVBoxLayout()
         
-        status_title = QLabel(t("status"))
+        status_title = self.texts.add(QLabel(), "status")
         status_title.setFont(QFont("Arial", 14, QFont.Bold))
         status_title.setStyleSheet("color: #aaaaaa;")
         status_group.addWidget(status_title)
@@ -185,31 +198,33 @@ class BatteryScreen(QWidget):
         flags_grid.setSpacing(5)
         
         self.flag_labels = {}
+        self.flag_text_keys = {}  # Flag -> Übersetzungs-Key
         flags = [
-            ("charge_en", t("charge_enabled")),
-            ("discharge_en", t("discharge_enabled")),
-            ("regen_en", t("regen_enabled")),
-            ("dc_dc_en", t("dc_dc_enabled")),
-            ("iso_error", t("iso_error")),
-            ("emergency", t("emergency")),
+            ("charge_en", "charge_enabled"),
+            ("discharge_en", "discharge_enabled"),
+            ("regen_en", "regen_enabled"),
+            ("dc_dc_en", "dc_dc_enabled"),
+            ("iso_error", "iso_error"),
+            ("emergency", "emergency"),
         ]
         
-        for idx, (key, text) in enumerate(flags):
+        for idx, (key, text_key) in enumerate(flags):
             row = idx // 2
             col = idx % 2
             
-            label = QLabel(f"⚫ {text}")
+            label = self.texts.add(QLabel(), text_key, "⚫ {}")
             label.setFont(QFont("Arial", 11))
             label.setStyleSheet("color: #666666;")
             flags_grid.addWidget(label, row, col)
             
             self.flag_labels[key] = label
+            self.flag_text_keys[key] = text_key
         
         status_group.addLayout(flags_grid)
         main_layout.addLayout(status_group)
         
         # ====== Batterie-Typ ======
-        self.battery_type_label = QLabel(t("type") + ": ---")
+        self.battery_type_label = self.texts.add(QLabel(), "type", "{}: ---")
         self.battery_type_label.setFont(QFont("Arial", 12))
         self.battery_type_label.setStyleSheet("color: #888888;")
         self.battery_type_label.setAlignment(Qt.AlignCenter)
@@ -217,9 +232,69 @@ class BatteryScreen(QWidget):
         
         self.setLayout(main_layout)
     
+    def _bindings(self):
+        """Widget-Bindungen: (State-Keys, Callback mit den Werten in Key-Reihenfolge)."""
+        bindings = [
+            # Haupt-Werte
+            ("voltage_V", self.voltage_display),
+            ("current_A", self.current_display),
+            ("power_kW", self.power_display),
+            # Temperaturen
+            ("pack_temp_C", self.pack_temp_display),
+            ("pcu_ambient_temp_C", self.ambient_temp_display),
+            ("dod_pct", self.dod_display),
+        ]
+        bindings = [
+            (key, lambda value, display=display: display.set_value(value or 0.0))
+            for key, display in bindings
+        ]
+        
+        # Cell voltages (EnerDel)
+        bindings.append((
+            ("is_enerdel", "e_pack_min_cell_V", "e_pack_max_cell_V",
+             "e_pack_avg_cell_V", "e_pack_delta_cell_V"),
+            self._on_cell_voltages
+        ))
+        
+        # Module voltages
+        for i, value_label in enumerate(self.module_values):
+            bindings.append((
+                f"module{i + 1}_voltage_V",
+                lambda voltage, label=value_label: self._on_module_voltage(label, voltage)
+            ))
+        
+        # Status-Flags
+        for key, state_key in FLAG_STATE_KEYS.items():
+            bindings.append((
+                state_key,
+                lambda value, key=key: self._on_flag(key, value)
+            ))
+        
+        # Batterie-Typ
+        bindings.append(("is_enerdel", self._on_battery_type))
+        return bindings
+    
+    def bind(self, state) -> list:
+        """
+        Bindet die Widgets an den VehicleState (Publish/Subscribe).
+        Gibt die Abos zurück, damit der Dashboard sie pausieren kann.
+        """
+        subscriptions = self.status_bar.bind(state)
+        for keys, callback in self._bindings():
+            subscriptions.append(state.subscribe(keys, callback))
+        return subscriptions
+    
+    def retranslate(self):
+        """
+        Setzt die Texte nach einem Sprachwechsel neu (Widgets und Werte
+        bleiben erhalten; wertabhängige Texte liefert der Dashboard per
+        State-Abo neu aus).
+        """
+        self.texts.retranslate()
+    
     def update_data(self, state: dict):
         """
-        Aktualisiert Anzeige mit neuen Daten.
+        Aktualisiert Anzeige mit einem kompletten State (ohne Abos, z.B. Test).
         
         Args:
             state: Dict mit allen Batterie-Werten
@@ -230,104 +305,74 @@ class BatteryScreen(QWidget):
         if ambient_temp is not None:
             self.status_bar.set_ambient_temp(ambient_temp)
         
-        # Haupt-Werte
-        self.voltage_display.set_value(state.get("voltage_V", 0.0))
-        self.current_display.set_value(state.get("current_A", 0.0))
-        self.power_display.set_value(state.get("power_kW", 0.0))
-        
-        # Temperaturen
-        self.pack_temp_display.set_value(state.get("pack_temp_C", 0.0))
-        self.ambient_temp_display.set_value(state.get("pcu_ambient_temp_C", 0.0))
-        self.dod_display.set_value(state.get("dod_pct", 0.0))
-        
-        # Cell voltages (EnerDel)
-        if state.get("is_enerdel"):
-            min_v = state.get("e_pack_min_cell_V")
-            max_v = state.get("e_pack_max_cell_V")
-            avg_v = state.get("e_pack_avg_cell_V")
-            delta_v = state.get("e_pack_delta_cell_V")
+        for keys, callback in self._bindings():
+            keys = (keys,) if isinstance(keys, str) else keys
+            callback(*[state.get(key) for key in keys])
+    
+    def _on_cell_voltages(self, is_enerdel, min_v, max_v, avg_v, delta_v):
+        """Zellspannungen (nur bei EnerDel)."""
+        if not is_enerdel:
+            return
+        
+        if min_v is not None:
+            set_label_text(self.cell_min_value, f"{min_v:.3f} V")
+        if max_v is not None:
+            set_label_text(self.cell_max_value, f"{max_v:.3f} V")
+        if avg_v is not None:
+            set_label_text(self.cell_avg_value, f"{avg_v:.3f} V")
+        if delta_v is not None:
+            set_label_text(self.cell_delta_value, f"{delta_v:.3f} V")
             
-            if min_v is not None:
-                self.cell_min_value.setText(f"{min_v:.3f} V")
-            if max_v is not None:
-                self.cell_max_value.setText(f"{max_v:.3f} V")
-            if avg_v is not None:
-                self.cell_avg_value.setText(f"{avg_v:.3f} V")
-            if delta_v is not None:
-                self.cell_delta_value.setText(f"{delta_v:.3f} V")
-                
-                # Delta color: Green at <50mV, Red at >100mV
-                if delta_v < 0.05:
-                    color = "#66ff66"
-                elif delta_v < 0.1:
-                    color = "#ffcc00"
-                else:
-                    color = "#ff6666"
-                self.cell_delta_value.setStyleSheet(f"color: {color};")
-        
-        # Module voltages
-        module_voltages = [
-            state.get("module1_voltage_V"),
-            state.get("module2_voltage_V"),
-            state.get("module3_voltage_V"),
-            state.get("module4_voltage_V"),
-        ]
-        
-        for i, (voltage, value_label) in enumerate(zip(module_voltages, self.module_values)):
-            if voltage is not None and voltage > 0:
-                value_label.setText(f"{voltage:.3f} V")
-                
-                # Color coding based on voltage level
-                # Normal: 20-50V (module with ~6 cells @ 3.3-4.2V each)
-                if 24 <= voltage <= 26:
-                    color = "#66ff66"  # Green: Good voltage
-                elif 20 <= voltage < 24 or 26 < voltage <= 30:
-                    color = "#ffcc00"  # Yellow: Warning
-                else:
-                    color = "#ff6666"  # Red: Out of range
-                value_label.setStyleSheet(f"color: {color};")
+            # Delta color: Green at <50mV, Red at >100mV
+            if delta_v < 0.05:
+                color = "#66ff66"
+            elif delta_v < 0.1:
+                color = "#ffcc00"
             else:
-                value_label.setText("--- V")
-                value_label.setStyleSheet("color: #00ccff;")
-        
-        # Status-Flags
-        flags_map = {
-            "charge_en": state.get("vehicle_charge_enabled"),
-            "discharge_en": state.get("discharge_enabled"),
-            "regen_en": state.get("regen_brake_enabled"),
-            "dc_dc_en": state.get("dc_dc_enabled"),
-            "iso_error": state.get("iso_error"),
-            "emergency": state.get("emergency"),
-        }
-        
-        for key, value in flags_map.items():
-            if key in self.flag_labels:
-                label = self.flag_labels[key]
-                text = label.text().split(" ", 1)[1]  # Nur Text ohne Symbol
-                
-                # Fehler-Flags (iso_error, emergency) -> Rot wenn aktiv
-                # Normal flags (charge_en, discharge_en, etc.) -> Green when active
-                is_error_flag = key in ["iso_error", "emergency"]
-                
-                if value is True:
-                    if is_error_flag:
-                        # Fehler aktiv = ROT (Alarm!)
-                        label.setText(f"🔴 {text}")
-                        label.setStyleSheet("color: #ff4444;")
-                    else:
-                        # Normal active = GREEN (OK)
-                        label.setText(f"🟢 {text}")
-                        label.setStyleSheet("color: #66ff66;")
-                else:
-                    # False oder None: inaktiv/unbekannt = grau (neutral)
-                    label.setText(f"⚫ {text}")
-                    label.setStyleSheet("color: #888888;")
-        
-        # Batterie-Typ
-        is_enerdel = state.get("is_enerdel", False)
+                color = "#ff6666"
+            set_label_style(self.cell_delta_value, f"color: {color};")
+    
+    def _on_module_voltage(self, value_label, voltage):
+        if voltage is not None and voltage > 0:
+            set_label_text(value_label, f"{voltage:.3f} V")
+            
+            # Color coding based on voltage level
+            # Normal: 20-50V (module with ~6 cells @ 3.3-4.2V each)
+            if 24 <= voltage <= 26:
+                color = "#66ff66"  # Green: Good voltage
+            elif 20 <= voltage < 24 or 26 < voltage <= 30:
+                color = "#ffcc00"  # Yellow: Warning
+            else:
+                color = "#ff6666"  # Red: Out of range
+            set_label_style(value_label, f"color: {color};")
+        else:
+            set_label_text(value_label, "--- V")
+            set_label_style(value_label, "color: #00ccff;")
+    
+    def _on_flag(self, key, value):
+        label = self.flag_labels[key]
+        text = self.translator.get(self.flag_text_keys[key])
+        
+        # Fehler-Flags (iso_error, emergency) -> Rot wenn aktiv
+        # Normal flags (charge_en, discharge_en, etc.) -> Green when active
+        if value is True:
+            if key in ERROR_FLAGS:
+                # Fehler aktiv = ROT (Alarm!)
+                set_label_text(label, f"🔴 {text}")
+                set_label_style(label, "color: #ff4444;")
+            else:
+                # Normal active = GREEN (OK)
+                set_label_text(label, f"🟢 {text}")
+                set_label_style(label, "color: #66ff66;")
+        else:
+            # False oder None: inaktiv/unbekannt = grau (neutral)
+            set_label_text(label, f"⚫ {text}")
+            set_label_style(label, "color: #888888;")
+    
+    def _on_battery_type(self, is_enerdel):
         t = self.translator.get
         batt_type = "EnerDel Li-Ion" if is_enerdel else "Zebra Na-NiCl2"
-        self.battery_type_label.setText(f"{t('type')}: {batt_type}")
+        set_label_text(self.battery_type_label, f"{t('type')}: {batt_type}")
 
 
 # Test
@@ -5,14 +5,23 @@ import can
 import time
 import os
 import logging
-from typing import Optional
+import threading
+from collections import deque
+from typing import Optional, List, Dict, Any, Iterable
 
 logger = logging.getLogger(__name__)
 
 
+# Maske für 11-Bit Standard-IDs (exakter Vergleich)
+STANDARD_ID_MASK = 0x7FF
+
+
 class CANInterface:
     """
     CAN-Interface-Manager mit automatischer Reconnect-Logik.
+    
+    Optional werden SocketCAN Acceptance-Filter im Kernel installiert,
+    sodass nur Frames mit den angegebenen IDs in Python ankommen.
     """
     
     def __init__(
@@ -21,7 +30,8 @@ class CANInterface:
         bustype: str = "socketcan",
         bitrate: int = 500000,
         retry_interval: float = 5.0,
-        max_retries: int = 10
+        max_retries: int = 10,
+        filter_ids: Optional[Iterable[int]] = None
     ):
         self.channel = channel
         self.bustype = bustype
@@ -29,6 +39,10 @@ class CANInterface:
         self.retry_interval = retry_interval
         self.max_retries = max_retries
         self.bus: Optional[can.BusABC] = None
+        
+        # Kernel-Filter: None = kompletter Bus
+        self.filter_ids: Optional[frozenset] = frozenset(filter_ids) if filter_ids else None
+        self.filters_widened = False
     
     def connect(self) -> bool:
         """
@@ -53,10 +67,12 @@ class CANInterface:
                 self.bus = can.interface.Bus(
                     channel=self.channel,
                     bustype=self.bustype,
-                    bitrate=self.bitrate
+                    bitrate=self.bitrate,
+                    can_filters=self._build_filters()
                 )
                 
                 logger.info(f"Connected to {self.channel} @ {self.bitrate} bps")
+                self._log_filter_state()
                 return True
                 
             except can.CanError as e:
@@ -72,6 +88,56 @@ class CANInterface:
         logger.critical(f"Failed to connect to {self.channel} after {self.max_retries} retries")
         return False
     
+    def _build_filters(self) -> Optional[List[Dict[str, Any]]]:
+        """Erzeugt die python-can Filterliste (None = alles empfangen)."""
+        if self.filter_ids is None or self.filters_widened:
+            return None
+        return [
+            {"can_id": can_id, "can_mask": STANDARD_ID_MASK, "extended": False}
+            for can_id in sorted(self.filter_ids)
+        ]
+    
+    def _apply_filters(self):
+        """Installiert die aktuellen Filter auf dem verbundenen Bus."""
+        if not self.bus:
+            return
+        
+        try:
+            self.bus.set_filters(self._build_filters())
+            self._log_filter_state()
+        except Exception as e:
+            logger.error(f"Could not set CAN filters: {e}")
+    
+    def _log_filter_state(self):
+        if self.filter_ids is None:
+            logger.info(f"{self.channel}: no CAN filter, receiving full bus")
+        elif self.filters_widened:
+            logger.info(f"{self.channel}: CAN filter widened, receiving full bus")
+        else:
+            logger.info(f"{self.channel}: CAN filter active for {len(self.filter_ids)} IDs")
+    
+    def set_filter_ids(self, filter_ids: Optional[Iterable[int]]):
+        """
+        Setzt die IDs für den Kernel-Filter.
+        None oder leere Menge deaktiviert die Filterung.
+        """
+        self.filter_ids = frozenset(filter_ids) if filter_ids else None
+        self._apply_filters()
+    
+    def widen_filters(self):
+        """Empfängt vorübergehend den kompletten Bus (z.B. für Trace-Aufnahmen)."""
+        if self.filters_widened:
+            return
+        self.filters_widened = True
+        self._apply_filters()
+    
+    def restore_filters(self):
+        """Stellt die Filter nach widen_filters() wieder her."""
+        if not self.filters_widened:
+            return
+        self.filters_widened = False
+        self._apply_filters()
+    
     def _check_interface_exists(self) -> bool:
         """Prüft ob CAN-Interface im System vorhanden ist."""
         net_path = f"/sys/class/net/{self.channel}"
@@ -139,6 +205,127 @@ class CANInterface:
         return self.connect()
 
 
+class CANReader:
+    """
+    Hintergrund-Thread, der den CAN-Bus kontinuierlich ausliest.
+    
+    Der Thread ist der einzige Leser des can.BusABC und schreibt jeden
+    Frame in einen begrenzten Ringpuffer. Der UI-Tick holt alle seitdem
+    empfangenen Frames gesammelt mit drain() ab. Läuft der Puffer über,
+    werden die ältesten Frames verworfen und mitgezählt.
+    """
+    
+    def __init__(
+        self,
+        can_interface: CANInterface,
+        buffer_size: int = 4096,
+        recv_timeout: float = 0.1,
+        error_backoff: float = 1.0
+    ):
+        self.can_interface = can_interface
+        self.buffer_size = buffer_size
+        self.recv_timeout = recv_timeout
+        self.error_backoff = error_backoff
+        
+        self.buffer: deque = deque(maxlen=buffer_size)
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.reader_thread: Optional[threading.Thread] = None
+        
+        # Statistiken
+        self.frames_received = 0
+        self.frames_dropped = 0
+        self.max_backlog = 0
+        self.receive_errors = 0
+    
+    def start(self):
+        """Startet den Lese-Thread."""
+        if self.reader_thread and self.reader_thread.is_alive():
+            return
+        
+        self.stop_event.clear()
+        self.reader_thread = threading.Thread(
+            target=self._reader_loop, name="can-reader", daemon=True
+        )
+        self.reader_thread.start()
+        logger.info(f"CAN reader started (buffer: {self.buffer_size} frames)")
+    
+    def stop(self, timeout: float = 2.0):
+        """Stoppt den Lese-Thread (wartet max. timeout Sekunden)."""
+        self.stop_event.set()
+        if self.reader_thread:
+            self.reader_thread.join(timeout=timeout)
+            self.reader_thread = None
+        logger.info("CAN reader stopped")
+    
+    def is_running(self) -> bool:
+        """True solange der Lese-Thread läuft."""
+        return self.reader_thread is not None and self.reader_thread.is_alive()
+    
+    def drain(self, max_frames: Optional[int] = None) -> List[can.Message]:
+        """
+        Holt alle gepufferten Frames in Empfangsreihenfolge ab.
+        
+        Args:
+            max_frames: Optional Obergrenze pro Aufruf; der Rest bleibt
+                        für den nächsten Tick im Puffer.
+        """
+        with self.lock:
+            if max_frames is None or max_frames >= len(self.buffer):
+                frames = list(self.buffer)
+                self.buffer.clear()
+            else:
+                popleft = self.buffer.popleft
+                frames = [popleft() for _ in range(max_frames)]
+        return frames
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Gibt Empfangs-Statistiken zurück."""
+        with self.lock:
+            backlog = len(self.buffer)
+        return {
+            "frames_received": self.frames_received,
+            "frames_dropped": self.frames_dropped,
+            "backlog": backlog,
+            "max_backlog": self.max_backlog,
+            "receive_errors": self.receive_errors,
+        }
+    
+    def _reader_loop(self):
+        """Liest Frames bis stop() aufgerufen wird."""
+        while not self.stop_event.is_set():
+            bus = self.can_interface.bus
+            if bus is None:
+                # Nicht verbunden (z.B. während Reconnect)
+                self.stop_event.wait(self.error_backoff)
+                continue
+            
+            try:
+                msg = bus.recv(timeout=self.recv_timeout)
+            except can.CanError as e:
+                self.receive_errors += 1
+                logger.error(f"Receive error: {e}")
+                self.stop_event.wait(self.error_backoff)
+                continue
+            except Exception as e:
+                self.receive_errors += 1
+                logger.error(f"Unexpected receive error: {e}")
+                self.stop_event.wait(self.error_backoff)
+                continue
+            
+            if msg is None:
+                continue
+            
+            with self.lock:
+                if len(self.buffer) == self.buffer_size:
+                    # deque(maxlen) verwirft beim append den ältesten Frame
+                    self.frames_dropped += 1
+                self.buffer.append(msg)
+                self.frames_received += 1
+                if len(self.buffer) > self.max_backlog:
+                    self.max_backlog = len(self.buffer)
+
+
 def setup_can_interface(channel: str = "vcan0", bitrate: int = 500000) -> bool:
     """
     Hilfsfunktion zur manuellen Interface-Konfiguration via ip link.
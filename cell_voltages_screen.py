@@ -1,123 +1,168 @@
 # cell_voltages_screen.py
 # Detaillierte Zellspannungs-Ansicht mit Bargraphen
 
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-                              QLabel, QProgressBar)
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont, QColor
-from widgets import StatusBar
-from translations import get_translator
+from array import array
 
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
+from PyQt5.QtCore import Qt, QRect, QRectF
+from PyQt5.QtGui import QFont, QColor, QPainter, QPen, QBrush, QRegion
+from widgets import StatusBar, set_label_text, set_label_style
+from translations import get_translator, TranslatedTexts
 
-class CellVoltageBar(QWidget):
-    """Ein einzelner vertikaler Bargraph für eine Zellspannung."""
+
+# Farben je Spannungsbereich: (Wert/Balken, Rahmen, Rahmenbreite)
+CELL_STYLE_EMPTY = (QColor("#666666"), QColor("#444444"), 2)
+CELL_STYLE_HIGH = (QColor("#ff0000"), QColor("#ff0000"), 3)    # Rot (KRITISCH zu hoch!)
+CELL_STYLE_LOW = (QColor("#ff8800"), QColor("#ff8800"), 3)     # Orange (zu niedrig)
+CELL_STYLE_OK = (QColor("#00ff00"), QColor("#444444"), 2)      # Green (optimal)
+CELL_STYLE_BORDER = (QColor("#ffff00"), QColor("#888888"), 2)  # Gelb (grenzwertig)
+
+
+def cell_style(voltage_v: float):
+    """Farben für eine Zellspannung (<= 0 = keine Daten)."""
+    if voltage_v <= 0:
+        return CELL_STYLE_EMPTY
+    if voltage_v > 4.2:
+        return CELL_STYLE_HIGH
+    if voltage_v < 3.0:
+        return CELL_STYLE_LOW
+    if 3.5 <= voltage_v <= 4.1:
+        return CELL_STYLE_OK
+    return CELL_STYLE_BORDER
+
+
+class CellMatrix(QWidget):
+    """
+    Alle Zellspannungen als vertikale Bargraphen in einem Widget.
     
-    def __init__(self, cell_num, parent=None):
+    - Werte liegen in einem array('f') (0.0 = keine Daten)
+    - set_voltages() sammelt die Rechtecke der geänderten Zellen in einer
+      QRegion und fordert nur für diese ein Repaint an
+    - paintEvent zeichnet nur die Zellen im angeforderten Bereich
+    - stats() liefert Min/Max/Ø mit Zellnummer in einem Durchlauf
+    """
+    
+    BAR_MAX_V = 10.0  # Skala: 0-10V (wie zuvor der QProgressBar)
+    
+    def __init__(self, cell_count: int = 88, columns: int = 22, parent=None):
         super().__init__(parent)
-        self.cell_num = cell_num
-        self._init_ui()
+        self.cell_count = cell_count
+        self.columns = columns
+        self.rows = (cell_count + columns - 1) // columns
+        self.voltages = array("f", bytes(4 * cell_count))
+        self.valid_count = 0
         
-    def _init_ui(self):
-        layout = QVBoxLayout()
-        layout.setContentsMargins(2, 2, 2, 2)
-        layout.setSpacing(2)
+        self.font_value = QFont("Arial", 8)
+        self.font_num = QFont("Arial", 7)
+        self.setMinimumSize(columns * 27, self.rows * 100)
+    
+    def cell_rect(self, index: int) -> QRect:
+        """Rechteck einer Zelle (0-basiert) im Widget."""
+        col = index % self.columns
+        row = index // self.columns
+        x0 = col * self.width() // self.columns
+        x1 = (col + 1) * self.width() // self.columns
+        y0 = row * self.height() // self.rows
+        y1 = (row + 1) * self.height() // self.rows
+        return QRect(x0, y0, x1 - x0, y1 - y0)
+    
+    def set_voltages(self, voltages):
+        """
+        Übernimmt Zellspannungen (Liste/Array, None oder <= 0 = keine Daten).
+        Gibt die Anzahl geänderter Zellen zurück.
+        """
+        old = self.voltages
+        new = array("f", bytes(4 * self.cell_count))
+        count = min(len(voltages), self.cell_count)
+        for i in range(count):
+            v = voltages[i]
+            if v is not None and v > 0:
+                new[i] = v
         
-        # Wert-Label (oben)
-        self.value_label = QLabel("---")
-        self.value_label.setFont(QFont("Arial", 8))
-        self.value_label.setAlignment(Qt.AlignCenter)
-        self.value_label.setStyleSheet("color: #00ff00;")
-        layout.addWidget(self.value_label)
+        if new == old:
+            return 0
         
-        # Vertikaler Progressbar (kleiner)
-        self.bar = QProgressBar()
-        self.bar.setOrientation(Qt.Vertical)
-        self.bar.setMinimum(0)
-        self.bar.setMaximum(1000)  # 0.0 - 10.0V als 0-1000
-        self.bar.setValue(0)
-        self.bar.setTextVisible(False)
-        self.bar.setFixedSize(25, 90)  # Kleiner: 25x90 statt 35x120
-        # Initial style (will be dynamically overridden)
-        self.bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #444444;
-                border-radius: 3px;
-                background-color: #111111;
-            }
-            QProgressBar::chunk {
-                background-color: #333333;
-            }
-        """)
-        layout.addWidget(self.bar, alignment=Qt.AlignCenter)
+        region = QRegion()
+        changed = 0
+        for i in range(self.cell_count):
+            if new[i] != old[i]:
+                region += self.cell_rect(i)
+                changed += 1
         
-        # Zell-Nummer (unten)
-        self.num_label = QLabel(f"Z{self.cell_num}")
-        self.num_label.setFont(QFont("Arial", 7))
-        self.num_label.setAlignment(Qt.AlignCenter)
-        self.num_label.setStyleSheet("color: #888888;")
-        layout.addWidget(self.num_label)
+        self.voltages = new
+        self.valid_count = self.cell_count - new.count(0.0)
+        self.update(region)
+        return changed
+    
+    def clear(self):
+        """Alle Zellen auf 'keine Daten'."""
+        self.set_voltages(())
+    
+    def stats(self):
+        """
+        (min_v, min_nr, max_v, max_nr, avg_v) über alle gültigen Zellen,
+        None ohne Daten. Zellnummern beginnen bei 1.
+        """
+        if self.valid_count == 0:
+            return None
         
-        self.setLayout(layout)
+        # Ein Durchlauf; bei 88 Zellen schneller als NumPy (Overhead pro Aufruf)
+        min_v, min_i = float("inf"), 0
+        max_v, max_i = 0.0, 0
+        total = 0.0
+        for i, v in enumerate(self.voltages):
+            if v <= 0:
+                continue
+            total += v
+            if v < min_v:
+                min_v, min_i = v, i
+            if v > max_v:
+                max_v, max_i = v, i
+        return (min_v, min_i + 1, max_v, max_i + 1, total / self.valid_count)
     
-    def set_voltage(self, voltage_v):
-        """Setzt Spannung in Volt (z.B. 3.65)."""
-        if voltage_v is None or voltage_v <= 0:
-            self.value_label.setText("---")
-            self.bar.setValue(0)
-            self.value_label.setStyleSheet("color: #666666;")
-            self.bar.setStyleSheet("""
-                QProgressBar {
-                    border: 2px solid #444444;
-                    border-radius: 3px;
-                    background-color: #111111;
-                }
-                QProgressBar::chunk {
-                    background-color: #333333;
-                }
-            """)
-        else:
-            self.value_label.setText(f"{voltage_v:.3f}")
-            # Skala: 0-10V → 0-1000
-            bar_value = int(voltage_v * 100)
-            self.bar.setValue(bar_value)
-            
-            # Farbe je nach Spannung
-            # CRITICAL: Too high (> 4.2V) = RED (dangerous!)
-            # WARNUNG: Zu niedrig (< 3.0V) = ORANGE
-            # OK: Normal (3.5-4.1V) = GREEN
-            # GRENZWERTIG: Dazwischen = GELB
-            
-            if voltage_v > 4.2:
-                color = "#ff0000"  # Rot (KRITISCH zu hoch!)
-                border_color = "#ff0000"  # Rote Umrandung!
-                border_width = "3px"
-            elif voltage_v < 3.0:
-                color = "#ff8800"  # Orange (zu niedrig)
-                border_color = "#ff8800"  # Orange Umrandung
-                border_width = "3px"
-            elif 3.5 <= voltage_v <= 4.1:
-                color = "#00ff00"  # Green (optimal)
-                border_color = "#444444"  # Normale Umrandung
-                border_width = "2px"
-            else:
-                color = "#ffff00"  # Gelb (grenzwertig)
-                border_color = "#888888"  # Hellere Umrandung
-                border_width = "2px"
-            
-            # Setze Label-Farbe
-            self.value_label.setStyleSheet(f"color: {color};")
-            
-            # Setze Bar-Style mit einheitlicher Farbe (KEIN Verlauf!)
-            self.bar.setStyleSheet(f"""
-                QProgressBar {{
-                    border: {border_width} solid {border_color};
-                    border-radius: 3px;
-                    background-color: #111111;
-                }}
-                QProgressBar::chunk {{
-                    background-color: {color};
-                }}
-            """)
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        region = event.region()
+        
+        voltages = self.voltages
+        for i in range(self.cell_count):
+            rect = self.cell_rect(i)
+            if not region.intersects(rect):
+                continue
+            self._draw_cell(painter, rect, i + 1, voltages[i])
+    
+    def _draw_cell(self, painter: QPainter, rect: QRect, cell_num: int, voltage_v: float):
+        """Zeichnet eine Zelle: Wert oben, Balken, Zellnummer unten."""
+        color, border_color, border_width = cell_style(voltage_v)
+        
+        text_h = 14
+        x, y, w, h = rect.x(), rect.y(), rect.width(), rect.height()
+        
+        # Wert-Label (oben)
+        painter.setFont(self.font_value)
+        painter.setPen(color)
+        text = f"{voltage_v:.3f}" if voltage_v > 0 else "---"
+        painter.drawText(QRect(x, y + 2, w, text_h), Qt.AlignCenter, text)
+        
+        # Balken (max. 25x90 wie bisher)
+        bar_w = min(25, w - 4)
+        bar_h = min(90, h - 2 * text_h - 8)
+        bar = QRectF(x + (w - bar_w) / 2, y + text_h + 4, bar_w, bar_h)
+        painter.setPen(QPen(border_color, border_width))
+        painter.setBrush(QBrush(QColor(0x11, 0x11, 0x11)))
+        painter.drawRoundedRect(bar, 3, 3)
+        
+        if voltage_v > 0:
+            inner = bar.adjusted(border_width, border_width, -border_width, -border_width)
+            fill_h = inner.height() * min(1.0, voltage_v / self.BAR_MAX_V)
+            painter.fillRect(
+                QRectF(inner.left(), inner.bottom() - fill_h, inner.width(), fill_h), color
+            )
+        
+        # Zell-Nummer (unten)
+        painter.setFont(self.font_num)
+        painter.setPen(QColor("#888888"))
+        painter.drawText(QRect(x, int(bar.bottom()) + 2, w, text_h), Qt.AlignCenter, f"Z{cell_num}")
 
 
 class CellVoltagesScreen(QWidget):
@@ -130,13 +175,11 @@ class CellVoltagesScreen(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.translator = get_translator()
-        self.cell_bars = {}
+        self.texts = TranslatedTexts(self.translator)
         self._init_ui()
     
     def _init_ui(self):
         """Erstellt UI-Layout."""
-        t = self.translator.get
-        
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(10, 10, 10, 10)
         main_layout.setSpacing(5)
@@ -146,7 +189,7 @@ class CellVoltagesScreen(QWidget):
         main_layout.addWidget(self.status_bar)
         
         # ====== Titel ======
-        title = QLabel(t("cell_voltages"))
+        title = self.texts.add(QLabel(), "cell_voltages")
         title.setFont(QFont("Arial", 18, QFont.Bold))
         title.setStyleSheet("color: #00ffcc;")
         title.setAlignment(Qt.AlignCenter)
@@ -155,64 +198,39 @@ class CellVoltagesScreen(QWidget):
         # Info-Zeile
         info_layout = QHBoxLayout()
         
-        self.min_cell_label = QLabel(t("cell_min_default"))
+        self.min_cell_label = self.texts.add(QLabel(), "cell_min_default")
         self.min_cell_label.setFont(QFont("Arial", 11))
         self.min_cell_label.setStyleSheet("color: #ff6666;")
         info_layout.addWidget(self.min_cell_label)
         
         info_layout.addStretch()
         
-        self.avg_cell_label = QLabel(t("cell_avg_default"))
+        self.avg_cell_label = self.texts.add(QLabel(), "cell_avg_default")
         self.avg_cell_label.setFont(QFont("Arial", 11))
         self.avg_cell_label.setStyleSheet("color: #00ff00;")
         info_layout.addWidget(self.avg_cell_label)
         
         info_layout.addStretch()
         
-        self.max_cell_label = QLabel(t("cell_max_default"))
+        self.max_cell_label = self.texts.add(QLabel(), "cell_max_default")
         self.max_cell_label.setFont(QFont("Arial", 11))
         self.max_cell_label.setStyleSheet("color: #66ff66;")
         info_layout.addWidget(self.max_cell_label)
         
         info_layout.addStretch()
         
-        self.delta_label = QLabel(t("cell_delta_default"))
+        self.delta_label = self.texts.add(QLabel(), "cell_delta_default")
         self.delta_label.setFont(QFont("Arial", 11))
         self.delta_label.setStyleSheet("color: #ffff00;")
         info_layout.addWidget(self.delta_label)
         
         main_layout.addLayout(info_layout)
         
-        # ====== Container for cells (NO Scroll-Area) ======
-        # 88 Zellen auf 4 Reihen = 22 Zellen pro Reihe
-        
-        # Container for all 4 rows
-        rows_layout = QVBoxLayout()
-        rows_layout.setSpacing(3)
-        
-        self.row_layouts = []
-        
-        for row_num in range(4):
-            row_layout = QHBoxLayout()
-            row_layout.setSpacing(2)
-            row_layout.setContentsMargins(0, 0, 0, 0)
-            self.row_layouts.append(row_layout)
-            
-            row_container = QWidget()
-            row_container.setLayout(row_layout)
-            rows_layout.addWidget(row_container)
-        
+        # ====== Zellen (ein Widget, NO Scroll-Area) ======
         # EnerDel hat 88 Zellen (11 Module × 8 Zellen)
         # Verteile auf 4 Reihen: 22 + 22 + 22 + 22
-        for i in range(1, 89):  # Zellen 1-88
-            bar = CellVoltageBar(i)
-            self.cell_bars[i] = bar
-            
-            # Reihen-Index bestimmen (0-3)
-            row_idx = (i - 1) // 22
-            self.row_layouts[row_idx].addWidget(bar)
-        
-        main_layout.addLayout(rows_layout)
+        self.cell_matrix = CellMatrix(88, columns=22)
+        main_layout.addWidget(self.cell_matrix)
         
         # Hinweis-Text
         hint = QLabel("💡 Grün = optimal (3.5-4.1V) | Gelb = grenzwertig | 🔴 Rot = KRITISCH zu hoch! | 🟠 Orange = zu niedrig")
@@ -223,64 +241,60 @@ class CellVoltagesScreen(QWidget):
         
         self.setLayout(main_layout)
     
-    def update(self, state):
-        """Aktualisiert Anzeige mit neuem State."""
-        # Status bar (complete state for error checking)
-        self.status_bar.set_state(state)
-        ambient_temp = state.get("pcu_ambient_temp_C")
-        if ambient_temp is not None:
-            self.status_bar.set_ambient_temp(ambient_temp)
-        
+    def bind(self, state) -> list:
+        """
+        Bindet die Anzeige an den VehicleState (Publish/Subscribe).
+        Gibt die Abos zurück, damit der Dashboard sie pausieren kann.
+        """
+        subscriptions = self.status_bar.bind(state)
+        subscriptions.append(state.subscribe("cell_voltages", self._on_cell_voltages))
+        return subscriptions
+    
+    def retranslate(self):
+        """
+        Setzt die Texte nach einem Sprachwechsel neu (Widgets und Werte
+        bleiben erhalten; wertabhängige Texte liefert der Dashboard per
+        State-Abo neu aus).
+        """
+        self.texts.retranslate()
+    
+    def update_data(self, state: dict):
+        """Aktualisiert Anzeige mit einem kompletten State (ohne Abos, z.B. Test)."""
+        self._on_cell_voltages(state.get("cell_voltages"))
+    
+    def _on_cell_voltages(self, cell_voltages):
         t = self.translator.get
         
-        cell_voltages = state.get("cell_voltages", [])
+        # Update Bargraphen (nur geänderte Zellen werden neu gezeichnet)
+        self.cell_matrix.set_voltages(cell_voltages or ())
         
-        if not cell_voltages or len(cell_voltages) == 0:
+        # Statistiken
+        stats = self.cell_matrix.stats()
+        if stats is None:
             # Keine Daten
-            for bar in self.cell_bars.values():
-                bar.set_voltage(None)
-            self.min_cell_label.setText(t("cell_min_default"))
-            self.max_cell_label.setText(t("cell_max_default"))
-            self.avg_cell_label.setText(t("cell_avg_default"))
-            self.delta_label.setText(t("cell_delta_default"))
+            set_label_text(self.min_cell_label, t("cell_min_default"))
+            set_label_text(self.max_cell_label, t("cell_max_default"))
+            set_label_text(self.avg_cell_label, t("cell_avg_default"))
+            set_label_text(self.delta_label, t("cell_delta_default"))
             return
         
-        # Update Bargraphen
-        for i, voltage in enumerate(cell_voltages, start=1):
-            if i in self.cell_bars:
-                self.cell_bars[i].set_voltage(voltage)
+        min_v, min_idx, max_v, max_idx, avg_v = stats
+        delta_mv = (max_v - min_v) * 1000
         
-        # Statistiken
-        valid_voltages = [v for v in cell_voltages if v is not None and v > 0]
+        set_label_text(self.min_cell_label, f"{t('min')}: {min_v:.3f} V (Z{min_idx})")
+        set_label_text(self.max_cell_label, f"{t('max')}: {max_v:.3f} V (Z{max_idx})")
+        set_label_text(self.avg_cell_label, f"Ø: {avg_v:.3f} V")
+        set_label_text(self.delta_label, f"Δ: {delta_mv:.1f} mV")
         
-        if valid_voltages:
-            min_v = min(valid_voltages)
-            max_v = max(valid_voltages)
-            avg_v = sum(valid_voltages) / len(valid_voltages)
-            delta_mv = (max_v - min_v) * 1000
-            
-            min_idx = cell_voltages.index(min_v) + 1
-            max_idx = cell_voltages.index(max_v) + 1
-            
-            self.min_cell_label.setText(f"{t('min')}: {min_v:.3f} V (Z{min_idx})")
-            self.max_cell_label.setText(f"{t('max')}: {max_v:.3f} V (Z{max_idx})")
-            self.avg_cell_label.setText(f"Ø: {avg_v:.3f} V")
-            self.delta_label.setText(f"Δ: {delta_mv:.1f} mV")
-            
-            # Delta color (green < 50mV, yellow < 100mV, red >= 100mV)
-            if delta_mv < 50:
-                delta_color = "#00ff00"
-            elif delta_mv < 100:
-                delta_color = "#ffff00"
-            else:
-                delta_color = "#ff4444"
-            
-            self.delta_label.setStyleSheet(f"color: {delta_color};")
+        # Delta color (green < 50mV, yellow < 100mV, red >= 100mV)
+        if delta_mv < 50:
+            delta_color = "#00ff00"
+        elif delta_mv < 100:
+            delta_color = "#ffff00"
         else:
-            self.min_cell_label.setText(t("cell_min_default"))
-            self.max_cell_label.setText(t("cell_max_default"))
-            self.avg_cell_label.setText(t("cell_avg_default"))
-            self.delta_label.setText(t("cell_delta_default"))
+            delta_color = "#ff4444"
+        
+        set_label_style(self.delta_label, f"color: {delta_color};")
 
 
 # Test
@@ -297,7 +311,7 @@ if __name__ == "__main__":
     # Test-Daten
     import random
     test_voltages = [3.6 + random.uniform(-0.1, 0.1) for _ in range(88)]
-    screen.update({"cell_voltages": test_voltages})
+    screen.update_data({"cell_voltages": test_voltages})
     
     screen.show()
     sys.exit(app.exec_())
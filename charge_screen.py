@@ -4,8 +4,8 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont, QColor
-from widgets import DigitalDisplay, BatteryBar, StatusBar
-from translations import get_translator
+from widgets import DigitalDisplay, BatteryBar, StatusBar, set_label_text, set_label_style
+from translations import get_translator, TranslatedTexts
 from datetime import datetime, timedelta
 
 
@@ -23,14 +23,21 @@ class ChargeScreen(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.translator = get_translator()
+        self.texts = TranslatedTexts(self.translator)
         self.charge_start_time = None
         self.charge_start_soc = None
+        self.current_soc = 0.0
+        self.current_power_kw = 0.0
         self._init_ui()
+        
+        # Ladezeit/Restzeit laufen auch ohne neue CAN-Werte weiter (1 Hz, nur beim Laden)
+        self.estimate_timer = QTimer(self)
+        self.estimate_timer.timeout.connect(
+            lambda: self._update_time_estimates(self.current_soc, self.current_power_kw)
+        )
     
     def _init_ui(self):
         """Erstellt UI-Layout."""
-        t = self.translator.get
-        
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(10, 10, 10, 10)
         main_layout.setSpacing(15)
@@ -40,7 +47,7 @@ class ChargeScreen(QWidget):
         main_layout.addWidget(self.status_bar)
         
         # ====== Titel ======
-        title = QLabel(t("charging"))
+        title = self.texts.add(QLabel(), "charging")
         title.setFont(QFont("Arial", 20, QFont.Bold))
         title.setStyleSheet("color: #00ff66;")
         title.setAlignment(Qt.AlignCenter)
@@ -51,7 +58,7 @@ class ChargeScreen(QWidget):
         main_layout.addWidget(self.soc_bar)
         
         # ====== Status-Text ======
-        self.status_label = QLabel(t("not_connected"))
+        self.status_label = self.texts.add(QLabel(), "not_connected")
         self.status_label.setFont(QFont("Arial", 16, QFont.Bold))
         self.status_label.setStyleSheet("color: #888888;")
         self.status_label.setAlignment(Qt.AlignCenter)
@@ -62,19 +69,19 @@ class ChargeScreen(QWidget):
         grid.setSpacing(10)
         
         # AC Spannung
-        self.mains_voltage_display = DigitalDisplay(t("ac_voltage"), "V")
+        self.mains_voltage_display = self.texts.add(DigitalDisplay("", "V"), "ac_voltage", setter="set_label")
         self.mains_voltage_display.set_decimals(0)
         self.mains_voltage_display.set_color(QColor(255, 200, 0))
         grid.addWidget(self.mains_voltage_display)
         
         # AC Strom
-        self.mains_current_display = DigitalDisplay(t("ac_current"), "A")
+        self.mains_current_display = self.texts.add(DigitalDisplay("", "A"), "ac_current", setter="set_label")
         self.mains_current_display.set_decimals(1)
         self.mains_current_display.set_color(QColor(0, 200, 255))
         grid.addWidget(self.mains_current_display)
         
         # DC Leistung (aus Batterie-Sicht: + beim Laden, - beim Entladen)
-        self.charge_power_display = DigitalDisplay(t("power"), "kW")
+        self.charge_power_display = self.texts.add(DigitalDisplay("", "kW"), "power", setter="set_label")
         self.charge_power_display.set_decimals(2)
         self.charge_power_display.set_color(QColor(0, 255, 100))
         grid.addWidget(self.charge_power_display)
@@ -85,21 +92,21 @@ class ChargeScreen(QWidget):
         time_layout = QVBoxLayout()
         
         # Verstrichene Zeit
-        self.elapsed_label = QLabel(t("charge_time_default"))
+        self.elapsed_label = self.texts.add(QLabel(), "charge_time_default")
         self.elapsed_label.setFont(QFont("Arial", 14))
         self.elapsed_label.setStyleSheet("color: #aaaaaa;")
         self.elapsed_label.setAlignment(Qt.AlignCenter)
         time_layout.addWidget(self.elapsed_label)
         
         # Verbleibende Zeit
-        self.remaining_label = QLabel(t("remaining_default"))
+        self.remaining_label = self.texts.add(QLabel(), "remaining_default")
         self.remaining_label.setFont(QFont("Arial", 16, QFont.Bold))
         self.remaining_label.setStyleSheet("color: #00ffcc;")
         self.remaining_label.setAlignment(Qt.AlignCenter)
         time_layout.addWidget(self.remaining_label)
         
         # Fertig um...
-        self.complete_label = QLabel(t("complete_default"))
+        self.complete_label = self.texts.add(QLabel(), "complete_default")
         self.complete_label.setFont(QFont("Arial", 12))
         self.complete_label.setStyleSheet("color: #888888;")
         self.complete_label.setAlignment(Qt.AlignCenter)
@@ -111,13 +118,13 @@ class ChargeScreen(QWidget):
         info_layout = QHBoxLayout()
         
         # Max available AC current
-        self.max_ac_label = QLabel(t("max_ac_default"))
+        self.max_ac_label = self.texts.add(QLabel(), "max_ac_default")
         self.max_ac_label.setFont(QFont("Arial", 12))
         self.max_ac_label.setStyleSheet("color: #888888;")
         info_layout.addWidget(self.max_ac_label)
         
         # Geladene Energie
-        self.energy_label = QLabel(t("charged_default"))
+        self.energy_label = self.texts.add(QLabel(), "charged_default")
         self.energy_label.setFont(QFont("Arial", 12))
         self.energy_label.setStyleSheet("color: #888888;")
         info_layout.addWidget(self.energy_label)
@@ -126,9 +133,42 @@ class ChargeScreen(QWidget):
         
         self.setLayout(main_layout)
     
+    # State-Keys für die Ladeerkennung und Zeit-Schätzung
+    CHARGE_KEYS = ("vehicle_charge_enabled", "mains_voltage_V", "soc_pct", "power_kW")
+    
+    def _bindings(self):
+        """Widget-Bindungen: (State-Keys, Callback mit den Werten in Key-Reihenfolge)."""
+        return [
+            ("soc_pct", lambda soc: self.soc_bar.set_soc(soc or 0.0)),
+            # Mains (AC)
+            ("mains_voltage_V", lambda mains_v: self.mains_voltage_display.set_value(mains_v or 0.0)),
+            ("mains_current_A", lambda mains_a: self.mains_current_display.set_value(mains_a or 0.0)),
+            ("power_kW", self._on_power),
+            ("max_available_AC_A", self._on_max_ac),
+            (self.CHARGE_KEYS, self._on_charge_status),
+        ]
+    
+    def bind(self, state) -> list:
+        """
+        Bindet die Widgets an den VehicleState (Publish/Subscribe).
+        Gibt die Abos zurück, damit der Dashboard sie pausieren kann.
+        """
+        subscriptions = self.status_bar.bind(state)
+        for keys, callback in self._bindings():
+            subscriptions.append(state.subscribe(keys, callback))
+        return subscriptions
+    
+    def retranslate(self):
+        """
+        Setzt die Texte nach einem Sprachwechsel neu (Widgets und Werte
+        bleiben erhalten; wertabhängige Texte liefert der Dashboard per
+        State-Abo neu aus).
+        """
+        self.texts.retranslate()
+    
     def update_data(self, state: dict):
         """
-        Aktualisiert Anzeige mit neuen Daten.
+        Aktualisiert Anzeige mit einem kompletten State (ohne Abos, z.B. Test).
         
         Args:
             state: Dict mit Lade-Daten
@@ -139,53 +179,54 @@ class ChargeScreen(QWidget):
         if ambient_temp is not None:
             self.status_bar.set_ambient_temp(ambient_temp)
         
-        # SOC
-        soc = state.get("soc_pct", 0.0)
-        self.soc_bar.set_soc(soc)
-        
-        # Mains (AC)
-        mains_v = state.get("mains_voltage_V", 0.0)
-        mains_a = state.get("mains_current_A", 0.0)
-        self.mains_voltage_display.set_value(mains_v)
-        self.mains_current_display.set_value(mains_a)
-        
+        for keys, callback in self._bindings():
+            keys = (keys,) if isinstance(keys, str) else keys
+            callback(*[state.get(key) for key in keys])
+    
+    def _on_power(self, power_kw):
         # DC Power (aus Batterie-Sicht: + beim Laden, - beim Entladen)
         # power_kW ist normalerweise positiv beim Entladen, negativ beim Laden
         # We reverse the sign for battery perspective
-        power_kw = -state.get("power_kW", 0.0)  # Negativ = Batterie-Sicht
-        self.charge_power_display.set_value(power_kw)
-        
-        # Max AC Current
+        self.charge_power_display.set_value(-(power_kw or 0.0))
+    
+    def _on_max_ac(self, max_ac):
+        t = self.translator.get
+        set_label_text(self.max_ac_label, f"{t('max_ac')}: {max_ac or 0.0:.1f} A")
+    
+    def _on_charge_status(self, charge_enabled, mains_v, soc, power_kw):
+        """Status-Erkennung und Zeit-Schätzungen."""
         t = self.translator.get
-        max_ac = state.get("max_available_AC_A", 0.0)
-        self.max_ac_label.setText(f"{t('max_ac')}: {max_ac:.1f} A")
+        soc = soc or 0.0
+        self.current_soc = soc
+        self.current_power_kw = abs(power_kw or 0.0)  # Batterie-Sicht, positiv beim Laden
         
-        # Status-Erkennung
-        is_charging = state.get("vehicle_charge_enabled", False) and mains_v > 100
+        is_charging = bool(charge_enabled) and (mains_v or 0.0) > 100
         
         if is_charging:
-            self.status_label.setText(t("charging_active"))
-            self.status_label.setStyleSheet("color: #00ff66;")
+            set_label_text(self.status_label, t("charging_active"))
+            set_label_style(self.status_label, "color: #00ff66;")
             
             # Lade-Start tracken
             if self.charge_start_time is None:
                 self.charge_start_time = datetime.now()
                 self.charge_start_soc = soc
+                self.estimate_timer.start(1000)
             
             # Zeit-Berechnungen (power_kw ist positiv beim Laden)
-            self._update_time_estimates(soc, abs(power_kw))
+            self._update_time_estimates(soc, self.current_power_kw)
         
         else:
-            self.status_label.setText(t("not_connected"))
-            self.status_label.setStyleSheet("color: #888888;")
+            set_label_text(self.status_label, t("not_connected"))
+            set_label_style(self.status_label, "color: #888888;")
             
             # Reset
+            self.estimate_timer.stop()
             self.charge_start_time = None
             self.charge_start_soc = None
-            self.elapsed_label.setText(t("charge_time_default"))
-            self.remaining_label.setText(t("remaining_default"))
-            self.complete_label.setText(t("complete_default"))
-            self.energy_label.setText(t("charged_default"))
+            set_label_text(self.elapsed_label, t("charge_time_default"))
+            set_label_text(self.remaining_label, t("remaining_default"))
+            set_label_text(self.complete_label, t("complete_default"))
+            set_label_text(self.energy_label, t("charged_default"))
     
     def _update_time_estimates(self, current_soc: float, power_kw: float):
         """Calculatet Zeit-Schätzungen während des Ladens."""
@@ -197,7 +238,7 @@ class ChargeScreen(QWidget):
         # Verstrichene Zeit
         elapsed = datetime.now() - self.charge_start_time
         elapsed_str = str(elapsed).split('.')[0]  # HH:MM:SS
-        self.elapsed_label.setText(f"{t('charge_time')}: {elapsed_str}")
+        set_label_text(self.elapsed_label, f"{t('charge_time')}: {elapsed_str}")
         
         # Geladene SOC-Prozent
         charged_soc = current_soc - self.charge_start_soc
@@ -217,21 +258,21 @@ class ChargeScreen(QWidget):
                 # Format HH:MM
                 hours = remaining_td.seconds // 3600
                 minutes = (remaining_td.seconds % 3600) // 60
-                self.remaining_label.setText(f"{t('remaining')}: {hours:02d}:{minutes:02d}")
+                set_label_text(self.remaining_label, f"{t('remaining')}: {hours:02d}:{minutes:02d}")
                 
                 # Fertig-Zeitpunkt
                 complete_time = datetime.now() + remaining_td
-                self.complete_label.setText(f"{t('complete')}: {complete_time.strftime('%H:%M')}")
+                set_label_text(self.complete_label, f"{t('complete')}: {complete_time.strftime('%H:%M')}")
             else:
-                self.remaining_label.setText(f"{t('remaining')}: {t('calculating')}")
+                set_label_text(self.remaining_label, f"{t('remaining')}: {t('calculating')}")
         
         else:
-            self.remaining_label.setText(f"{t('remaining')}: {t('collecting_data')}")
+            set_label_text(self.remaining_label, f"{t('remaining')}: {t('collecting_data')}")
         
         # Charged energy (estimate: 24 kWh * SOC difference)
         battery_capacity_kwh = 24.0
         energy_charged_kwh = (charged_soc / 100.0) * battery_capacity_kwh
-        self.energy_label.setText(f"{t('charged')}: {energy_charged_kwh:.2f} kWh")
+        set_label_text(self.energy_label, f"{t('charged')}: {energy_charged_kwh:.2f} kWh")
 
 
 # Test
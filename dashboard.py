@@ -3,28 +3,33 @@
 
 import sys
 import os
+import time
 import logging
+import importlib
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Optional, TYPE_CHECKING
+
+from startup_timer import get_startup_timer
+startup_timer = get_startup_timer()
 
 from PyQt5.QtWidgets import QApplication, QWidget, QStackedWidget, QVBoxLayout, QHBoxLayout
-from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtCore import QTimer, Qt, QEvent
 from PyQt5.QtGui import QFont
 
-from can_interface import CANInterface
+# can_interface/trace_recorder (python-can) und die Screens außer dem
+# Main-Screen werden erst bei Bedarf importiert (schnellerer Start)
 from can_decoder import CANDecoder
-from db_manager import DBManager
+import signal_db
+from vehicle_state import VehicleState
+from db_manager import DBManager, SampleWriter, STATE_FIELDS, DEFAULT_RETENTION_DAYS
 from trip_computer import TripComputer
 from soh_tracker import SOHTracker
-from trace_recorder import TraceRecorder
-from main_screen import MainScreen
-from battery_screen import BatteryScreen
-from charge_screen import ChargeScreen
-from cell_voltages_screen import CellVoltagesScreen
-from raw_data_screen import RawDataScreen
-from settings_screen import SettingsScreen
+from network_monitor import get_network_monitor
 from widgets import TouchButton
-from translations import get_translator
+from translations import get_translator, TranslatedTexts
+
+if TYPE_CHECKING:
+    from can_interface import CANInterface, CANReader
 
 # Logging Setup
 logging.basicConfig(
@@ -33,6 +38,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+startup_timer.mark("imports")
+
+
+# Screens im QStackedWidget: Index -> (Attribut, Modul, Klasse, an State binden)
+# Außer dem Main-Screen werden sie erst beim ersten Aufruf erzeugt.
+SCREENS = (
+    ("main_screen", "main_screen", "MainScreen", True),                          # Index 0
+    ("battery_screen", "battery_screen", "BatteryScreen", True),                 # Index 1
+    ("charge_screen", "charge_screen", "ChargeScreen", True),                    # Index 2
+    ("cell_voltages_screen", "cell_voltages_screen", "CellVoltagesScreen", True),  # Index 3
+    ("raw_data_screen", "raw_data_screen", "RawDataScreen", True),               # Index 4
+    ("settings_screen", "settings_screen", "SettingsScreen", False),             # Index 5
+)
+
 
 class ThinkCityDashboard(QWidget):
     """
@@ -50,31 +69,46 @@ class ThinkCityDashboard(QWidget):
         
         # Translation
         self.translator = get_translator()
+        self.texts = TranslatedTexts(self.translator)
         
         # Config laden
         self.config = self._load_config()
         
+        # Sprache aus der Config (bisher als Nebeneffekt im SettingsScreen)
+        if "language" in self.config:
+            self.translator.set_language(self.config["language"])
+        
         # State
-        self.state: Dict[str, Any] = {}
+        self.state = VehicleState()
         self.last_update_time: Optional[datetime] = None
         
         # Module
-        self.can_interface: Optional[CANInterface] = None
-        self.can_decoder = CANDecoder()
-        self.db_manager = DBManager()
+        self.can_interface: Optional["CANInterface"] = None
+        self.can_reader: Optional["CANReader"] = None
+        self.can_decoder = CANDecoder(simulation_mode=self.config.get("simulation_mode", False))
+        self.db_manager = DBManager(retention_days=self.config.get("retention_days"))
+        self.sample_writer = SampleWriter(self.db_manager)
+        self.sample_writer.start()
         self.trip_computer = TripComputer(db_manager=self.db_manager)
         self.soh_tracker = SOHTracker(db_manager=self.db_manager)
-        self.trace_recorder = TraceRecorder(
-            can_interface=self.config.get("can_interface", "can0"),
-            output_dir=os.path.expanduser("~/thinkcity-dashboard-v3/traces")
-        )
+        self._trace_recorder = None  # Erst bei Bedarf (siehe trace_recorder)
         
-        # Odometer (wird aus Geschwindigkeit integriert)
-        self.odo_km = 0.0
+        # Odometer (wird aus Geschwindigkeit integriert, Startwert aus der DB)
+        self.odo_km = self.db_manager.get_latest_odo()
         self.last_speed_update = datetime.now()
+        startup_timer.mark("modules")
         
         # UI
         self._init_ui()
+        startup_timer.mark("ui")
+        
+        # Sprachwechsel: Texte in-place neu setzen
+        self.translator.add_listener(self._on_language_changed)
+        
+        # WLAN-Status im Hintergrund überwachen (Signal nur bei Änderungen)
+        self.network_monitor = get_network_monitor()
+        self.network_monitor.status_changed.connect(self._on_network_status_changed)
+        self.network_monitor.start()
         
         # CAN-Bus connect (async)
         QTimer.singleShot(500, self._connect_can)
@@ -89,6 +123,37 @@ class ThinkCityDashboard(QWidget):
         self.log_timer.timeout.connect(self._log_sample)
         log_interval_ms = self.config.get("logging_interval_sec", 1) * 1000
         self.log_timer.start(log_interval_ms)
+        
+        # Startzeit-Bericht nach dem ersten Paint des Main-Screens
+        self.main_screen.installEventFilter(self)
+    
+    @property
+    def trace_recorder(self):
+        """TraceRecorder, wird beim ersten Zugriff erzeugt (importiert python-can)."""
+        if self._trace_recorder is None:
+            from trace_recorder import TraceRecorder
+            self._trace_recorder = TraceRecorder(
+                can_interface=self.config.get("can_interface", "can0"),
+                output_dir=os.path.expanduser("~/thinkcity-dashboard-v3/traces")
+            )
+            # Aufnahme braucht den kompletten Bus → Kernel-Filter öffnen
+            self._trace_recorder.on_recording_changed = self._on_recording_changed
+        return self._trace_recorder
+    
+    def _is_recording(self) -> bool:
+        """Läuft eine Trace-Aufnahme? (Ohne den Recorder dafür zu erzeugen.)"""
+        return self._trace_recorder is not None and self._trace_recorder.is_recording()
+    
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and obj is self.main_screen:
+            # Nach dem kompletten Paint-Durchlauf berichten
+            self.main_screen.removeEventFilter(self)
+            QTimer.singleShot(0, self._report_startup)
+        return super().eventFilter(obj, event)
+    
+    def _report_startup(self):
+        startup_timer.mark("first_paint")
+        startup_timer.report()
     
     def _load_config(self):
         """Lädt Konfiguration aus JSON."""
@@ -96,20 +161,12 @@ class ThinkCityDashboard(QWidget):
         config_file = os.path.expanduser("~/thinkcity-dashboard-v3/config.json")
         
         defaults = {
+            "can_filter_enabled": False,
+            "simulation_mode": False,
             "logging_enabled": True,
             "logging_interval_sec": 1,
-            "logging_fields": [
-                # Basic (commonly used)
-                "speed_kmh", "soc_pct", "voltage_V", "current_A", "power_kW",
-                "pack_temp_C", "ambient_temp_C", "consumption_wh_km", "range_km", "odo_km",
-                # EnerDel battery health
-                "e_pack_max_cell_V", "e_pack_min_cell_V", "e_pack_avg_cell_V", "e_pack_delta_cell_V",
-                "e_pack_max_temp_C", "e_pack_min_temp_C",
-                # Module voltages
-                "module1_voltage_V", "module2_voltage_V", "module3_voltage_V", "module4_voltage_V",
-                # Error flags (always useful for diagnostics)
-                "iso_error", "emergency", "sys_int_iso_error", "sys_ext_iso_error", "sys_thermal_iso_error"
-            ]
+            "logging_fields": list(signal_db.DEFAULT_LOGGING_FIELDS),
+            "retention_days": dict(DEFAULT_RETENTION_DAYS),  # None = unbegrenzt
         }
         
         if os.path.exists(config_file):
@@ -141,25 +198,10 @@ class ThinkCityDashboard(QWidget):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
         
-        # Stacked Widget for screens
+        # Stacked Widget for screens (Platzhalter, Main-Screen sofort)
         self.screen_stack = QStackedWidget()
-        
-        self.main_screen = MainScreen()
-        self.battery_screen = BatteryScreen()
-        self.charge_screen = ChargeScreen()
-        self.cell_voltages_screen = CellVoltagesScreen()
-        self.raw_data_screen = RawDataScreen()
-        self.settings_screen = SettingsScreen()
-        
-        self.screen_stack.addWidget(self.main_screen)           # Index 0
-        self.screen_stack.addWidget(self.battery_screen)        # Index 1
-        self.screen_stack.addWidget(self.charge_screen)         # Index 2
-        self.screen_stack.addWidget(self.cell_voltages_screen)  # Index 3
-        self.screen_stack.addWidget(self.raw_data_screen)       # Index 4
-        self.screen_stack.addWidget(self.settings_screen)       # Index 5
-        
-        # Settings-Signal verbinden
-        self.settings_screen.settings_changed.connect(self._on_settings_changed)
+        self.screen_subscriptions = {}
+        self._init_screens()
         
         main_layout.addWidget(self.screen_stack, stretch=1)
         
@@ -168,25 +210,23 @@ class ThinkCityDashboard(QWidget):
         nav_layout.setSpacing(5)
         nav_layout.setContentsMargins(5, 5, 5, 5)
         
-        t = self.translator.get
-        
-        self.btn_main = TouchButton(t("main"))
+        self.btn_main = self.texts.add(TouchButton(""), "main")
         self.btn_main.set_callback(lambda: self._switch_screen(0))
         nav_layout.addWidget(self.btn_main)
         
-        self.btn_battery = TouchButton(t("battery"))
+        self.btn_battery = self.texts.add(TouchButton(""), "battery")
         self.btn_battery.set_callback(lambda: self._switch_screen(1))
         nav_layout.addWidget(self.btn_battery)
         
-        self.btn_cells = TouchButton(t("cells"))
+        self.btn_cells = self.texts.add(TouchButton(""), "cells")
         self.btn_cells.set_callback(lambda: self._switch_screen(3))
         nav_layout.addWidget(self.btn_cells)
         
-        self.btn_charge = TouchButton(t("charge"))
+        self.btn_charge = self.texts.add(TouchButton(""), "charge")
         self.btn_charge.set_callback(lambda: self._switch_screen(2))
         nav_layout.addWidget(self.btn_charge)
         
-        self.btn_raw = TouchButton(t("raw"))
+        self.btn_raw = self.texts.add(TouchButton(""), "raw")
         self.btn_raw.set_callback(lambda: self._switch_screen(4))
         nav_layout.addWidget(self.btn_raw)
         
@@ -198,12 +238,56 @@ class ThinkCityDashboard(QWidget):
         
         self.setLayout(main_layout)
     
+    def _init_screens(self):
+        """Füllt den Stack mit Platzhaltern und erzeugt den Main-Screen."""
+        for attr, _, _, _ in SCREENS:
+            setattr(self, attr, None)
+            self.screen_stack.addWidget(QWidget())
+        self._ensure_screen(0)
+        self.screen_stack.setCurrentIndex(0)
+    
+    def _ensure_screen(self, index: int):
+        """Erzeugt den Screen an index beim ersten Aufruf (ersetzt den Platzhalter)."""
+        attr, module_name, class_name, bind = SCREENS[index]
+        screen = getattr(self, attr)
+        if screen is not None:
+            return screen
+        
+        start = time.monotonic()
+        screen_class = getattr(importlib.import_module(module_name), class_name)
+        screen = screen_class()
+        
+        placeholder = self.screen_stack.widget(index)
+        was_current = self.screen_stack.currentIndex() == index
+        self.screen_stack.insertWidget(index, screen)
+        self.screen_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        if was_current:
+            self.screen_stack.setCurrentIndex(index)
+        setattr(self, attr, screen)
+        
+        if hasattr(screen, 'settings_changed'):
+            screen.settings_changed.connect(self._on_settings_changed)
+        if bind:
+            self._bind_screen(index, screen)
+        if hasattr(self, 'network_monitor'):
+            self._on_network_status_changed()
+        
+        logger.info(f"{class_name} created in {(time.monotonic() - start) * 1000:.0f} ms")
+        return screen
+    
     def _connect_can(self):
         """Verbindet zum CAN-Bus."""
+        from can_interface import CANInterface, CANReader
+        
         logger.info("Connecting to CAN bus...")
         
         channel = os.getenv("TC_CAN_CHANNEL", "can0")
-        self.can_interface = CANInterface(channel=channel)
+        self.can_interface = CANInterface(
+            channel=channel,
+            filter_ids=self._get_can_filter_ids()
+        )
+        self._update_can_filter_width()
         
         if not self.can_interface.connect():
             logger.error("Failed to connect to CAN bus")
@@ -211,27 +295,66 @@ class ThinkCityDashboard(QWidget):
         else:
             # Check if vcan (virtual CAN for tests)
             logger.info(f"Connected to {channel}")
-    
-    def _is_wifi_connected(self):
-        """Prüft ob WLAN verbunden ist."""
-        import subprocess
-        try:
-            # Check if wlan0 eine IP hat
-            result = subprocess.run(
-                ["ip", "addr", "show", "wlan0"],
-                capture_output=True,
-                text=True,
-                timeout=1
+            
+            # Empfang im Hintergrund-Thread, UI-Tick holt die Frames gesammelt ab
+            self.can_reader = CANReader(
+                self.can_interface,
+                buffer_size=self.config.get("can_buffer_size", 4096)
             )
-            # Wenn "inet " in der Ausgabe ist, dann ist WLAN verbunden
-            return "inet " in result.stdout
-        except Exception:
-            return False
+            self.can_reader.start()
+    
+    def _get_can_filter_ids(self):
+        """
+        IDs für den Kernel-Filter (None = kompletter Bus).
+        Alle IDs aus dem Signal-Katalog (Decoder). Trace-Recorder und
+        Raw-Data-Screen brauchen auch unbekannte IDs und öffnen den Filter
+        (siehe _update_can_filter_width).
+        """
+        if not self.config.get("can_filter_enabled", False):
+            return None
+        return set(signal_db.known_ids())
+    
+    def _update_can_filter_width(self, recording: Optional[bool] = None):
+        """
+        Öffnet den Kernel-Filter, solange eine Trace-Aufnahme läuft oder der
+        Raw-Data-Screen sichtbar ist (Zeilen und Byte-Diff für unbekannte IDs),
+        sonst gilt wieder der Katalog-Filter.
+        """
+        if not self.can_interface:
+            return
+        if recording is None:
+            recording = self._is_recording()
+        raw_visible = (
+            self.raw_data_screen is not None
+            and self.screen_stack.currentWidget() is self.raw_data_screen
+        )
+        if recording or raw_visible:
+            self.can_interface.widen_filters()
+        else:
+            self.can_interface.restore_filters()
+    
+    def _on_recording_changed(self, active: bool):
+        """Trace-Aufnahme gestartet/gestoppt → Filter öffnen/wiederherstellen."""
+        self._update_can_filter_width(recording=active)
+    
+    def _on_network_status_changed(self, status=None):
+        """WLAN-Status an alle StatusBars weitergeben (gecacht, nur bei Änderungen)."""
+        if status is None:
+            status = self.network_monitor.status
+        
+        for screen in self._screens_with_statusbar():
+            screen.status_bar.set_wifi_status(status.connected)
+    
+    def _screens_with_statusbar(self):
+        """Alle bereits erzeugten Screens mit Status-Bar."""
+        screens = [getattr(self, attr) for attr, _, _, _ in SCREENS]
+        return [screen for screen in screens if hasattr(screen, 'status_bar')]
     
     def _is_replay_active(self):
         """Prüft ob Trace-Replay aktiv ist."""
         try:
             # Check if SettingsScreen hat einen aktiven TracePlayer
+            # (noch nicht erzeugter SettingsScreen → kein Replay)
             if hasattr(self.settings_screen, 'trace_player'):
                 player = self.settings_screen.trace_player
                 if player and hasattr(player, 'is_playing'):
@@ -242,28 +365,46 @@ class ThinkCityDashboard(QWidget):
     
     def _update_loop(self):
         """Haupt-Update-Loop (10 Hz)."""
-        if self.can_interface:
-            # CAN-Messages lesen
-            msg = self.can_interface.receive(timeout=0.01)
+        if self.can_reader:
+            # Alle seit dem letzten Tick empfangenen Frames abholen
+            frames = self.can_reader.drain(
+                max_frames=self.config.get("can_max_frames_per_tick", 2000)
+            )
             
-            if msg:
-                # Forward to trace recorder (if recording)
-                if hasattr(self, 'trace_recorder') and self.trace_recorder.is_recording():
-                    self.trace_recorder.record_message(msg)
+            if frames:
+                recording = self._is_recording()
+                raw_data_screen = self.raw_data_screen  # None bis zum ersten Aufruf
+                decoded_any = False
                 
-                # Rohdaten an Raw-Data-Screen weiterleiten
-                self.raw_data_screen.add_can_frame(
-                    msg.arbitration_id,
-                    msg.data,
-                    datetime.now()
-                )
-                
-                # Dekodieren
-                decoded = self.can_decoder.parse(msg.arbitration_id, msg.data)
+                for msg in frames:
+                    # Forward to trace recorder (if recording)
+                    if recording:
+                        self.trace_recorder.record_message(msg)
+                    
+                    # Rohdaten an Raw-Data-Screen weiterleiten
+                    # (Empfangszeitpunkt des Frames, nicht des Ticks)
+                    if raw_data_screen is not None:
+                        raw_data_screen.add_can_frame(
+                            msg.arbitration_id,
+                            msg.data,
+                            msg.timestamp
+                        )
+                    
+                    # Dekodieren (unveränderte Payloads werden übersprungen)
+                    decoded = self.can_decoder.parse_if_changed(
+                        msg.arbitration_id, msg.data, msg.timestamp
+                    )
+                    
+                    if decoded is None:
+                        continue  # Unbekannte ID oder Parse-Fehler
+                    decoded_any = True
+                    
+                    if decoded:
+                        # State mergen (nur bei geänderten Werten)
+                        self.state = self.can_decoder.merge_state(self.state, decoded)
                 
-                if decoded:
-                    # State mergen
-                    self.state = self.can_decoder.merge_state(self.state, decoded)
+                if decoded_any:
+                    # Integrationen einmal pro Tick (wie bisher), nicht pro Frame
                     
                     # Odometer aus Speed integrieren
                     self._update_odometer()
@@ -292,46 +433,44 @@ class ThinkCityDashboard(QWidget):
         
         self.last_speed_update = now
     
+    def _bind_screen(self, index: int, screen):
+        """
+        Bindet ein Screen-Widget per Publish/Subscribe an den State.
+        Abos nicht sichtbarer Screens sind pausiert und bekommen verpasste
+        Änderungen beim Umschalten nachgeliefert.
+        """
+        if hasattr(screen, 'bind'):
+            subscriptions = screen.bind(self.state)
+        else:
+            # Screens ohne eigene Bindungen: nur die Status-Bar
+            subscriptions = screen.status_bar.bind(self.state)
+        self.state.set_active(subscriptions, index == self.screen_stack.currentIndex())
+        self.screen_subscriptions[index] = subscriptions
+    
     def _update_current_screen(self):
-        """Updated nur den aktuell sichtbaren Screen."""
-        current_idx = self.screen_stack.currentIndex()
-        
-        # WLAN-Status ermitteln
-        wifi_status = self._is_wifi_connected()
-        
+        """
+        Liefert die geänderten State-Werte an die Widgets aus (einmal pro Tick).
+        Nur der sichtbare Screen ist abonniert, unveränderte Widgets werden
+        nicht neu gezeichnet.
+        """
         # Trace-Replay-Status ermitteln
         replay_active = self._is_replay_active()
         
         # Trace-Recording-Status ermitteln
-        recording_active = hasattr(self, 'trace_recorder') and self.trace_recorder.is_recording()
-        
-        # Status an alle StatusBars weitergeben (nur aktueller Screen wird gerendert)
-        screens_with_statusbar = [
-            self.main_screen,
-            self.battery_screen,
-            self.charge_screen,
-            self.cell_voltages_screen,
-            self.raw_data_screen,
-            self.settings_screen
-        ]
-        
-        for screen in screens_with_statusbar:
-            if hasattr(screen, 'status_bar'):
-                screen.status_bar.set_wifi_status(wifi_status)
-                screen.status_bar.set_replay_status(replay_active)
-                screen.status_bar.set_recording_status(recording_active)
-        
-        # Screen-spezifische Updates
-        if current_idx == 0:
-            self.main_screen.update_data(self.state)
-        elif current_idx == 1:
-            self.battery_screen.update_data(self.state)
-        elif current_idx == 2:
-            self.charge_screen.update_data(self.state)
-        elif current_idx == 3:
-            self.cell_voltages_screen.update(self.state)
-        elif current_idx == 4:
-            self.raw_data_screen.update(self.state)
+        recording_active = self._is_recording()
+        
+        # Status an alle StatusBars weitergeben (Repaint nur bei Änderung;
+        # WLAN kommt über _on_network_status_changed)
+        for screen in self._screens_with_statusbar():
+            screen.status_bar.set_replay_status(replay_active)
+            screen.status_bar.set_recording_status(recording_active)
+        
+        # Geänderte Werte an die abonnierten Widgets (Screens + Status-Bars)
+        self.state.publish()
+        
+        # Gepufferte CAN-Frames gesammelt ins Terminal (nur wenn sichtbar)
+        if self.raw_data_screen is not None:
+            self.raw_data_screen.refresh()
     
     def _log_sample(self):
         """Loggt Sample in DB (konfigurierbares Intervall)."""
@@ -343,24 +482,28 @@ class ThinkCityDashboard(QWidget):
         if len(self.state) < 5:
             return
         
-        # Filtere Datenpunkte basierend auf Konfiguration
-        selected_fields = self.config.get("logging_fields", [])
-        
-        if selected_fields:
-            # Only log selected fields
-            filtered_data = {
-                key: value for key, value in self.state.items()
-                if key in selected_fields or key == "odo_km"  # odo_km immer dabei
-            }
-        else:
-            # Alle Felder loggen (Fallback)
-            filtered_data = self.state
+        # Filtere Datenpunkte basierend auf Konfiguration; ohne Auswahl alle
+        # Katalog-Felder (nie interne Keys wie _can_id, jeder Key wird ein Signal)
+        selected_fields = set(self.config.get("logging_fields") or signal_db.LOGGING_FIELDS)
+        selected_fields.update(STATE_FIELDS)  # Odo, Totals, SOH immer dabei
+        filtered_data = {
+            key: value for key, value in self.state.items()
+            if key in selected_fields
+        }
         
-        self.db_manager.add_sample(filtered_data)
+        self.sample_writer.add_sample(filtered_data)
     
     def _switch_screen(self, index: int):
-        """Wechselt zu anderem Screen."""
+        """Wechselt zu anderem Screen (erzeugt ihn beim ersten Aufruf)."""
+        self._ensure_screen(index)
+        old_index = self.screen_stack.currentIndex()
+        if old_index != index:
+            self.state.set_active(self.screen_subscriptions.get(old_index, ()), False)
+            self.state.set_active(self.screen_subscriptions.get(index, ()), True)
         self.screen_stack.setCurrentIndex(index)
+        self._update_can_filter_width()
+        # Sofort aktuelle Werte zeigen, nicht erst beim nächsten Tick
+        self.state.publish()
         logger.info(f"Switched to screen {index}")
     
     def _on_settings_changed(self, new_config: dict):
@@ -370,12 +513,19 @@ class ThinkCityDashboard(QWidget):
         # Config aktualisieren
         self.config.update(new_config)
         
-        # Check if language changed wurde
+        # Sprache (Listener _on_language_changed greift nur bei Änderung)
         if "language" in new_config:
-            logger.info(f"Language changed to {new_config['language']}")
             self.translator.set_language(new_config['language'])
-            # Reload alle Screens
-            self._reload_all_screens()
+        
+        # Simulations-Modus (Demo-Zellspannungen)
+        if "simulation_mode" in new_config:
+            self.can_decoder.simulation_mode = bool(new_config["simulation_mode"])
+            if not self.can_decoder.simulation_mode:
+                self.state.pop("cell_voltages", None)
+        
+        # Kernel-Filter an-/abschalten
+        if "can_filter_enabled" in new_config and self.can_interface:
+            self.can_interface.set_filter_ids(self._get_can_filter_ids())
         
         # Logging-Timer Intervall anpassen
         log_interval_ms = new_config.get("logging_interval_sec", 1) * 1000
@@ -384,80 +534,82 @@ class ThinkCityDashboard(QWidget):
             self.log_timer.start(log_interval_ms)
             logger.info(f"Logging interval updated to {log_interval_ms}ms")
     
-    def _reload_all_screens(self):
-        """Lädt alle Screens neu nach Sprachwechsel."""
-        logger.info("Reloading all screens with new language...")
-        
-        # Aktuellen Screen-Index merken
-        current_index = self.screen_stack.currentIndex()
-        
-        # Alle Screens aus Stack entfernen
-        while self.screen_stack.count() > 0:
-            widget = self.screen_stack.widget(0)
-            self.screen_stack.removeWidget(widget)
-            widget.deleteLater()
-        
-        # Screens neu erstellen
-        self.main_screen = MainScreen()
-        self.battery_screen = BatteryScreen()
-        self.charge_screen = ChargeScreen()
-        self.cell_voltages_screen = CellVoltagesScreen()
-        self.raw_data_screen = RawDataScreen()
-        self.settings_screen = SettingsScreen()
-        
-        self.screen_stack.addWidget(self.main_screen)           # Index 0
-        self.screen_stack.addWidget(self.battery_screen)        # Index 1
-        self.screen_stack.addWidget(self.charge_screen)         # Index 2
-        self.screen_stack.addWidget(self.cell_voltages_screen)  # Index 3
-        self.screen_stack.addWidget(self.raw_data_screen)       # Index 4
-        self.screen_stack.addWidget(self.settings_screen)       # Index 5
-        
-        # Settings-Signal neu verbinden
-        self.settings_screen.settings_changed.connect(self._on_settings_changed)
-        
-        # Navigation-Buttons aktualisieren
-        t = self.translator.get
-        self.btn_main.setText(t("main"))
-        self.btn_battery.setText(t("battery"))
-        self.btn_cells.setText(t("cells"))
-        self.btn_charge.setText(t("charge"))
-        self.btn_raw.setText(t("raw"))
-        
-        # Return to previous screen
-        self.screen_stack.setCurrentIndex(current_index)
-        
-        logger.info("All screens reloaded successfully")
+    def _on_language_changed(self, language: str):
+        """
+        Sprachwechsel: alle Texte in-place neu setzen. Die Screens bleiben
+        erhalten (Ladebeginn, CAN-Puffer, Zellanzeige, Replay ...).
+        """
+        start = time.monotonic()
+        
+        self.texts.retranslate()
+        for attr, _, _, _ in SCREENS:
+            screen = getattr(self, attr)
+            if screen is not None:
+                screen.retranslate()
+        
+        # Wertabhängige Texte (z.B. Ladestatus, Flags) neu ausliefern;
+        # pausierte Screens bekommen sie beim nächsten Umschalten
+        for subscriptions in self.screen_subscriptions.values():
+            self.state.resend(subscriptions)
+        self.state.publish()
+        
+        logger.info(f"Language changed to {language} ({(time.monotonic() - start) * 1000:.0f} ms)")
     
     def closeEvent(self, event):
         """Cleanup beim Schließen."""
         logger.info("Shutting down...")
         
         # Stop recording if active
-        if hasattr(self, 'trace_recorder') and self.trace_recorder.is_recording():
+        if self._is_recording():
             logger.info("Stopping active trace recording...")
             self.trace_recorder.stop_recording()
         
+        # Netzwerk-Monitor stoppen
+        self.network_monitor.stop()
+        
+        self.translator.remove_listener(self._on_language_changed)
+        
         # Trip-Computer Statistiken speichern
         self.trip_computer.shutdown()
         
         # SOH-Tracker shutdown
         self.soh_tracker.shutdown()
         
+        # Stop reader thread before closing the bus
+        if self.can_reader:
+            stats = self.can_reader.get_stats()
+            logger.info(
+                f"CAN reader: {stats['frames_received']} frames received, "
+                f"{stats['frames_dropped']} dropped, max backlog {stats['max_backlog']}"
+            )
+            self.can_reader.stop()
+        
+        cache = self.can_decoder.get_cache_stats()
+        logger.info(
+            f"CAN decoder: {cache['misses']} frames decoded, {cache['hits']} unchanged "
+            f"skipped ({cache['hit_rate']:.0%})"
+        )
+        
         # Close CAN bus
         if self.can_interface:
             self.can_interface.shutdown()
         
-        # Aktiven Trip beenden
-        if self.db_manager.current_trip_id:
-            self.db_manager.end_trip(
-                odo_km=self.odo_km,
-                soc_pct=self.state.get("soc_pct", 0.0),
-                avg_consumption_wh_km=self.trip_computer.consumption_trip_wh_km,
-                avg_consumption_kwh_100km=self.trip_computer.consumption_trip_kwh_100km
-            )
+        # Aktiven Trip nach den restlichen Samples beenden, Queue leeren
+        self.sample_writer.end_trip(
+            odo_km=self.odo_km,
+            soc_pct=self.state.get("soc_pct", 0.0),
+            avg_consumption_wh_km=self.trip_computer.trip_avg_consumption,
+            avg_consumption_kwh_100km=self.trip_computer.trip_avg_consumption / 10.0
+        )
+        self.sample_writer.stop()
+        writer = self.sample_writer.get_stats()
+        logger.info(
+            f"Sample writer: {writer['written']} samples in {writer['batches']} batches, "
+            f"{writer['dropped']} dropped, {writer['errors']} errors"
+        )
         
-        # Close DB
-        self.db_manager.vacuum()
+        # Close DB (finaler WAL-Checkpoint)
+        self.db_manager.close()
         
         event.accept()
 
@@ -472,6 +624,7 @@ def main():
     logger.info(f"Starting ThinkCity Dashboard v3 (QT_QPA_PLATFORM={platform})")
     
     app = QApplication(sys.argv)
+    startup_timer.mark("qt_init")
     
     # Cursor verstecken auf Pi
     if os.getenv("TC_HIDE_CURSOR", "0") == "1":
@@ -479,6 +632,7 @@ def main():
     
     dashboard = ThinkCityDashboard()
     dashboard.show()
+    startup_timer.mark("show")
     
     sys.exit(app.exec_())
 
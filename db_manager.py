@@ -3,13 +3,242 @@
 
 import sqlite3
 import os
+import time
+import queue
 import logging
+import threading
+from array import array
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Iterable, Iterator
 from contextlib import contextmanager
+from urllib.request import pathname2url
+
+import signal_db
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Feste Spalten der samples-Tabelle (Name = State-Key, Default wenn nicht im Sample).
+# Alle weiteren numerischen Werte eines Samples landen in sample_values.
+SAMPLE_COLUMNS: Tuple[Tuple[str, Any], ...] = (
+    ("speed_kmh", 0.0),
+    ("soc_pct", 0.0),
+    ("voltage_V", 0.0),
+    ("current_A", 0.0),
+    ("power_kW", 0.0),
+    ("pack_temp_C", 0.0),
+    ("ambient_temp_C", 0.0),
+    ("latitude", None),
+    ("longitude", None),
+    ("consumption_wh_km", 0.0),
+    ("consumption_total_wh_km", 0.0),
+    ("total_distance_km", 0.0),
+    ("total_energy_kwh", 0.0),
+    ("total_count", 0),
+    ("range_km", 0.0),
+    ("soh_pct", None),
+)
+SAMPLE_COLUMN_ORDER = tuple(name for name, _ in SAMPLE_COLUMNS)
+SAMPLE_COLUMN_NAMES = frozenset(SAMPLE_COLUMN_ORDER)
+
+# Schema-Version (PRAGMA user_version), Migrationen: DBManager._migrate_vN
+#   1: Stand vor der Versionierung (Text-Zeitstempel) + sample_values
+#   2: Zeitstempel als Epoch-Millisekunden, zusammengesetzte Indizes
+#   3: latest_state (Remanenz ohne Suche in samples)
+#   4: Rollup-Tabellen (1 min / 1 h)
+SCHEMA_VERSION = 4
+
+TRIPS_TABLE_SQL = """
+    CREATE TABLE {table} (
+        trip_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        start_ts INTEGER NOT NULL,
+        end_ts INTEGER,
+        start_odo_km REAL,
+        end_odo_km REAL,
+        distance_km REAL,
+        avg_consumption_wh_km REAL,
+        avg_consumption_kwh_100km REAL,
+        start_soc_pct REAL,
+        end_soc_pct REAL,
+        energy_used_kwh REAL,
+        max_power_kw REAL,
+        min_power_kw REAL,
+        avg_speed_kmh REAL,
+        max_speed_kmh REAL,
+        synced INTEGER DEFAULT 0
+    )
+"""
+
+SAMPLES_TABLE_SQL = """
+    CREATE TABLE {table} (
+        sample_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        trip_id INTEGER NOT NULL,
+        ts INTEGER NOT NULL,
+        speed_kmh REAL,
+        soc_pct REAL,
+        voltage_V REAL,
+        current_A REAL,
+        power_kW REAL,
+        pack_temp_C REAL,
+        ambient_temp_C REAL,
+        latitude REAL,
+        longitude REAL,
+        consumption_wh_km REAL,
+        consumption_total_wh_km REAL,
+        total_distance_km REAL,
+        total_energy_kwh REAL,
+        total_count INTEGER,
+        range_km REAL,
+        soh_pct REAL,
+        synced INTEGER DEFAULT 0,
+        FOREIGN KEY (trip_id) REFERENCES trips (trip_id)
+    )
+"""
+
+# Katalog der Signale in sample_values (Name -> ganzzahlige ID)
+SIGNALS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS signals (
+        signal_id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE,
+        unit TEXT
+    )
+"""
+
+# Schmale Werte-Tabelle: eine Zeile pro Sample und Signal
+SAMPLE_VALUES_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS sample_values (
+        sample_id INTEGER NOT NULL,
+        signal_id INTEGER NOT NULL,
+        value REAL,
+        PRIMARY KEY (sample_id, signal_id)
+    ) WITHOUT ROWID
+"""
+
+# Letzter bekannter Zustand (Totals, SOH, Odometer, offener Trip) für den Start
+LATEST_STATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS latest_state (
+        key TEXT PRIMARY KEY,
+        value
+    ) WITHOUT ROWID
+"""
+
+# Werte, die der Writer aus dem jeweils neuesten Sample in latest_state
+# übernimmt (werden unabhängig von logging_fields immer mitgeloggt).
+# Dazu kommen trip_id und last_sample_ts aus der Trip-Erkennung.
+STATE_FIELDS: Tuple[str, ...] = (
+    "odo_km", "soc_pct", "soh_pct",
+    "consumption_total_wh_km", "total_distance_km", "total_energy_kwh", "total_count",
+)
+TOTAL_FIELDS = ("consumption_total_wh_km", "total_distance_km", "total_energy_kwh", "total_count")
+
+# Verdichtete Historie: min/max/Summe/Anzahl/letzter Wert pro Signal und Zeitfenster
+ROLLUP_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        signal_id INTEGER NOT NULL,
+        bucket_ts INTEGER NOT NULL,
+        count INTEGER NOT NULL,
+        min REAL,
+        max REAL,
+        sum REAL,
+        last REAL,
+        PRIMARY KEY (signal_id, bucket_ts)
+    ) WITHOUT ROWID
+"""
+
+# Rollup-Stufen: (Tabelle, Fensterbreite in ms)
+ROLLUP_TIERS: Tuple[Tuple[str, int], ...] = (
+    ("rollup_1m", 60 * 1000),
+    ("rollup_1h", 3600 * 1000),
+)
+
+# Aufbewahrung pro Stufe in Tagen (None = unbegrenzt). Rohdaten werden nur
+# für bereits synchronisierte Trips gelöscht, die Trip-Zeilen bleiben.
+DEFAULT_RETENTION_DAYS: Dict[str, Optional[int]] = {
+    "samples": 90,
+    "rollup_1m": 365,
+    "rollup_1h": None,
+}
+
+# Größte Zeitspanne, für die eine Stufe bei History-Abfragen gewählt wird
+TIER_MAX_SPAN_MS: Dict[str, int] = {
+    "samples": 6 * 3600 * 1000,           # bis 6 h: Rohdaten
+    "rollup_1m": 14 * 24 * 3600 * 1000,   # bis 14 Tage: Minuten
+}
+
+INDEX_SQL: Tuple[str, ...] = (
+    # Samples eines Trips in Zeitreihenfolge
+    "CREATE INDEX IF NOT EXISTS idx_samples_trip_ts ON samples(trip_id, ts)",
+    # Zeitraum-Abfragen über alle Trips
+    "CREATE INDEX IF NOT EXISTS idx_samples_ts ON samples(ts)",
+    # Unsynchronisierte bzw. abgelaufene Trips
+    "CREATE INDEX IF NOT EXISTS idx_trips_synced ON trips(synced, end_ts)",
+    # Ein Signal über einen Zeitraum (sample_id steigt mit der Zeit)
+    "CREATE INDEX IF NOT EXISTS idx_sample_values_signal ON sample_values(signal_id, sample_id)",
+)
+
+
+def to_epoch_ms(dt: datetime) -> int:
+    """datetime (lokal oder mit Zeitzone) -> Epoch-Millisekunden."""
+    return int(round(dt.timestamp() * 1000))
+
+
+def from_epoch_ms(ts: int) -> datetime:
+    """Epoch-Millisekunden -> lokale datetime."""
+    return datetime.fromtimestamp(ts / 1000)
+
+
+class RollupBatch:
+    """
+    Verdichtet die Werte eines Sample-Batches pro Stufe, Signal und
+    Zeitfenster, bevor sie per Upsert in die Rollup-Tabellen gehen.
+    Ein 60er-Batch wird so zu wenigen Zeilen pro Signal.
+    """
+    
+    UPSERT_SQL = """
+        INSERT INTO {table} (signal_id, bucket_ts, count, min, max, sum, last)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (signal_id, bucket_ts) DO UPDATE SET
+            count = count + excluded.count,
+            min = MIN(min, excluded.min),
+            max = MAX(max, excluded.max),
+            sum = sum + excluded.sum,
+            last = excluded.last
+    """
+    
+    def __init__(self):
+        # Pro Stufe: (signal_id, bucket_ts) -> [count, min, max, sum, last]
+        self.buckets: List[Dict[Tuple[int, int], list]] = [{} for _ in ROLLUP_TIERS]
+    
+    def add(self, signal_id: int, ts: int, value: float):
+        """Nimmt einen Wert auf (Samples in Zeitreihenfolge, wegen last)."""
+        for (_, width), buckets in zip(ROLLUP_TIERS, self.buckets):
+            key = (signal_id, ts - ts % width)
+            agg = buckets.get(key)
+            if agg is None:
+                buckets[key] = [1, value, value, value, value]
+            else:
+                agg[0] += 1
+                if value < agg[1]:
+                    agg[1] = value
+                if value > agg[2]:
+                    agg[2] = value
+                agg[3] += value
+                agg[4] = value
+    
+    def write(self, conn: sqlite3.Connection):
+        """Schreibt alle Fenster (innerhalb der laufenden Transaktion)."""
+        for (table, _), buckets in zip(ROLLUP_TIERS, self.buckets):
+            if buckets:
+                conn.executemany(
+                    self.UPSERT_SQL.format(table=table),
+                    [(signal_id, bucket, *agg) for (signal_id, bucket), agg in buckets.items()]
+                )
+
 
 class DBManager:
     """
@@ -19,138 +248,385 @@ class DBManager:
     - Auto-Trip-Detection (Start bei Bewegung, Ende nach 5min Idle)
     - GPS-ready (latitude/longitude Spalten)
     - Sync-Status für WLAN-Upload
+    - Beliebige Logging-Felder: feste Spalten in samples, alle weiteren
+      als (sample_id, signal_id, value) in sample_values
+    - Rollups pro Minute/Stunde für lange Zeiträume, Aufbewahrung pro Stufe
+    
+    Hält eine einzige, langlebige Verbindung (WAL, synchronous=FULL).
+    sqlite3 cached die vorbereiteten Statements pro Verbindung, daher
+    werden wiederkehrende INSERTs nur einmal geparst. Zugriffe aus
+    anderen Threads laufen über denselben Lock.
+    
+    Durch synchronous=FULL wird das WAL bei jedem Commit gesynct (ein
+    fsync der WAL-Datei pro SampleWriter-Batch): Bei Stromausfall geht
+    höchstens der gerade laufende Commit verloren, die Datenbank bleibt
+    konsistent. Checkpoints übertragen das WAL nur periodisch
+    (CHECKPOINT_INTERVAL) und beim Schließen in die DB-Datei.
     """
     
-    def __init__(self, db_path: Optional[str] = None):
+    CACHE_SIZE_KB = 8192            # Page-Cache der Verbindung
+    CHECKPOINT_INTERVAL = 300.0     # Sekunden zwischen WAL-Checkpoints
+    CHECKPOINT_MODES = ("PASSIVE", "FULL", "RESTART", "TRUNCATE")
+    
+    INSERT_SAMPLE_SQL = (
+        "INSERT INTO samples (sample_id, trip_id, ts, "
+        + ", ".join(name for name, _ in SAMPLE_COLUMNS)
+        + ") VALUES (" + ", ".join("?" * (len(SAMPLE_COLUMNS) + 3)) + ")"
+    )
+    INSERT_VALUE_SQL = "INSERT INTO sample_values (sample_id, signal_id, value) VALUES (?, ?, ?)"
+    
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        retention_days: Optional[Dict[str, Optional[int]]] = None,
+        read_only: bool = False
+    ):
+        """
+        Args:
+            read_only: Nur lesen (Export, Analyse neben dem laufenden
+                       Dashboard): keine Migration, kein Trip-Restore
+        """
         # DB-Pfad aus Env oder Fallback
         if db_path is None:
             db_path = os.getenv("TC_DB_PATH", "/mnt/usbssd/thinkcity.db")
         
         self.db_path = db_path
+        self.read_only = read_only
+        self.retention_days = dict(DEFAULT_RETENTION_DAYS)
+        if retention_days:
+            self.retention_days.update(retention_days)
         self.current_trip_id: Optional[int] = None
         self.last_sample_time: Optional[datetime] = None
         self.trip_idle_timeout: float = 300.0  # 5 Minuten
         
+        self._conn: Optional[sqlite3.Connection] = None
+        self._signal_ids: Optional[Dict[str, int]] = None  # Cache der signals-Tabelle
+        self._state: Optional[Dict[str, Any]] = None       # Cache von latest_state
+        self._lock = threading.RLock()
+        self.last_checkpoint = time.monotonic()
+        
+        if read_only:
+            self._check_schema()
+            return
+        
         # Erstelle DB falls nicht vorhanden
         self._init_db()
+        
+        # Offenen Trip nach hartem Abschalten fortsetzen oder abschließen
+        self._restore_trip()
+    
+    def _readonly_uri(self) -> str:
+        """SQLite-URI für Nur-Lese-Verbindungen."""
+        return f"file:{pathname2url(os.path.abspath(self.db_path))}?mode=ro"
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Öffnet die persistente Verbindung und setzt die Pragmas."""
+        if self.read_only:
+            conn = sqlite3.connect(self._readonly_uri(), uri=True, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute(f"PRAGMA cache_size=-{self.CACHE_SIZE_KB}")
+            self._conn = conn
+            return conn
+        
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        
+        mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        if mode.lower() != "wal":
+            logger.warning(f"WAL not available for {self.db_path}, using journal_mode={mode}")
+        conn.execute("PRAGMA synchronous=FULL")
+        conn.execute(f"PRAGMA cache_size=-{self.CACHE_SIZE_KB}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        
+        self._conn = conn
+        self.last_checkpoint = time.monotonic()
+        return conn
     
     @contextmanager
     def _get_conn(self):
-        """Context manager für DB-Verbindungen."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Database error: {e}")
-            raise
-        finally:
-            conn.close()
+        """Context manager für die persistente DB-Verbindung (eine Transaktion)."""
+        with self._lock:
+            conn = self._conn or self._connect()
+            try:
+                yield conn
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Database error: {e}")
+                raise
+    
+    def checkpoint(self, mode: str = "PASSIVE"):
+        """
+        Schreibt das WAL in die Datenbank-Datei zurück (und synct es vorher).
+        
+        Args:
+            mode: PASSIVE (blockiert keine Leser), FULL, RESTART oder
+                  TRUNCATE (setzt die WAL-Datei auf 0 Byte zurück)
+        """
+        if mode not in self.CHECKPOINT_MODES:
+            raise ValueError(f"Unknown checkpoint mode: {mode}")
+        
+        with self._lock:
+            if self._conn is None:
+                return
+            busy, wal_pages, done_pages = self._conn.execute(
+                f"PRAGMA wal_checkpoint({mode})"
+            ).fetchone()
+            self.last_checkpoint = time.monotonic()
+        
+        logger.debug(f"WAL checkpoint ({mode}): {done_pages}/{wal_pages} pages, busy={busy}")
+    
+    def _maybe_checkpoint(self):
+        """Checkpoint, wenn CHECKPOINT_INTERVAL seit dem letzten vergangen ist."""
+        if time.monotonic() - self.last_checkpoint >= self.CHECKPOINT_INTERVAL:
+            try:
+                self.checkpoint()
+            except sqlite3.Error as e:
+                logger.warning(f"WAL checkpoint failed: {e}")
+    
+    def close(self):
+        """Finaler Checkpoint, Statistik-Update und Schließen der Verbindung."""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                if not self.read_only:
+                    self.checkpoint("TRUNCATE")
+                self._conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                logger.warning(f"Database close: {e}")
+            finally:
+                self._conn.close()
+                self._conn = None
+            logger.info("Database closed")
     
     def _init_db(self):
-        """Erstellt Tabellen falls nicht vorhanden."""
+        """
+        Erstellt bzw. migriert das Schema.
+        
+        Die Schema-Version steht in PRAGMA user_version. Ist sie aktuell,
+        ist der Start eine einzige Abfrage; sonst laufen die fehlenden
+        Migrationen (_migrate_vN) atomar in einer Transaktion.
+        """
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
         with self._get_conn() as conn:
-            cursor = conn.cursor()
-            
-            # Trips Tabelle
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS trips (
-                    trip_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    start_time TEXT NOT NULL,
-                    end_time TEXT,
-                    start_odo_km REAL,
-                    end_odo_km REAL,
-                    distance_km REAL,
-                    avg_consumption_wh_km REAL,
-                    avg_consumption_kwh_100km REAL,
-                    start_soc_pct REAL,
-                    end_soc_pct REAL,
-                    energy_used_kwh REAL,
-                    max_power_kw REAL,
-                    min_power_kw REAL,
-                    avg_speed_kmh REAL,
-                    max_speed_kmh REAL,
-                    synced INTEGER DEFAULT 0
-                )
-            """)
-            
-            # Samples Tabelle (Messdaten)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS samples (
-                    sample_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    trip_id INTEGER NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    speed_kmh REAL,
-                    soc_pct REAL,
-                    voltage_V REAL,
-                    current_A REAL,
-                    power_kW REAL,
-                    pack_temp_C REAL,
-                    ambient_temp_C REAL,
-                    latitude REAL,
-                    longitude REAL,
-                    consumption_wh_km REAL,
-                    consumption_total_wh_km REAL,
-                    total_distance_km REAL,
-                    total_energy_kwh REAL,
-                    total_count INTEGER,
-                    range_km REAL,
-                    soh_pct REAL,
-                    synced INTEGER DEFAULT 0,
-                    FOREIGN KEY (trip_id) REFERENCES trips (trip_id)
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version == SCHEMA_VERSION:
+                logger.info(f"Database opened at {self.db_path} (schema v{version})")
+                return
+            if version > SCHEMA_VERSION:
+                logger.error(
+                    f"Database schema v{version} is newer than supported v{SCHEMA_VERSION}"
                 )
-            """)
-            
-            # Migration: Add new columns if not present
-            cursor.execute("PRAGMA table_info(samples)")
-            columns = [col[1] for col in cursor.fetchall()]
-            
-            if "consumption_total_wh_km" not in columns:
-                cursor.execute("ALTER TABLE samples ADD COLUMN consumption_total_wh_km REAL")
-                logger.info("Added consumption_total_wh_km column to samples table")
-            
-            if "total_distance_km" not in columns:
-                cursor.execute("ALTER TABLE samples ADD COLUMN total_distance_km REAL")
-                logger.info("Added total_distance_km column to samples table")
-            
-            if "total_energy_kwh" not in columns:
-                cursor.execute("ALTER TABLE samples ADD COLUMN total_energy_kwh REAL")
-                logger.info("Added total_energy_kwh column to samples table")
+                return
             
-            if "total_count" not in columns:
-                cursor.execute("ALTER TABLE samples ADD COLUMN total_count INTEGER")
-                logger.info("Added total_count column to samples table")
+            conn.execute("BEGIN IMMEDIATE")
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'samples'"
+            ).fetchone()
             
-            if "soh_pct" not in columns:
-                cursor.execute("ALTER TABLE samples ADD COLUMN soh_pct REAL")
-                logger.info("Added soh_pct column to samples table")
+            if not exists:
+                self._create_schema(conn)
+                logger.info(f"Database created at {self.db_path} (schema v{SCHEMA_VERSION})")
+            else:
+                for target in range(version + 1, SCHEMA_VERSION + 1):
+                    getattr(self, f"_migrate_v{target}")(conn)
+                    logger.info(f"Database migrated to schema v{target}")
             
-            # Index for faster queries
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_samples_trip 
-                ON samples(trip_id)
-            """)
-            
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_samples_timestamp 
-                ON samples(timestamp)
-            """)
-            
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_trips_synced 
-                ON trips(synced)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    
+    def _check_schema(self):
+        """Nur-Lese-Modus: Schema muss aktuell sein (migriert wird nur vom Dashboard)."""
+        with self._get_conn() as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            raise RuntimeError(
+                f"Database schema v{version}, expected v{SCHEMA_VERSION} "
+                f"(start the dashboard once to migrate {self.db_path})"
+            )
+    
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection):
+        """Aktuelles Schema für eine neue Datenbank."""
+        conn.execute(TRIPS_TABLE_SQL.format(table="trips"))
+        conn.execute(SAMPLES_TABLE_SQL.format(table="samples"))
+        conn.execute(SIGNALS_TABLE_SQL)
+        conn.execute(SAMPLE_VALUES_TABLE_SQL)
+        conn.execute(LATEST_STATE_TABLE_SQL)
+        for table, _ in ROLLUP_TIERS:
+            conn.execute(ROLLUP_TABLE_SQL.format(table=table))
+        for sql in INDEX_SQL:
+            conn.execute(sql)
+    
+    @staticmethod
+    def _migrate_v1(conn: sqlite3.Connection):
+        """
+        Stand vor der Versionierung: fehlende Spalten älterer Datenbanken
+        nachrüsten, Werte-Tabellen anlegen.
+        """
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(samples)")]
+        for column, column_type in (
+            ("consumption_total_wh_km", "REAL"),
+            ("total_distance_km", "REAL"),
+            ("total_energy_kwh", "REAL"),
+            ("total_count", "INTEGER"),
+            ("soh_pct", "REAL"),
+        ):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE samples ADD COLUMN {column} {column_type}")
+                logger.info(f"Added {column} column to samples table")
+        
+        conn.execute(SIGNALS_TABLE_SQL)
+        conn.execute(SAMPLE_VALUES_TABLE_SQL)
+    
+    @staticmethod
+    def _migrate_v2(conn: sqlite3.Connection):
+        """
+        ISO-Text-Zeitstempel -> Epoch-Millisekunden (INTEGER), neue Indizes.
+        
+        SQLite kann den Spaltentyp nicht ändern, daher werden trips und
+        samples neu aufgebaut. sample_id/trip_id und die AUTOINCREMENT-Zähler
+        bleiben erhalten (sample_values verweist auf sample_id).
+        """
+        # Lokalzeit (bisher datetime.now().isoformat()) -> UTC -> ms
+        to_ms = "CAST(ROUND((julianday({0}, 'utc') - 2440587.5) * 86400000) AS INTEGER)"
+        sequences = dict(conn.execute("SELECT name, seq FROM sqlite_sequence").fetchall())
+        
+        for index in ("idx_samples_trip", "idx_samples_timestamp", "idx_samples_synced",
+                      "idx_trips_synced"):
+            conn.execute(f"DROP INDEX IF EXISTS {index}")
+        
+        conn.execute(TRIPS_TABLE_SQL.format(table="trips_new"))
+        conn.execute(f"""
+            INSERT INTO trips_new
+            SELECT trip_id, {to_ms.format('start_time')}, {to_ms.format('end_time')},
+                   start_odo_km, end_odo_km, distance_km,
+                   avg_consumption_wh_km, avg_consumption_kwh_100km,
+                   start_soc_pct, end_soc_pct, energy_used_kwh,
+                   max_power_kw, min_power_kw, avg_speed_kmh, max_speed_kmh, synced
+            FROM trips
+        """)
+        conn.execute("DROP TABLE trips")
+        conn.execute("ALTER TABLE trips_new RENAME TO trips")
+        
+        columns = ", ".join(name for name, _ in SAMPLE_COLUMNS)
+        conn.execute(SAMPLES_TABLE_SQL.format(table="samples_new"))
+        conn.execute(f"""
+            INSERT INTO samples_new (sample_id, trip_id, ts, {columns}, synced)
+            SELECT sample_id, trip_id, {to_ms.format('timestamp')}, {columns}, synced
+            FROM samples
+        """)
+        conn.execute("DROP TABLE samples")
+        conn.execute("ALTER TABLE samples_new RENAME TO samples")
+        
+        for table in ("trips", "samples"):
+            if table in sequences:
+                conn.execute(
+                    "UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = ?",
+                    (sequences[table], table)
+                )
+        
+        for sql in INDEX_SQL:
+            conn.execute(sql)
+    
+    @staticmethod
+    def _migrate_v3(conn: sqlite3.Connection):
+        """latest_state anlegen und einmalig aus der Historie befüllen."""
+        conn.execute(LATEST_STATE_TABLE_SQL)
+        state: Dict[str, Any] = {}
+        
+        row = conn.execute("""
+            SELECT consumption_total_wh_km, total_distance_km, total_energy_kwh, total_count
+            FROM samples
+            WHERE consumption_total_wh_km IS NOT NULL AND total_count > 0
+            ORDER BY ts DESC LIMIT 1
+        """).fetchone()
+        if row:
+            state.update(zip(TOTAL_FIELDS, row))
+        
+        for key in ("soh_pct", "soc_pct"):
+            row = conn.execute(
+                f"SELECT {key} FROM samples WHERE {key} IS NOT NULL ORDER BY ts DESC LIMIT 1"
+            ).fetchone()
+            if row:
+                state[key] = row[0]
+        
+        row = conn.execute("""
+            SELECT v.value FROM sample_values v JOIN signals s ON s.signal_id = v.signal_id
+            WHERE s.name = 'odo_km' ORDER BY v.sample_id DESC LIMIT 1
+        """).fetchone()
+        if row:
+            state["odo_km"] = row[0]
+        
+        # Offener Trip (hartes Abschalten) -> wird beim Start fortgesetzt oder beendet
+        row = conn.execute("""
+            SELECT t.trip_id, (SELECT MAX(ts) FROM samples WHERE trip_id = t.trip_id)
+            FROM trips t WHERE t.end_ts IS NULL ORDER BY t.trip_id DESC LIMIT 1
+        """).fetchone()
+        if row:
+            state["trip_id"], state["last_sample_ts"] = row[0], row[1] or None
+        
+        conn.executemany(
+            "INSERT OR REPLACE INTO latest_state (key, value) VALUES (?, ?)", state.items()
+        )
+    
+    @staticmethod
+    def _migrate_v4(conn: sqlite3.Connection):
+        """Rollup-Tabellen anlegen und einmalig aus den vorhandenen Rohdaten füllen."""
+        for table, _ in ROLLUP_TIERS:
+            conn.execute(ROLLUP_TABLE_SQL.format(table=table))
+        
+        # Feste Spalten bekommen ebenfalls eine signal_id
+        conn.executemany(
+            "INSERT OR IGNORE INTO signals (name, unit) VALUES (?, ?)",
+            [(name, signal_db.get_unit(name)) for name, _ in SAMPLE_COLUMNS]
+        )
+        signal_ids = dict(conn.execute("SELECT name, signal_id FROM signals").fetchall())
+        
+        logger.info("Building rollups from existing samples, this may take a while...")
+        sources = [
+            (f"SELECT {signal_ids[name]} AS signal_id, ts, {name} AS value "
+             f"FROM samples WHERE {name} IS NOT NULL")
+            for name, _ in SAMPLE_COLUMNS
+        ]
+        sources.append(
+            "SELECT v.signal_id, s.ts, v.value FROM sample_values v "
+            "JOIN samples s ON s.sample_id = v.sample_id WHERE v.value IS NOT NULL"
+        )
+        
+        minute_table, minute_ms = ROLLUP_TIERS[0]
+        for source in sources:
+            conn.execute(f"""
+                INSERT INTO {minute_table} (signal_id, bucket_ts, count, min, max, sum, last)
+                SELECT signal_id, bucket, COUNT(*), MIN(value), MAX(value), SUM(value),
+                       MAX(CASE WHEN rn = 1 THEN value END)
+                FROM (
+                    SELECT signal_id, value, ts - ts % {minute_ms} AS bucket,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY signal_id, ts - ts % {minute_ms} ORDER BY ts DESC
+                           ) AS rn
+                    FROM ({source})
+                )
+                GROUP BY signal_id, bucket
             """)
-            
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_samples_synced 
-                ON samples(synced)
+        
+        # Gröbere Stufen aus der jeweils feineren
+        for (table, width), (finer, _) in zip(ROLLUP_TIERS[1:], ROLLUP_TIERS):
+            conn.execute(f"""
+                INSERT INTO {table} (signal_id, bucket_ts, count, min, max, sum, last)
+                SELECT signal_id, bucket, SUM(count), MIN(min), MAX(max), SUM(sum),
+                       MAX(CASE WHEN rn = 1 THEN last END)
+                FROM (
+                    SELECT *, bucket_ts - bucket_ts % {width} AS bucket,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY signal_id, bucket_ts - bucket_ts % {width}
+                               ORDER BY bucket_ts DESC
+                           ) AS rn
+                    FROM {finer}
+                )
+                GROUP BY signal_id, bucket
             """)
-            
-            logger.info(f"Database initialized at {self.db_path}")
     
     def start_trip(self, odo_km: float, soc_pct: float) -> int:
         """
@@ -158,18 +634,22 @@ class DBManager:
         Gibt trip_id zurück.
         """
         with self._get_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO trips (start_time, start_odo_km, start_soc_pct)
-                VALUES (?, ?, ?)
-            """, (datetime.now().isoformat(), odo_km, soc_pct))
-            
-            trip_id = cursor.lastrowid
-            self.current_trip_id = trip_id
-            self.last_sample_time = datetime.now()
-            
-            logger.info(f"Started trip {trip_id}")
-            return trip_id
+            return self._begin_trip(conn, datetime.now(), odo_km, soc_pct)
+    
+    def _begin_trip(self, conn: sqlite3.Connection, now: datetime, odo_km: float, soc_pct: float) -> int:
+        """Legt den Trip innerhalb der laufenden Transaktion an."""
+        cursor = conn.execute("""
+            INSERT INTO trips (start_ts, start_odo_km, start_soc_pct)
+            VALUES (?, ?, ?)
+        """, (to_epoch_ms(now), odo_km, soc_pct))
+        
+        trip_id = cursor.lastrowid
+        self.current_trip_id = trip_id
+        self.last_sample_time = now
+        self._save_state(conn, {"trip_id": trip_id, "last_sample_ts": to_epoch_ms(now)})
+        
+        logger.info(f"Started trip {trip_id}")
+        return trip_id
     
     def end_trip(
         self,
@@ -185,72 +665,252 @@ class DBManager:
             return
         
         with self._get_conn() as conn:
-            cursor = conn.cursor()
-            
-            # Hole Start-Daten
-            cursor.execute(
-                "SELECT start_odo_km FROM trips WHERE trip_id = ?",
-                (self.current_trip_id,)
+            ended = self._finish_trip(
+                conn, datetime.now(), odo_km, soc_pct,
+                avg_consumption_wh_km, avg_consumption_kwh_100km, stats
             )
-            row = cursor.fetchone()
-            if not row:
-                logger.error(f"Trip {self.current_trip_id} not found")
-                return
-            
-            start_odo = row[0]
-            distance_km = odo_km - start_odo
-            
-            # Stats mit Defaults
-            if stats is None:
-                stats = {}
-            
-            cursor.execute("""
-                UPDATE trips SET
-                    end_time = ?,
-                    end_odo_km = ?,
-                    distance_km = ?,
-                    end_soc_pct = ?,
-                    avg_consumption_wh_km = ?,
-                    avg_consumption_kwh_100km = ?,
-                    max_power_kw = ?,
-                    min_power_kw = ?,
-                    avg_speed_kmh = ?,
-                    max_speed_kmh = ?
-                WHERE trip_id = ?
-            """, (
-                datetime.now().isoformat(),
-                odo_km,
-                distance_km,
-                soc_pct,
-                avg_consumption_wh_km,
-                avg_consumption_kwh_100km,
-                stats.get("max_power_kw", 0.0),
-                stats.get("min_power_kw", 0.0),
-                stats.get("avg_speed_kmh", 0.0),
-                stats.get("max_speed_kmh", 0.0),
-                self.current_trip_id
-            ))
-            
-            logger.info(f"Ended trip {self.current_trip_id}: {distance_km:.2f} km")
-            self.current_trip_id = None
-            self.last_sample_time = None
         
-        # Cleanup old trips (only synced, older than 90 days)
-        self.cleanup_old_trips(days=90)
+        # Rohdaten alter, synchronisierter Trips und alte Rollups löschen
+        if ended:
+            self.apply_retention()
+    
+    def _finish_trip(
+        self,
+        conn: sqlite3.Connection,
+        now: datetime,
+        odo_km: float,
+        soc_pct: float,
+        avg_consumption_wh_km: float,
+        avg_consumption_kwh_100km: float,
+        stats: Optional[Dict[str, float]] = None
+    ) -> bool:
+        """Schließt den aktuellen Trip innerhalb der laufenden Transaktion ab."""
+        cursor = conn.cursor()
+        
+        # Hole Start-Daten
+        cursor.execute(
+            "SELECT start_odo_km FROM trips WHERE trip_id = ?",
+            (self.current_trip_id,)
+        )
+        row = cursor.fetchone()
+        if not row:
+            logger.error(f"Trip {self.current_trip_id} not found")
+            return False
+        
+        start_odo = row[0]
+        distance_km = odo_km - start_odo
+        
+        # Stats mit Defaults
+        if stats is None:
+            stats = {}
+        
+        cursor.execute("""
+            UPDATE trips SET
+                end_ts = ?,
+                end_odo_km = ?,
+                distance_km = ?,
+                end_soc_pct = ?,
+                avg_consumption_wh_km = ?,
+                avg_consumption_kwh_100km = ?,
+                max_power_kw = ?,
+                min_power_kw = ?,
+                avg_speed_kmh = ?,
+                max_speed_kmh = ?
+            WHERE trip_id = ?
+        """, (
+            to_epoch_ms(now),
+            odo_km,
+            distance_km,
+            soc_pct,
+            avg_consumption_wh_km,
+            avg_consumption_kwh_100km,
+            stats.get("max_power_kw", 0.0),
+            stats.get("min_power_kw", 0.0),
+            stats.get("avg_speed_kmh", 0.0),
+            stats.get("max_speed_kmh", 0.0),
+            self.current_trip_id
+        ))
+        
+        logger.info(f"Ended trip {self.current_trip_id}: {distance_km:.2f} km")
+        self.current_trip_id = None
+        self.last_sample_time = None
+        self._save_state(conn, {"trip_id": None})
+        return True
     
     def add_sample(self, data: Dict[str, Any]):
         """
-        Fügt Sample hinzu.
+        Fügt Sample hinzu (synchron, eine Transaktion).
         Handled Auto-Trip-Detection.
         """
-        now = datetime.now()
+        self.write_samples([(datetime.now(), data)])
+    
+    def write_samples(self, samples: List[Tuple[datetime, Dict[str, Any]]]) -> int:
+        """
+        Schreibt mehrere Samples in einer Transaktion (executemany).
+        
+        Die Trip-Erkennung läuft in Sample-Reihenfolge mit den Zeitstempeln
+        der Samples, nicht mit der Schreibzeit.
+        
+        Args:
+            samples: Liste von (Zeitstempel, Daten)
+        
+        Returns:
+            Anzahl geschriebener Samples
+        """
+        rows = []
+        value_rows = []
+        rollups = RollupBatch()
+        trip_ended = False
+        # Trip-Zustand vor der Transaktion (bei Rollback wiederherstellen)
+        trip_id, last_sample_time = self.current_trip_id, self.last_sample_time
+        
+        try:
+            with self._get_conn() as conn:
+                next_id = self._next_sample_id(conn)
+                for now, data in samples:
+                    store, ended = self._detect_trip(conn, now, data)
+                    trip_ended = trip_ended or ended
+                    if store:
+                        ts = to_epoch_ms(now)
+                        row = self._sample_row(next_id, ts, data)
+                        rows.append(row)
+                        # Rollups nur aus tatsächlich gelieferten Werten, nicht aus
+                        # den Defaults der festen Spalten (sonst min=0, Ø verfälscht)
+                        for name in SAMPLE_COLUMN_ORDER:
+                            value = data.get(name)
+                            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                                rollups.add(self._get_signal_id(conn, name), ts, value)
+                        for name, signal_id, value in self._numeric_values(conn, data):
+                            value_rows.append((next_id, signal_id, value))
+                            rollups.add(signal_id, ts, value)
+                        self.last_sample_time = now
+                        next_id += 1
+                
+                if rows:
+                    conn.executemany(self.INSERT_SAMPLE_SQL, rows)
+                if value_rows:
+                    conn.executemany(self.INSERT_VALUE_SQL, value_rows)
+                rollups.write(conn)
+                if samples:
+                    self._save_state(conn, self._state_values(samples[-1][1], bool(rows)))
+        except Exception:
+            # Neu angelegte Signale, Trip-Start/-Ende und der Zustand wurden
+            # zurückgerollt, sonst zeigen folgende Samples auf einen Trip,
+            # den es nicht gibt
+            self._signal_ids = None
+            self._state = None
+            self.current_trip_id, self.last_sample_time = trip_id, last_sample_time
+            raise
+        
+        if trip_ended:
+            self.apply_retention()
         
+        self._maybe_checkpoint()
+        return len(rows)
+    
+    def _state_values(self, data: Dict[str, Any], stored: bool) -> Dict[str, Any]:
+        """latest_state-Werte aus dem neuesten Sample eines Batches."""
+        state = {
+            key: data[key] for key in STATE_FIELDS
+            if isinstance(data.get(key), (int, float))
+        }
+        if not data.get("total_count"):
+            # Frischer Trip-Computer ohne Samples: gespeicherte Totals behalten
+            for key in TOTAL_FIELDS:
+                state.pop(key, None)
+        if stored:
+            state["last_sample_ts"] = to_epoch_ms(self.last_sample_time)
+        return state
+    
+    def _save_state(self, conn: sqlite3.Connection, values: Dict[str, Any]):
+        """Schreibt Werte in latest_state (innerhalb der laufenden Transaktion)."""
+        if not values:
+            return
+        conn.executemany(
+            "INSERT OR REPLACE INTO latest_state (key, value) VALUES (?, ?)", values.items()
+        )
+        if self._state is not None:
+            self._state.update(values)  # sonst beim nächsten Lesen aus der DB
+    
+    def get_latest_state(self) -> Dict[str, Any]:
+        """
+        Letzter gespeicherter Zustand (Totals, SOH, Odometer, offener Trip).
+        Wird einmal gelesen und danach im Speicher mitgeführt.
+        """
+        with self._lock:
+            if self._state is None:
+                with self._get_conn() as conn:
+                    self._state = {
+                        row[0]: row[1]
+                        for row in conn.execute("SELECT key, value FROM latest_state")
+                    }
+            return self._state
+    
+    def _restore_trip(self):
+        """
+        Trip, der beim letzten Lauf nicht beendet wurde (Stromausfall),
+        innerhalb des Idle-Timeouts fortsetzen, sonst zum Zeitpunkt des
+        letzten Samples abschließen.
+        """
+        state = self.get_latest_state()
+        trip_id = state.get("trip_id")
+        if trip_id is None:
+            return
+        
+        last_ts = state.get("last_sample_ts")
+        last_time = from_epoch_ms(last_ts) if last_ts else datetime.now()
+        self.current_trip_id = trip_id
+        
+        if (datetime.now() - last_time).total_seconds() <= self.trip_idle_timeout:
+            self.last_sample_time = last_time
+            logger.info(f"Resumed trip {trip_id}")
+            return
+        
+        with self._get_conn() as conn:
+            row = conn.execute("""
+                SELECT AVG(consumption_wh_km), AVG(speed_kmh), MAX(speed_kmh),
+                       MAX(power_kW), MIN(power_kW)
+                FROM samples WHERE trip_id = ?
+            """, (trip_id,)).fetchone()
+            avg_consumption = row[0] or 0.0
+            self._finish_trip(
+                conn, last_time,
+                odo_km=state.get("odo_km", 0.0),
+                soc_pct=state.get("soc_pct", 0.0),
+                avg_consumption_wh_km=avg_consumption,
+                avg_consumption_kwh_100km=avg_consumption / 10.0,
+                stats={
+                    "avg_speed_kmh": row[1] or 0.0,
+                    "max_speed_kmh": row[2] or 0.0,
+                    "max_power_kw": row[3] or 0.0,
+                    "min_power_kw": row[4] or 0.0,
+                }
+            )
+        logger.info(f"Closed trip {trip_id} left open by unclean shutdown")
+    
+    @staticmethod
+    def _next_sample_id(conn: sqlite3.Connection) -> int:
+        """
+        Nächste sample_id (AUTOINCREMENT-Zähler). Die IDs werden vorab
+        vergeben, damit samples und sample_values je ein executemany sind.
+        """
+        row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'samples'").fetchone()
+        return (row[0] if row else 0) + 1
+    
+    def _detect_trip(self, conn: sqlite3.Connection, now: datetime, data: Dict[str, Any]) -> Tuple[bool, bool]:
+        """
+        Auto-Trip-Detection für ein Sample.
+        
+        Returns:
+            (Sample speichern, Trip wurde beendet)
+        """
         # Trip Auto-Start bei Bewegung
         speed = data.get("speed_kmh", 0.0)
         
         if self.current_trip_id is None and speed > 1.0:
             # Starte neuen Trip
-            self.start_trip(
+            self._begin_trip(
+                conn, now,
                 odo_km=data.get("odo_km", 0.0),
                 soc_pct=data.get("soc_pct", 0.0)
             )
@@ -261,73 +921,436 @@ class DBManager:
             
             if speed < 1.0 and idle_seconds > self.trip_idle_timeout:
                 # Beende Trip
-                self.end_trip(
+                ended = self._finish_trip(
+                    conn, now,
                     odo_km=data.get("odo_km", 0.0),
                     soc_pct=data.get("soc_pct", 0.0),
                     avg_consumption_wh_km=data.get("consumption_wh_km", 0.0),
                     avg_consumption_kwh_100km=data.get("consumption_kwh_100km", 0.0)
                 )
-                return  # Kein Sample bei Idle
+                return False, ended  # Kein Sample bei Idle
         
         # Insert sample (only with active trip)
-        if self.current_trip_id is not None:
-            with self._get_conn() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO samples (
-                        trip_id, timestamp, speed_kmh, soc_pct,
-                        voltage_V, current_A, power_kW, pack_temp_C,
-                        ambient_temp_C, latitude, longitude,
-                        consumption_wh_km, consumption_total_wh_km,
-                        total_distance_km, total_energy_kwh, total_count,
-                        range_km, soh_pct
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    self.current_trip_id,
-                    now.isoformat(),
-                    data.get("speed_kmh", 0.0),
-                    data.get("soc_pct", 0.0),
-                    data.get("voltage_V", 0.0),
-                    data.get("current_A", 0.0),
-                    data.get("power_kW", 0.0),
-                    data.get("pack_temp_C", 0.0),
-                    data.get("ambient_temp_C", 0.0),
-                    data.get("latitude"),
-                    data.get("longitude"),
-                    data.get("consumption_wh_km", 0.0),
-                    data.get("consumption_total_wh_km", 0.0),
-                    data.get("total_distance_km", 0.0),
-                    data.get("total_energy_kwh", 0.0),
-                    data.get("total_count", 0),
-                    data.get("range_km", 0.0),
-                    data.get("soh_pct")
-                ))
-            
-            self.last_sample_time = now
+        return self.current_trip_id is not None, False
+    
+    def _sample_row(self, sample_id: int, ts: int, data: Dict[str, Any]) -> tuple:
+        """Parameter-Tupel für INSERT_SAMPLE_SQL."""
+        return (sample_id, self.current_trip_id, ts) + tuple(
+            data.get(name, default) for name, default in SAMPLE_COLUMNS
+        )
+    
+    def _numeric_values(self, conn: sqlite3.Connection, data: Dict[str, Any]) -> List[Tuple[str, int, float]]:
+        """Numerische Werte eines Samples ohne feste Spalte als (Name, signal_id, Wert)."""
+        values = []
+        for name, value in data.items():
+            if name in SAMPLE_COLUMN_NAMES:
+                continue
+            if isinstance(value, bool):
+                value = int(value)
+            elif not isinstance(value, (int, float)):
+                continue  # Listen, Strings, None
+            values.append((name, self._get_signal_id(conn, name), value))
+        return values
+    
+    def _get_signal_id(self, conn: sqlite3.Connection, name: str) -> int:
+        """ID eines Signals, legt es beim ersten Auftreten in signals an."""
+        if self._signal_ids is None:
+            self._signal_ids = {
+                row[0]: row[1] for row in conn.execute("SELECT name, signal_id FROM signals")
+            }
+        
+        signal_id = self._signal_ids.get(name)
+        if signal_id is None:
+            signal_id = conn.execute(
+                "INSERT INTO signals (name, unit) VALUES (?, ?)",
+                (name, signal_db.get_unit(name))
+            ).lastrowid
+            self._signal_ids[name] = signal_id
+        return signal_id
     
     def get_unsynced_trips(self) -> List[Dict[str, Any]]:
         """Gibt alle nicht synchronisierten Trips zurück."""
-        with self._get_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM trips 
-                WHERE synced = 0 AND end_time IS NOT NULL
-                ORDER BY start_time ASC
-            """)
-            
-            return [dict(row) for row in cursor.fetchall()]
+        return list(self.iter_trips(synced=False))
     
     def get_trip_samples(self, trip_id: int) -> List[Dict[str, Any]]:
-        """Gibt alle Samples eines Trips zurück."""
+        """
+        Gibt alle Samples eines Trips zurück (inkl. Werte aus sample_values).
+        Für lange Trips iter_samples/iter_sample_chunks verwenden.
+        """
         with self._get_conn() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT * FROM samples 
                 WHERE trip_id = ?
-                ORDER BY timestamp ASC
+                ORDER BY ts ASC
             """, (trip_id,))
             
-            return [dict(row) for row in cursor.fetchall()]
+            samples = [dict(row) for row in cursor.fetchall()]
+            by_id = {sample["sample_id"]: sample for sample in samples}
+            
+            cursor.execute("""
+                SELECT v.sample_id, s.name, v.value
+                FROM sample_values v JOIN signals s ON s.signal_id = v.signal_id
+                WHERE v.sample_id IN (SELECT sample_id FROM samples WHERE trip_id = ?)
+            """, (trip_id,))
+            for sample_id, name, value in cursor:
+                by_id[sample_id][name] = value
+            
+            return samples
+    
+    # --- Streaming-Abfragen (eigene Nur-Lese-Verbindung, fetchmany) ---
+    
+    @contextmanager
+    def _read_conn(self):
+        """
+        Eigene Nur-Lese-Verbindung für lange Abfragen. Im WAL-Modus sieht
+        sie einen konsistenten Stand und blockiert den Sample-Writer nicht.
+        """
+        conn = sqlite3.connect(self._readonly_uri(), uri=True, check_same_thread=False)
+        try:
+            conn.execute(f"PRAGMA cache_size=-{self.CACHE_SIZE_KB}")
+            yield conn
+        finally:
+            conn.close()
+    
+    def _samples_query(
+        self,
+        conn: sqlite3.Connection,
+        trip_id: Optional[int],
+        columns: Optional[Iterable[str]],
+        start: Optional[datetime],
+        end: Optional[datetime],
+        after: Optional[Tuple[int, int]] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[str, list, List[str]]:
+        """
+        SQL für Samples mit Spaltenauswahl. Feste Spalten kommen direkt aus
+        samples, weitere Signale per LEFT JOIN auf den Primärschlüssel von
+        sample_values, unbekannte Signale als NULL.
+        
+        Returns:
+            (SQL, Parameter, Spaltennamen inkl. "sample_id" und "ts")
+        """
+        if columns is None:
+            columns = SAMPLE_COLUMN_ORDER
+        names = ["sample_id", "ts"]
+        select = ["s.sample_id", "s.ts"]
+        joins = []
+        params: list = []
+        
+        for name in columns:
+            if name in names:
+                continue
+            names.append(name)
+            if name in SAMPLE_COLUMN_NAMES or name == "trip_id":
+                select.append(f"s.{name}")
+                continue
+            row = conn.execute("SELECT signal_id FROM signals WHERE name = ?", (name,)).fetchone()
+            if row is None:
+                select.append("NULL")
+                continue
+            alias = f"v{len(joins)}"
+            joins.append(
+                f"LEFT JOIN sample_values {alias} "
+                f"ON {alias}.sample_id = s.sample_id AND {alias}.signal_id = ?"
+            )
+            params.append(row[0])
+            select.append(f"{alias}.value")
+        
+        where = []
+        if trip_id is not None:
+            where.append("s.trip_id = ?")
+            params.append(trip_id)
+        if start is not None:
+            where.append("s.ts >= ?")
+            params.append(to_epoch_ms(start))
+        if end is not None:
+            where.append("s.ts <= ?")
+            params.append(to_epoch_ms(end))
+        if after is not None:
+            where.append("(s.ts, s.sample_id) > (?, ?)")
+            params.extend(after)
+        
+        sql = f"SELECT {', '.join(select)} FROM samples s {' '.join(joins)}"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY s.ts, s.sample_id"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return sql, params, names
+    
+    def iter_samples(
+        self,
+        trip_id: Optional[int] = None,
+        columns: Optional[Iterable[str]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        chunk_size: int = 1000
+    ) -> Iterator[tuple]:
+        """
+        Streamt Samples als Tupel (sample_id, ts, *columns) in Zeitreihenfolge.
+        
+        Es werden nie mehr als chunk_size Zeilen gleichzeitig geholt; die
+        Spaltennamen liefert sample_column_names(columns).
+        
+        Args:
+            trip_id: Nur dieser Trip (None = alle)
+            columns: Feste Spalten und/oder Signalnamen (None = feste Spalten)
+            start, end: Zeitraum (inklusive)
+        """
+        with self._read_conn() as conn:
+            sql, params, _ = self._samples_query(conn, trip_id, columns, start, end)
+            cursor = conn.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield from rows
+    
+    @staticmethod
+    def sample_column_names(columns: Optional[Iterable[str]] = None) -> List[str]:
+        """Spaltennamen der Tupel aus iter_samples/get_samples_page."""
+        names = ["sample_id", "ts"]
+        for name in (SAMPLE_COLUMN_ORDER if columns is None else columns):
+            if name not in names:
+                names.append(name)
+        return names
+    
+    def get_samples_page(
+        self,
+        trip_id: Optional[int] = None,
+        columns: Optional[Iterable[str]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        after: Optional[Tuple[int, int]] = None,
+        limit: int = 1000
+    ) -> Tuple[List[tuple], Optional[Tuple[int, int]]]:
+        """
+        Eine Seite Samples (Keyset-Pagination, kein OFFSET).
+        
+        Args:
+            after: Cursor der vorherigen Seite (None = erste Seite)
+        
+        Returns:
+            (Zeilen wie iter_samples, Cursor für die nächste Seite oder None)
+        """
+        with self._read_conn() as conn:
+            sql, params, _ = self._samples_query(conn, trip_id, columns, start, end, after, limit)
+            rows = conn.execute(sql, params).fetchall()
+        
+        cursor = (rows[-1][1], rows[-1][0]) if len(rows) == limit else None
+        return rows, cursor
+    
+    def iter_sample_chunks(
+        self,
+        trip_id: Optional[int] = None,
+        columns: Optional[Iterable[str]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        chunk_size: int = 10000,
+        as_numpy: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Streamt Samples spaltenweise in Blöcken von chunk_size Zeilen.
+        
+        Jeder Block ist ein Dict Spaltenname -> array ("q" für sample_id/ts/
+        trip_id, sonst "d" mit NaN für fehlende Werte), mit as_numpy=True
+        NumPy-Arrays (ohne Kopie aus den arrays).
+        """
+        if as_numpy and not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy not installed")
+        
+        with self._read_conn() as conn:
+            sql, params, names = self._samples_query(conn, trip_id, columns, start, end)
+            integer = [name in ("sample_id", "ts", "trip_id") for name in names]
+            cursor = conn.execute(sql, params)
+            nan = float("nan")
+            
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                chunk = {}
+                for index, name in enumerate(names):
+                    values = [row[index] for row in rows]
+                    if integer[index]:
+                        column = array("q", values)
+                    else:
+                        column = array("d", [nan if v is None else v for v in values])
+                    chunk[name] = np.frombuffer(column, dtype=column.typecode) if as_numpy else column
+                yield chunk
+    
+    def get_samples_columnar(
+        self,
+        trip_id: Optional[int] = None,
+        columns: Optional[Iterable[str]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        as_numpy: bool = False
+    ) -> Dict[str, Any]:
+        """Alle passenden Samples spaltenweise (siehe iter_sample_chunks)."""
+        result: Dict[str, array] = {}
+        for chunk in self.iter_sample_chunks(trip_id, columns, start, end):
+            for name, column in chunk.items():
+                if name in result:
+                    result[name].extend(column)
+                else:
+                    result[name] = column
+        
+        if not result:
+            names = self.sample_column_names(columns)
+            result = {
+                name: array("q" if name in ("sample_id", "ts", "trip_id") else "d")
+                for name in names
+            }
+        if as_numpy:
+            if not NUMPY_AVAILABLE:
+                raise RuntimeError("numpy not installed")
+            return {name: np.frombuffer(column, dtype=column.typecode) for name, column in result.items()}
+        return result
+    
+    def get_signal_names(self) -> List[str]:
+        """Alle Signale mit gespeicherten Werten (feste Spalten zuerst)."""
+        with self._read_conn() as conn:
+            names = [row[0] for row in conn.execute("SELECT name FROM signals ORDER BY signal_id")]
+        extra = [name for name in names if name not in SAMPLE_COLUMN_NAMES]
+        return list(SAMPLE_COLUMN_ORDER) + extra
+    
+    def iter_trips(
+        self,
+        synced: Optional[bool] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        finished: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Streamt Trips (als Dict) nach Startzeit.
+        
+        Args:
+            synced: Nur (nicht) synchronisierte Trips (None = alle)
+            start, end: Trips, die in diesem Zeitraum beginnen
+            finished: Nur abgeschlossene Trips
+        """
+        where = []
+        params: list = []
+        if synced is not None:
+            where.append("synced = ?")
+            params.append(1 if synced else 0)
+        if finished:
+            where.append("end_ts IS NOT NULL")
+        if start is not None:
+            where.append("start_ts >= ?")
+            params.append(to_epoch_ms(start))
+        if end is not None:
+            where.append("start_ts <= ?")
+            params.append(to_epoch_ms(end))
+        
+        sql = "SELECT * FROM trips"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY start_ts ASC"
+        
+        with self._read_conn() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(100)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
+    
+    def get_signal_values(
+        self,
+        name: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        Verlauf eines Signals als Liste von (ts, value), ts in Epoch-ms.
+        
+        Funktioniert für feste Spalten und für Signale in sample_values.
+        Der Zeitraum wird direkt auf samples.ts gefiltert (nicht über
+        sample_id, die nach einem Uhrsprung nicht mehr zu ts passt).
+        """
+        start_ts = to_epoch_ms(start) if start else 0
+        end_ts = to_epoch_ms(end) if end else 2 ** 62
+        
+        with self._get_conn() as conn:
+            if name in SAMPLE_COLUMN_NAMES:
+                cursor = conn.execute(f"""
+                    SELECT ts, {name} FROM samples
+                    WHERE ts BETWEEN ? AND ? AND {name} IS NOT NULL
+                    ORDER BY ts ASC
+                """, (start_ts, end_ts))
+                return [tuple(row) for row in cursor]
+            
+            row = conn.execute("SELECT signal_id FROM signals WHERE name = ?", (name,)).fetchone()
+            if row is None:
+                return []
+            
+            cursor = conn.execute("""
+                SELECT s.ts, v.value
+                FROM samples s
+                JOIN sample_values v ON v.sample_id = s.sample_id AND v.signal_id = ?
+                WHERE s.ts BETWEEN ? AND ?
+                ORDER BY s.ts ASC, s.sample_id ASC
+            """, (row[0], start_ts, end_ts))
+            return [tuple(row) for row in cursor]
+    
+    def get_signal_history(
+        self,
+        name: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        tier: Optional[str] = None
+    ) -> Tuple[str, List[Tuple[int, float, float, float, float]]]:
+        """
+        Verlauf eines Signals aus der passenden Stufe (z.B. SOH über 2 Jahre
+        aus rollup_1h statt aus den Rohdaten).
+        
+        Args:
+            tier: "samples", "rollup_1m" oder "rollup_1h"; None = automatisch
+                  nach Zeitspanne und Aufbewahrung
+        
+        Returns:
+            (Stufe, Liste von (ts, min, max, avg, last)), ts in Epoch-ms;
+            bei Rohdaten sind alle vier Werte gleich
+        """
+        start_ts = to_epoch_ms(start) if start else 0
+        end_ts = to_epoch_ms(end) if end else to_epoch_ms(datetime.now())
+        if tier is None:
+            tier = self._select_tier(start_ts, end_ts)
+        
+        if tier == "samples":
+            return tier, [
+                (ts, value, value, value, value)
+                for ts, value in self.get_signal_values(name, start, end)
+            ]
+        if tier not in dict(ROLLUP_TIERS):
+            raise ValueError(f"Unknown tier: {tier}")
+        
+        with self._get_conn() as conn:
+            row = conn.execute("SELECT signal_id FROM signals WHERE name = ?", (name,)).fetchone()
+            if row is None:
+                return tier, []
+            cursor = conn.execute(f"""
+                SELECT bucket_ts, min, max, sum / count, last FROM {tier}
+                WHERE signal_id = ? AND bucket_ts BETWEEN ? AND ?
+                ORDER BY bucket_ts ASC
+            """, (row[0], start_ts, end_ts))
+            return tier, [tuple(row) for row in cursor]
+    
+    def _select_tier(self, start_ts: int, end_ts: int) -> str:
+        """Feinste Stufe, die die Zeitspanne abdeckt und deren Daten noch vorhanden sind."""
+        now_ts = to_epoch_ms(datetime.now())
+        for tier in ("samples",) + tuple(table for table, _ in ROLLUP_TIERS[:-1]):
+            days = self.retention_days.get(tier)
+            if days is not None and start_ts < now_ts - days * 24 * 3600 * 1000:
+                continue  # Anfang des Zeitraums ist in dieser Stufe schon gelöscht
+            if end_ts - start_ts <= TIER_MAX_SPAN_MS[tier]:
+                return tier
+        return ROLLUP_TIERS[-1][0]
     
     def mark_trip_synced(self, trip_id: int):
         """Markiert Trip als synchronisiert."""
@@ -349,47 +1372,26 @@ class DBManager:
         Holt die neuesten Total-statistics aus der DB.
         Wird beim Start verwendet um Remanenz zu gewährleisten.
         """
-        with self._get_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT consumption_total_wh_km, total_distance_km, 
-                       total_energy_kwh, total_count
-                FROM samples 
-                WHERE consumption_total_wh_km IS NOT NULL 
-                  AND total_count > 0
-                ORDER BY timestamp DESC 
-                LIMIT 1
-            """)
-            
-            row = cursor.fetchone()
-            if row:
-                return {
-                    'total_avg_consumption': row[0] or 0.0,
-                    'total_distance_km': row[1] or 0.0,
-                    'total_energy_kwh': row[2] or 0.0,
-                    'total_count': row[3] or 0
-                }
+        state = self.get_latest_state()
+        if not state.get("total_count"):
             return None
+        return {
+            'total_avg_consumption': state.get("consumption_total_wh_km") or 0.0,
+            'total_distance_km': state.get("total_distance_km") or 0.0,
+            'total_energy_kwh': state.get("total_energy_kwh") or 0.0,
+            'total_count': state.get("total_count") or 0
+        }
     
     def get_latest_soh(self) -> Optional[float]:
         """
         Holt den neuesten SOH-Wert aus der DB.
         Wird beim Start verwendet um Remanenz zu gewährleisten.
         """
-        with self._get_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT soh_pct
-                FROM samples 
-                WHERE soh_pct IS NOT NULL 
-                ORDER BY timestamp DESC 
-                LIMIT 1
-            """)
-            
-            row = cursor.fetchone()
-            if row:
-                return row[0]
-            return None
+        return self.get_latest_state().get("soh_pct")
+    
+    def get_latest_odo(self) -> float:
+        """Letzter Kilometerstand (0.0 wenn noch keiner gespeichert ist)."""
+        return self.get_latest_state().get("odo_km") or 0.0
     
     def get_lifetime_stats(self) -> Dict[str, Any]:
         """Berechnet Lifetime-statistics."""
@@ -403,7 +1405,7 @@ class DBManager:
                     AVG(avg_consumption_kwh_100km) as avg_consumption,
                     SUM(energy_used_kwh) as total_energy_kwh
                 FROM trips
-                WHERE end_time IS NOT NULL
+                WHERE end_ts IS NOT NULL
             """)
             
             row = cursor.fetchone()
@@ -417,57 +1419,74 @@ class DBManager:
     
     def cleanup_old_trips(self, days: int = 90):
         """
-        Löscht Trips älter als X Tage (nur wenn synced).
+        Löscht die Rohdaten (samples, sample_values) von Trips älter als
+        X Tage (nur wenn synced). Trip-Zeilen und Rollups bleiben erhalten.
         
         Args:
             days: Alter in Tagen (Standard: 90)
         
         Returns:
-            Tuple[int, int]: (gelöschte Trips, gelöschte Samples)
+            Tuple[int, int]: (bereinigte Trips, gelöschte Samples)
         """
         from datetime import timedelta
         
         cutoff = datetime.now() - timedelta(days=days)
         
         with self._get_conn() as conn:
-            cursor = conn.cursor()
-            
-            # Count affected entries
-            cursor.execute("""
-                SELECT COUNT(*) FROM trips 
-                WHERE synced = 1 AND end_time < ?
-            """, (cutoff.isoformat(),))
-            trips_count = cursor.fetchone()[0]
+            trip_ids = [row[0] for row in conn.execute("""
+                SELECT trip_id FROM trips t
+                WHERE synced = 1 AND end_ts < ?
+                  AND EXISTS (SELECT 1 FROM samples WHERE trip_id = t.trip_id)
+            """, (to_epoch_ms(cutoff),))]
             
-            cursor.execute("""
-                SELECT COUNT(*) FROM samples WHERE trip_id IN (
-                    SELECT trip_id FROM trips 
-                    WHERE synced = 1 AND end_time < ?
-                )
-            """, (cutoff.isoformat(),))
-            samples_count = cursor.fetchone()[0]
+            samples_count = 0
+            for trip_id in trip_ids:
+                conn.execute("""
+                    DELETE FROM sample_values WHERE sample_id IN (
+                        SELECT sample_id FROM samples WHERE trip_id = ?
+                    )
+                """, (trip_id,))
+                samples_count += conn.execute(
+                    "DELETE FROM samples WHERE trip_id = ?", (trip_id,)
+                ).rowcount
             
-            # Delete samples first (Foreign Key)
-            cursor.execute("""
-                DELETE FROM samples WHERE trip_id IN (
-                    SELECT trip_id FROM trips 
-                    WHERE synced = 1 AND end_time < ?
-                )
-            """, (cutoff.isoformat(),))
-            
-            # Delete trips
-            cursor.execute("""
-                DELETE FROM trips 
-                WHERE synced = 1 AND end_time < ?
-            """, (cutoff.isoformat(),))
-            
-            if trips_count > 0:
+            if trip_ids:
                 logger.info(
-                    f"Cleaned up {trips_count} trips and {samples_count} samples "
+                    f"Cleaned up {samples_count} samples of {len(trip_ids)} trips "
                     f"older than {days} days"
                 )
             
-            return trips_count, samples_count
+            return len(trip_ids), samples_count
+    
+    def apply_retention(self) -> Dict[str, int]:
+        """
+        Wendet retention_days auf alle Stufen an.
+        
+        Returns:
+            Gelöschte Zeilen pro Stufe
+        """
+        from datetime import timedelta
+        
+        deleted = {}
+        days = self.retention_days.get("samples")
+        if days is not None:
+            deleted["samples"] = self.cleanup_old_trips(days)[1]
+        
+        with self._get_conn() as conn:
+            for table, _ in ROLLUP_TIERS:
+                days = self.retention_days.get(table)
+                if days is None:
+                    continue
+                cutoff = to_epoch_ms(datetime.now() - timedelta(days=days))
+                # Pro Signal ein Range-Delete auf dem Primärschlüssel
+                deleted[table] = conn.execute(f"""
+                    DELETE FROM {table}
+                    WHERE signal_id IN (SELECT signal_id FROM signals) AND bucket_ts < ?
+                """, (cutoff,)).rowcount
+                if deleted[table]:
+                    logger.info(f"Removed {deleted[table]} rows older than {days} days from {table}")
+        
+        return deleted
     
     def vacuum(self):
         """VACUUM für Wartung."""
@@ -476,6 +1495,190 @@ class DBManager:
             logger.info("Database vacuumed")
 
 
+class SampleWriter:
+    """
+    Hintergrund-Thread, der Samples gebündelt in die Datenbank schreibt.
+    
+    Der UI-Thread legt Samples nur in eine begrenzte Queue (add_sample),
+    der Thread schreibt sie alle batch_size Samples oder spätestens nach
+    flush_interval Sekunden mit executemany in einer Transaktion. Ein
+    fsync-Hänger der SD-Karte blockiert damit nie die Anzeige.
+    
+    Trip-Ende und Flush laufen als Befehle durch dieselbe Queue und
+    werden daher in Reihenfolge mit den Samples ausgeführt. Ist die Queue
+    voll, werden neue Samples verworfen und mitgezählt.
+    """
+    
+    def __init__(
+        self,
+        db_manager: DBManager,
+        batch_size: int = 60,
+        flush_interval: float = 5.0,
+        max_queue: int = 3600,
+        error_backoff: float = 1.0
+    ):
+        self.db_manager = db_manager
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.error_backoff = error_backoff
+        
+        self.queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self.stop_event = threading.Event()
+        self.writer_thread: Optional[threading.Thread] = None
+        
+        # Statistiken
+        self.samples_queued = 0
+        self.samples_written = 0
+        self.samples_dropped = 0
+        self.batches_written = 0
+        self.write_errors = 0
+        self.max_backlog = 0
+        self.last_batch_ms = 0.0
+    
+    def start(self):
+        """Startet den Schreib-Thread."""
+        if self.writer_thread and self.writer_thread.is_alive():
+            return
+        
+        self.stop_event.clear()
+        self.writer_thread = threading.Thread(
+            target=self._writer_loop, name="db-writer", daemon=True
+        )
+        self.writer_thread.start()
+        logger.info(
+            f"Sample writer started (batch: {self.batch_size} samples / "
+            f"{self.flush_interval:.0f} s)"
+        )
+    
+    def stop(self, timeout: float = 10.0):
+        """Schreibt alle anstehenden Samples und stoppt den Thread."""
+        if self.writer_thread is None:
+            return
+        
+        self.stop_event.set()  # unterbricht ein laufendes Fehler-Backoff
+        self._put_command(("stop",), timeout)
+        self.writer_thread.join(timeout=timeout)
+        if self.writer_thread.is_alive():
+            logger.error(f"Sample writer did not stop, {self.queue.qsize()} samples not written")
+        self.writer_thread = None
+        logger.info("Sample writer stopped")
+    
+    def is_running(self) -> bool:
+        """True solange der Schreib-Thread läuft."""
+        return self.writer_thread is not None and self.writer_thread.is_alive()
+    
+    def add_sample(self, data: Dict[str, Any]):
+        """Reiht ein Sample ein (kehrt sofort zurück, Zeitstempel = jetzt)."""
+        try:
+            self.queue.put_nowait(("sample", datetime.now(), dict(data)))
+        except queue.Full:
+            self.samples_dropped += 1
+            if self.samples_dropped == 1 or self.samples_dropped % 100 == 0:
+                logger.warning(f"Sample queue full, {self.samples_dropped} samples dropped")
+            return
+        
+        self.samples_queued += 1
+        backlog = self.queue.qsize()
+        if backlog > self.max_backlog:
+            self.max_backlog = backlog
+    
+    def end_trip(self, **kwargs):
+        """Beendet den aktiven Trip nach allen bisher eingereihten Samples (Argumente wie DBManager.end_trip)."""
+        self._put_command(("end_trip", kwargs))
+    
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Schreibt alle eingereihten Samples und wartet darauf. False bei Timeout."""
+        if not self.is_running():
+            return False
+        done = threading.Event()
+        self._put_command(("flush", done), timeout)
+        return done.wait(timeout)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Zähler für Log und Diagnose."""
+        return {
+            "queued": self.samples_queued,
+            "written": self.samples_written,
+            "dropped": self.samples_dropped,
+            "batches": self.batches_written,
+            "errors": self.write_errors,
+            "backlog": self.queue.qsize(),
+            "max_backlog": self.max_backlog,
+            "last_batch_ms": self.last_batch_ms,
+        }
+    
+    def _put_command(self, command: tuple, timeout: float = 10.0):
+        """Befehle werden nie verworfen, notfalls wird auf Platz gewartet."""
+        try:
+            self.queue.put(command, timeout=timeout)
+        except queue.Full:
+            logger.error(f"Sample writer command '{command[0]}' timed out")
+    
+    def _writer_loop(self):
+        """Sammelt Samples bis Batch voll, Intervall abgelaufen oder Befehl."""
+        pending: List[Tuple[datetime, Dict[str, Any]]] = []
+        deadline = None
+        
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            
+            if item is not None and item[0] == "sample":
+                pending.append((item[1], item[2]))
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+                if len(pending) < self.batch_size:
+                    continue
+            
+            # Batch voll, Intervall abgelaufen oder Befehl: erst Samples schreiben
+            if pending:
+                self._write(pending)
+                pending = []
+            deadline = None
+            
+            if item is None or item[0] == "sample":
+                continue
+            
+            command = item[0]
+            if command == "end_trip":
+                self._end_trip(item[1])
+            elif command == "flush":
+                item[1].set()
+            elif command == "stop":
+                break
+    
+    def _write(self, pending: List[Tuple[datetime, Dict[str, Any]]]):
+        """
+        Schreibt einen Batch; bei Fehlern wird er verworfen (keine Endlosschleife).
+        Auch unerwartete Fehler (z.B. ein ungültiger Wert) beenden den Thread nicht.
+        """
+        start = time.perf_counter()
+        try:
+            written = self.db_manager.write_samples(pending)
+        except Exception:
+            self.write_errors += 1
+            logger.exception(f"Sample batch ({len(pending)} samples) not written")
+            self.stop_event.wait(self.error_backoff)
+            return
+        
+        self.samples_written += written
+        self.batches_written += 1
+        self.last_batch_ms = (time.perf_counter() - start) * 1000
+    
+    def _end_trip(self, kwargs: Dict[str, Any]):
+        """Trip-Ende im Schreib-Thread (nur wenn noch ein Trip läuft)."""
+        if self.db_manager.current_trip_id is None:
+            return
+        try:
+            self.db_manager.end_trip(**kwargs)
+        except Exception:
+            self.write_errors += 1
+            logger.exception("Could not end trip")
+
+
 # CLI Test
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
@@ -489,9 +1692,11 @@ if __name__ == "__main__":
     print("\n1. Starting trip...")
     db.start_trip(odo_km=12345.0, soc_pct=85.0)
     
-    print("2. Adding samples...")
+    print("2. Adding samples (SampleWriter)...")
+    writer = SampleWriter(db, batch_size=3)
+    writer.start()
     for i in range(5):
-        db.add_sample({
+        writer.add_sample({
             "speed_kmh": 50.0 + i * 5,
             "soc_pct": 85.0 - i * 2,
             "voltage_V": 330.0,
@@ -504,13 +1709,15 @@ if __name__ == "__main__":
         })
     
     print("3. Ending trip...")
-    db.end_trip(
+    writer.end_trip(
         odo_km=12347.5,
         soc_pct=77.0,
         avg_consumption_wh_km=150.0,
         avg_consumption_kwh_100km=15.0,
         stats={"max_power_kw": -8.5, "max_speed_kmh": 75.0}
     )
+    writer.stop()
+    print(f"   Writer: {writer.get_stats()}")
     
     print("\n4. Lifetime stats:")
     stats = db.get_lifetime_stats()
@@ -518,4 +1725,5 @@ if __name__ == "__main__":
     print(f"   Total: {stats['total_km']:.1f} km")
     print(f"   Avg: {stats['avg_consumption_kwh_100km']:.1f} kWh/100km")
     
+    db.close()
     print("\nTest complete!")
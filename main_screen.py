@@ -4,8 +4,8 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
-from widgets import PowerGauge, DigitalDisplay, BatteryBar, StatusBar, GearDisplay
-from translations import get_translator
+from widgets import PowerGauge, DigitalDisplay, BatteryBar, StatusBar, GearDisplay, set_label_text
+from translations import get_translator, TranslatedTexts
 
 
 class MainScreen(QWidget):
@@ -22,12 +22,11 @@ class MainScreen(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.translator = get_translator()
+        self.texts = TranslatedTexts(self.translator)
         self._init_ui()
     
     def _init_ui(self):
         """Erstellt UI-Layout."""
-        t = self.translator.get
-        
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(10, 10, 10, 10)
         main_layout.setSpacing(10)
@@ -75,7 +74,7 @@ class MainScreen(QWidget):
         left_col = QVBoxLayout()
         left_col.setSpacing(5)
         
-        self.range_display = DigitalDisplay(t("range"), "km")
+        self.range_display = self.texts.add(DigitalDisplay("", "km"), "range", setter="set_label")
         self.range_display.set_color(self._get_color("cyan"))
         self.range_display.set_decimals(0)
         left_col.addWidget(self.range_display)
@@ -84,12 +83,12 @@ class MainScreen(QWidget):
         consumption_layout = QHBoxLayout()
         consumption_layout.setSpacing(5)
         
-        self.consumption_now_display = DigitalDisplay(t("consumption_now"), "kWh/100km")
+        self.consumption_now_display = self.texts.add(DigitalDisplay("", "kWh/100km"), "consumption_now", setter="set_label")
         self.consumption_now_display.set_color(self._get_color("yellow"))
         self.consumption_now_display.set_decimals(1)
         consumption_layout.addWidget(self.consumption_now_display)
         
-        self.consumption_avg_display = DigitalDisplay(t("consumption_avg"), "kWh/100km")
+        self.consumption_avg_display = self.texts.add(DigitalDisplay("", "kWh/100km"), "consumption_avg", setter="set_label")
         self.consumption_avg_display.set_color(self._get_color("orange"))
         self.consumption_avg_display.set_decimals(1)
         consumption_layout.addWidget(self.consumption_avg_display)
@@ -102,7 +101,7 @@ class MainScreen(QWidget):
         right_col = QVBoxLayout()
         right_col.setSpacing(5)
         
-        soc_label = QLabel(t("charge_state"))
+        soc_label = self.texts.add(QLabel(), "charge_state")
         soc_label.setFont(QFont("Arial", 14))
         soc_label.setStyleSheet("color: #aaaaaa;")
         soc_label.setAlignment(Qt.AlignCenter)
@@ -124,9 +123,40 @@ class MainScreen(QWidget):
         
         self.setLayout(main_layout)
     
+    def _bindings(self):
+        """Widget-Bindungen: (State-Keys, Callback mit den Werten in Key-Reihenfolge)."""
+        return [
+            ("speed_kmh", self._on_speed),
+            ("gear", self._on_gear),
+            ("power_kW", self._on_power),
+            ("range_km", self._on_range),
+            ("consumption_kwh_100km", self._on_consumption_now),
+            ("consumption_trip_kwh_100km", self._on_consumption_avg),
+            ("soc_pct", self._on_soc),
+            ("soh_pct", self._on_soh),
+        ]
+    
+    def bind(self, state) -> list:
+        """
+        Bindet die Widgets an den VehicleState (Publish/Subscribe).
+        Gibt die Abos zurück, damit der Dashboard sie pausieren kann.
+        """
+        subscriptions = self.status_bar.bind(state)
+        for keys, callback in self._bindings():
+            subscriptions.append(state.subscribe(keys, callback))
+        return subscriptions
+    
+    def retranslate(self):
+        """
+        Setzt die Texte nach einem Sprachwechsel neu (Widgets und Werte
+        bleiben erhalten; wertabhängige Texte liefert der Dashboard per
+        State-Abo neu aus).
+        """
+        self.texts.retranslate()
+    
     def update_data(self, state: dict):
         """
-        Aktualisiert Anzeige mit neuen Daten.
+        Aktualisiert Anzeige mit einem kompletten State (ohne Abos, z.B. Test).
         
         Args:
             state: Dict mit keys: speed_kmh, power_kW, soc_pct, range_km,
@@ -138,40 +168,37 @@ class MainScreen(QWidget):
         if ambient_temp is not None:
             self.status_bar.set_ambient_temp(ambient_temp)
         
-        # Geschwindigkeit
-        speed = state.get("speed_kmh", 0.0)
-        self.speed_label.setText(f"{speed:.0f}")
-        
-        # Fahrmodus
-        gear = state.get("gear", "P")
-        self.gear_display.set_gear(gear)
-        
-        # Power Gauge
-        power = state.get("power_kW", 0.0)
-        self.power_gauge.set_power(power)
-        
-        # Reichweite
-        range_km = state.get("range_km", 0.0)
-        self.range_display.set_value(range_km)
-        
-        # Verbrauch aktuell
-        consumption_now = state.get("consumption_kwh_100km", 0.0)
-        self.consumption_now_display.set_value(consumption_now)
-        
+        for keys, callback in self._bindings():
+            keys = (keys,) if isinstance(keys, str) else keys
+            callback(*[state.get(key) for key in keys])
+    
+    def _on_speed(self, speed):
+        set_label_text(self.speed_label, f"{speed or 0.0:.0f}")
+    
+    def _on_gear(self, gear):
+        self.gear_display.set_gear(gear if gear is not None else "P")
+    
+    def _on_power(self, power):
+        self.power_gauge.set_power(power or 0.0)
+    
+    def _on_range(self, range_km):
+        self.range_display.set_value(range_km or 0.0)
+    
+    def _on_consumption_now(self, consumption_now):
+        self.consumption_now_display.set_value(consumption_now or 0.0)
+    
+    def _on_consumption_avg(self, consumption_avg):
         # Verbrauch Durchschnitt (Trip)
-        consumption_avg = state.get("consumption_trip_kwh_100km", 0.0)
-        self.consumption_avg_display.set_value(consumption_avg)
-        
-        # SOC
-        soc = state.get("soc_pct", 0.0)
-        self.soc_bar.set_soc(soc)
-        
-        # SOH
-        soh = state.get("soh_pct")
+        self.consumption_avg_display.set_value(consumption_avg or 0.0)
+    
+    def _on_soc(self, soc):
+        self.soc_bar.set_soc(soc or 0.0)
+    
+    def _on_soh(self, soh):
         if soh is not None:
-            self.soh_label.setText(f"SOH: {soh:.0f}%")
+            set_label_text(self.soh_label, f"SOH: {soh:.0f}%")
         else:
-            self.soh_label.setText("SOH: ---")
+            set_label_text(self.soh_label, "SOH: ---")
     
     def _get_color(self, name: str):
         """Helper für Farben."""
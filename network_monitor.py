@@ -0,0 +1,219 @@
+# network_monitor.py
+# WLAN-Status im Hintergrund ermitteln (ohne Subprozesse im UI-Thread)
+#
+# Liest /sys/class/net/<iface>/operstate und die IPv4-Adresse per ioctl.
+# Auf Linux weckt ein Netlink-Socket den Thread sofort bei Link-/Adress-
+# Änderungen, zusätzlich wird mit niedriger Rate gepollt (Fallback).
+# Das Ergebnis wird gecacht, das Qt-Signal kommt nur bei Änderungen.
+
+import socket
+import struct
+import select
+import fcntl
+import logging
+import threading
+from typing import NamedTuple, Optional
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+
+# ioctl-Nummern (linux/sockios.h, linux/wireless.h)
+SIOCGIFADDR = 0x8915
+SIOCGIFNETMASK = 0x891B
+SIOCGIWESSID = 0x8B1B
+IW_ESSID_MAX_SIZE = 32
+
+# Netlink: Link- und IPv4-Adress-Änderungen (linux/rtnetlink.h)
+NETLINK_ROUTE = 0
+RTMGRP_LINK = 0x1
+RTMGRP_IPV4_IFADDR = 0x10
+
+
+class NetworkStatus(NamedTuple):
+    """Momentaufnahme eines Netzwerk-Interfaces."""
+    interface: str
+    present: bool = False            # Interface existiert
+    operstate: str = "unknown"       # up/down/dormant/... aus sysfs
+    ipv4: Optional[str] = None       # z.B. "10.42.0.214/24"
+    ssid: Optional[str] = None       # Nur WLAN, None wenn unbekannt
+
+    @property
+    def connected(self) -> bool:
+        """Verbunden = Link nicht down und IPv4-Adresse vorhanden."""
+        return self.present and self.ipv4 is not None and self.operstate not in ("down", "dormant")
+
+
+def _ifreq(interface: str) -> bytes:
+    return struct.pack("256s", interface[:15].encode())
+
+
+def read_operstate(interface: str) -> Optional[str]:
+    """operstate aus sysfs, None wenn das Interface nicht existiert."""
+    try:
+        with open(f"/sys/class/net/{interface}/operstate", "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def read_ipv4(sock: socket.socket, interface: str) -> Optional[str]:
+    """IPv4-Adresse mit Präfixlänge (SIOCGIFADDR/SIOCGIFNETMASK), None ohne Adresse."""
+    try:
+        addr = fcntl.ioctl(sock.fileno(), SIOCGIFADDR, _ifreq(interface))[20:24]
+    except OSError:
+        return None
+    try:
+        mask = fcntl.ioctl(sock.fileno(), SIOCGIFNETMASK, _ifreq(interface))[20:24]
+        prefix = bin(int.from_bytes(mask, "big")).count("1")
+    except OSError:
+        return socket.inet_ntoa(addr)
+    return f"{socket.inet_ntoa(addr)}/{prefix}"
+
+
+def read_ssid(sock: socket.socket, interface: str) -> Optional[str]:
+    """SSID per Wireless-Extensions-ioctl (SIOCGIWESSID), None wenn nicht verfügbar."""
+    import ctypes
+    essid = ctypes.create_string_buffer(IW_ESSID_MAX_SIZE + 1)
+    # struct iwreq: ifname[16] + iw_point {void *pointer; __u16 length; __u16 flags}
+    request = bytearray(struct.pack(
+        "16sPHH", interface[:15].encode(), ctypes.addressof(essid), len(essid), 0
+    ))
+    request += bytes(max(0, 32 - len(request)))  # sizeof(struct iwreq)
+    try:
+        fcntl.ioctl(sock.fileno(), SIOCGIWESSID, request)
+    except OSError:
+        return None
+    ssid = essid.value.decode("utf-8", errors="replace")
+    return ssid or None
+
+
+class NetworkMonitor(QObject):
+    """
+    Überwacht ein Netzwerk-Interface in einem Hintergrund-Thread.
+
+    status enthält immer den zuletzt ermittelten Zustand (Lesen ohne
+    Systemaufruf), status_changed wird nur bei Änderungen emittiert.
+    Da das Signal aus dem Thread kommt, stellt Qt es den Empfängern
+    (QObject-Slots) im UI-Thread zu.
+    """
+
+    status_changed = pyqtSignal(object)  # NetworkStatus
+
+    def __init__(self, interface: str = "wlan0", poll_interval: float = 5.0):
+        super().__init__()
+        self.interface = interface
+        self.poll_interval = poll_interval
+        self.status = NetworkStatus(interface)
+
+        self.stop_event = threading.Event()
+        self.refresh_event = threading.Event()
+        self.monitor_thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Startet den Überwachungs-Thread."""
+        if self.monitor_thread and self.monitor_thread.is_alive():
+            return
+
+        self.stop_event.clear()
+        self.monitor_thread = threading.Thread(
+            target=self._monitor_loop, name="network-monitor", daemon=True
+        )
+        self.monitor_thread.start()
+        logger.info(f"Network monitor started for {self.interface}")
+
+    def stop(self, timeout: float = 2.0):
+        """Stoppt den Überwachungs-Thread."""
+        self.stop_event.set()
+        self.refresh_event.set()
+        if self.monitor_thread:
+            self.monitor_thread.join(timeout=timeout)
+            self.monitor_thread = None
+        logger.info("Network monitor stopped")
+
+    def refresh(self):
+        """Fordert eine sofortige Prüfung an (z.B. nach WLAN-Konfiguration)."""
+        self.refresh_event.set()
+
+    def is_connected(self) -> bool:
+        """Gecachter Verbindungsstatus (kein Systemaufruf)."""
+        return self.status.connected
+
+    def read_status(self, sock: socket.socket) -> NetworkStatus:
+        """Ermittelt den aktuellen Zustand (läuft im Monitor-Thread)."""
+        operstate = read_operstate(self.interface)
+        if operstate is None:
+            return NetworkStatus(self.interface)
+
+        ipv4 = read_ipv4(sock, self.interface)
+        ssid = read_ssid(sock, self.interface) if ipv4 else None
+        return NetworkStatus(self.interface, True, operstate, ipv4, ssid)
+
+    def _open_netlink(self) -> Optional[socket.socket]:
+        """Netlink-Socket für Link-/Adress-Events, None wenn nicht verfügbar."""
+        try:
+            nl = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_ROUTE)
+            nl.bind((0, RTMGRP_LINK | RTMGRP_IPV4_IFADDR))  # Port-ID vergibt der Kernel
+            nl.setblocking(False)
+            return nl
+        except (AttributeError, OSError) as e:
+            logger.info(f"Netlink not available ({e}), polling every {self.poll_interval}s")
+            return None
+
+    def _wait_for_change(self, nl: Optional[socket.socket]):
+        """Wartet auf Netlink-Event, refresh() oder das Poll-Intervall."""
+        if nl is None:
+            self.refresh_event.wait(self.poll_interval)
+        else:
+            # Kurze Schritte, damit refresh()/stop() ohne Netlink-Event greifen
+            waited = 0.0
+            while waited < self.poll_interval and not self.refresh_event.is_set():
+                readable, _, _ = select.select([nl], [], [], 0.5)
+                if readable:
+                    try:
+                        while nl.recv(65536):
+                            pass  # Alle anstehenden Events verwerfen
+                    except BlockingIOError:
+                        pass
+                    break
+                waited += 0.5
+        self.refresh_event.clear()
+
+    def _monitor_loop(self):
+        """Prüft den Status bis stop() aufgerufen wird."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        nl = self._open_netlink()
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    status = self.read_status(sock)
+                except Exception as e:
+                    logger.error(f"Network status error: {e}")
+                    status = NetworkStatus(self.interface)
+
+                if status != self.status:
+                    self.status = status
+                    logger.info(
+                        f"{self.interface}: {status.operstate}, "
+                        f"IP {status.ipv4 or '-'}, SSID {status.ssid or '-'}"
+                    )
+                    self.status_changed.emit(status)
+
+                self._wait_for_change(nl)
+        finally:
+            sock.close()
+            if nl is not None:
+                nl.close()
+
+
+# Globale Instanz
+_network_monitor: Optional[NetworkMonitor] = None
+
+
+def get_network_monitor() -> NetworkMonitor:
+    """Gibt die globale NetworkMonitor-Instanz zurück (wird beim ersten Aufruf erzeugt)."""
+    global _network_monitor
+    if _network_monitor is None:
+        _network_monitor = NetworkMonitor()
+    return _network_monitor
@@ -2,16 +2,387 @@
 # Live CAN-Bus Rohdaten und ID-Tabelle
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
-                              QLabel, QTextEdit, QTableWidget, QTableWidgetItem,
-                              QHeaderView, QSplitter)
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QFont, QTextCursor
-from widgets import StatusBar
-from translations import get_translator
+                              QLabel, QPlainTextEdit, QTableView,
+                              QHeaderView, QSplitter, QAbstractItemView)
+from PyQt5.QtCore import Qt, QTimer, QRect, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QFont, QColor, QPainter, QPen
+from widgets import StatusBar, set_label_text
+from translations import get_translator, TranslatedTexts
+import signal_db
+import bisect
+import math
+import time
+from array import array
 from collections import deque
 from datetime import datetime
 
 
+# Bekannte CAN-IDs und ihre Bedeutung (aus dem Signal-Katalog)
+KNOWN_CAN_IDS = {
+    msg.can_id: (msg.name, msg.description) for msg in signal_db.MESSAGES
+}
+
+
+class CANIdStats:
+    """
+    Laufende Statistik einer CAN-ID (inkrementell, O(1) pro Frame).
+    
+    Zykluszeit und Jitter sind exponentiell gleitende Mittelwerte über die
+    Abstände aufeinanderfolgender Frames (Mittelwert und Standardabweichung),
+    die Rate wird einmal pro Sekunde aus dem Zählerstand berechnet.
+    
+    Für die Byte-Diff-Ansicht wird pro Byte mitgezählt, wie oft es sich
+    geändert hat und wann zuletzt (array, nur bei geänderter Payload).
+    """
+    
+    __slots__ = ("can_id", "name", "content", "count", "last_time", "last_data",
+                 "cycle_ms", "jitter_ms", "rate", "rate_count", "known",
+                 "byte_changes", "byte_changed_at")
+    
+    # Gewicht eines neuen Abstands im gleitenden Mittel
+    ALPHA = 0.1
+    
+    # Klassischer CAN-Frame
+    MAX_BYTES = 8
+    
+    def __init__(self, can_id: int, name: str, content: str):
+        self.can_id = can_id
+        self.name = name
+        self.content = content
+        self.count = 0
+        self.last_time = None     # Zeitstempel des letzten Frames (s)
+        self.last_data = None
+        self.cycle_ms = None      # Mittlere Zykluszeit
+        self.jitter_ms = 0.0      # Standardabweichung der Zykluszeit
+        self.rate = 0.0           # Frames/s
+        self.rate_count = 0       # Zählerstand bei der letzten Ratenberechnung
+        self.known = True         # False = nicht im Signal-Katalog (Name = "unbekannt")
+        self.byte_changes = array("I", bytes(4 * self.MAX_BYTES))     # Änderungen je Byte
+        self.byte_changed_at = array("d", bytes(8 * self.MAX_BYTES))  # Letzte Änderung je Byte (s)
+    
+    def add(self, data, timestamp: float):
+        """Verbucht einen Frame."""
+        last_data = self.last_data
+        if last_data is not None and data != last_data:
+            # Nur bei geänderter Payload: betroffene Bytes suchen
+            changes = self.byte_changes
+            changed_at = self.byte_changed_at
+            for i in range(min(len(data), len(last_data), self.MAX_BYTES)):
+                if data[i] != last_data[i]:
+                    changes[i] += 1
+                    changed_at[i] = timestamp
+        if self.last_time is not None:
+            dt_ms = (timestamp - self.last_time) * 1000.0
+            if self.cycle_ms is None:
+                self.cycle_ms = dt_ms
+            else:
+                # Gleitender Mittelwert + Varianz (exponentiell gewichtet)
+                diff = dt_ms - self.cycle_ms
+                incr = self.ALPHA * diff
+                self.cycle_ms += incr
+                variance = (1.0 - self.ALPHA) * (self.jitter_ms * self.jitter_ms + diff * incr)
+                self.jitter_ms = math.sqrt(variance)
+        self.count += 1
+        self.last_time = timestamp
+        self.last_data = data
+    
+    def update_rate(self, interval: float):
+        """Frames/s seit dem letzten Aufruf (interval in Sekunden)."""
+        self.rate = (self.count - self.rate_count) / interval
+        self.rate_count = self.count
+    
+    def toggle_ratio(self, index: int) -> float:
+        """Anteil der Frames, in denen sich Byte index geändert hat (0..1)."""
+        if self.count < 2:
+            return 0.0
+        return self.byte_changes[index] / (self.count - 1)
+
+
+class CANIdTableModel(QAbstractTableModel):
+    """
+    Tabellen-Modell der CAN-IDs, nach ID sortiert.
+    
+    frame() aktualisiert nur die Statistik der ID (Dict-Zugriff) und merkt
+    die ID als geändert vor; flush() meldet alle Änderungen seit dem letzten
+    Aufruf mit einem einzigen dataChanged. Unbekannte IDs vom Bus bekommen
+    beim ersten Frame automatisch eine Zeile.
+    """
+    
+    COL_HEX, COL_DEC, COL_NAME, COL_CONTENT, COL_COUNT, COL_RATE, COL_CYCLE, COL_JITTER, COL_LAST = range(9)
+    HEADER_KEYS = ("can_id_hex", "can_id_dec", "name", "content", "frame_count",
+                   "frame_rate", "cycle_time", "jitter", "last_update")
+    # Spalten, die sich mit jedem Frame ändern
+    FIRST_LIVE_COL = COL_COUNT
+    
+    def __init__(self, known_ids: dict, unknown_name: str = "?", parent=None):
+        super().__init__(parent)
+        self.unknown_name = unknown_name
+        self.headers = list(self.HEADER_KEYS)
+        
+        self.ids = sorted(known_ids)                          # Zeile -> CAN-ID
+        self.stats = {can_id: CANIdStats(can_id, *known_ids[can_id]) for can_id in self.ids}
+        self.row_of = {can_id: row for row, can_id in enumerate(self.ids)}
+        self.dirty = set()                                    # Geänderte IDs seit flush()
+        self.total_frames = 0
+        self.active_ids = 0                                   # IDs mit mindestens einem Frame
+        
+        self.font_hex = QFont("Courier", 9, QFont.Bold)
+        self.font_name = QFont("Arial", 9, QFont.Bold)
+        self.colors = {
+            self.COL_HEX: QColor(Qt.cyan),
+            self.COL_DEC: QColor(Qt.lightGray),
+            self.COL_CONTENT: QColor(Qt.yellow),
+        }
+        self.color_live = QColor(Qt.green)
+        self.color_idle = QColor(Qt.gray)
+    
+    def set_headers(self, headers):
+        """Spaltenüberschriften (übersetzt)."""
+        self.headers = list(headers)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self.headers) - 1)
+    
+    # --- Daten ---
+    
+    def frame(self, can_id: int, data, timestamp: float):
+        """Verbucht einen Frame (ohne Signal an die View)."""
+        stats = self.stats.get(can_id)
+        if stats is None:
+            stats = self._insert_id(can_id)
+        if stats.count == 0:
+            self.active_ids += 1
+        stats.add(data, timestamp)
+        self.total_frames += 1
+        self.dirty.add(can_id)
+    
+    def _insert_id(self, can_id: int) -> CANIdStats:
+        """Neue Zeile für eine unbekannte ID (sortiert einfügen)."""
+        row = bisect.bisect_left(self.ids, can_id)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.ids.insert(row, can_id)
+        stats = CANIdStats(can_id, self.unknown_name, "---")
+        stats.known = False
+        self.stats[can_id] = stats
+        for r in range(row, len(self.ids)):
+            self.row_of[self.ids[r]] = r
+        self.endInsertRows()
+        return stats
+    
+    def update_rates(self, interval: float):
+        """Frames/s aller IDs neu berechnen; gibt die Gesamtrate zurück."""
+        total = 0.0
+        for stats in self.stats.values():
+            if stats.count != stats.rate_count or stats.rate:
+                stats.update_rate(interval)
+                self.dirty.add(stats.can_id)
+            total += stats.rate
+        return total
+    
+    def set_unknown_name(self, name: str):
+        """Name der nicht katalogisierten IDs (übersetzt)."""
+        self.unknown_name = name
+        for stats in self.stats.values():
+            if not stats.known:
+                stats.name = name
+        if self.ids:
+            self.dataChanged.emit(
+                self.index(0, self.COL_NAME), self.index(len(self.ids) - 1, self.COL_NAME)
+            )
+    
+    def stats_at(self, row: int) -> CANIdStats:
+        """Statistik der ID in Zeile row."""
+        return self.stats[self.ids[row]]
+    
+    def flush(self):
+        """Ein dataChanged über alle seit dem letzten Aufruf geänderten Zeilen."""
+        if not self.dirty:
+            return
+        rows = [self.row_of[can_id] for can_id in self.dirty]
+        self.dirty.clear()
+        self.dataChanged.emit(
+            self.index(min(rows), self.FIRST_LIVE_COL),
+            self.index(max(rows), self.COL_LAST)
+        )
+    
+    # --- QAbstractTableModel ---
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.ids)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADER_KEYS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        stats = self.stats[self.ids[index.row()]]
+        col = index.column()
+        
+        if role == Qt.DisplayRole:
+            return self._display(stats, col)
+        if role == Qt.ForegroundRole:
+            if col == self.COL_LAST:
+                return self.color_live if stats.count else self.color_idle
+            return self.colors.get(col)
+        if role == Qt.FontRole:
+            if col == self.COL_HEX:
+                return self.font_hex
+            if col == self.COL_NAME:
+                return self.font_name
+            return None
+        if role == Qt.TextAlignmentRole and col >= self.COL_COUNT and col != self.COL_LAST:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+    
+    def _display(self, stats: CANIdStats, col: int) -> str:
+        """Zellentext (wird nur für sichtbare Zellen abgefragt)."""
+        if col == self.COL_HEX:
+            return f"0x{stats.can_id:03X}"
+        if col == self.COL_DEC:
+            return f"{stats.can_id}"
+        if col == self.COL_NAME:
+            return stats.name
+        if col == self.COL_CONTENT:
+            return stats.content
+        if col == self.COL_COUNT:
+            return f"{stats.count}"
+        if col == self.COL_RATE:
+            return f"{stats.rate:.1f}"
+        if col == self.COL_CYCLE:
+            return "---" if stats.cycle_ms is None else f"{stats.cycle_ms:.1f}"
+        if col == self.COL_JITTER:
+            return "---" if stats.cycle_ms is None else f"{stats.jitter_ms:.1f}"
+        if col == self.COL_LAST:
+            if stats.last_time is None:
+                return "---"
+            return time.strftime("%H:%M:%S", time.localtime(stats.last_time))
+        return None
+
+
+class ByteDiffView(QWidget):
+    """
+    Byte-Ansicht der ausgewählten CAN-ID (zum Reverse-Engineering).
+    
+    Pro Byte: aktueller Wert (Hex), Hintergrund als Heatmap der
+    Änderungshäufigkeit (dunkel = konstant, rot = ändert sich in jedem
+    Frame) und ein gelber Rahmen, wenn sich das Byte in den letzten
+    HIGHLIGHT_MS geändert hat. Darunter die Anzahl der Änderungen.
+    
+    refresh() wird pro UI-Tick aufgerufen und löst nur dann ein Repaint
+    aus, wenn neue Frames da sind oder eine Markierung abläuft.
+    """
+    
+    HIGHLIGHT_MS = 500
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.stats = None            # CANIdStats der ausgewählten ID
+        self.hint = ""
+        self.painted_count = -1      # Frame-Zähler beim letzten Repaint
+        self.next_expiry = 0.0       # Nächste ablaufende Markierung (s), 0 = keine
+        
+        self.font_title = QFont("Courier", 10, QFont.Bold)
+        self.font_value = QFont("Courier", 14, QFont.Bold)
+        self.font_small = QFont("Arial", 8)
+        self.setMinimumHeight(90)
+    
+    def set_stats(self, stats):
+        """Zeigt die Bytes dieser ID (CANIdStats oder None)."""
+        self.stats = stats
+        self.painted_count = -1
+        self.update()
+    
+    def set_hint(self, hint: str):
+        """Text, solange keine ID ausgewählt ist."""
+        self.hint = hint
+        if self.stats is None:
+            self.update()
+    
+    def refresh(self, now: float):
+        """Repaint nur bei neuen Frames oder ablaufender Markierung."""
+        stats = self.stats
+        if stats is None:
+            return
+        if stats.count != self.painted_count or (self.next_expiry and now >= self.next_expiry):
+            self.update()
+    
+    @staticmethod
+    def heat_color(ratio: float) -> QColor:
+        """Heatmap: dunkelgrau (konstant) -> rot (ändert sich ständig)."""
+        ratio = min(1.0, max(0.0, ratio)) ** 0.5  # Seltene Änderungen sichtbarer machen
+        return QColor(
+            int(0x22 + (0xc0 - 0x22) * ratio),
+            int(0x22 + (0x10 - 0x22) * ratio),
+            int(0x22 + (0x10 - 0x22) * ratio),
+        )
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(0x11, 0x11, 0x11))
+        
+        stats = self.stats
+        if stats is None:
+            painter.setFont(self.font_small)
+            painter.setPen(QColor(Qt.gray))
+            painter.drawText(self.rect(), Qt.AlignCenter, self.hint)
+            return
+        
+        now = time.time()
+        highlight_s = self.HIGHLIGHT_MS / 1000.0
+        self.painted_count = stats.count
+        self.next_expiry = 0.0
+        
+        # Titel
+        title_h = 18
+        painter.setFont(self.font_title)
+        painter.setPen(QColor(Qt.cyan))
+        painter.drawText(
+            QRect(6, 0, self.width() - 12, title_h), Qt.AlignLeft | Qt.AlignVCenter,
+            f"0x{stats.can_id:03X}  {stats.name}  ({stats.count} Frames)"
+        )
+        
+        data = stats.last_data
+        length = 0 if data is None else min(len(data), stats.MAX_BYTES)
+        cell_w = self.width() // stats.MAX_BYTES
+        cell_h = self.height() - title_h
+        
+        for i in range(stats.MAX_BYTES):
+            rect = QRect(i * cell_w + 3, title_h + 2, cell_w - 6, cell_h - 4)
+            if i >= length:
+                painter.setPen(QPen(QColor(0x33, 0x33, 0x33), 1))
+                painter.setBrush(Qt.NoBrush)
+                painter.drawRect(rect)
+                continue
+            
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self.heat_color(stats.toggle_ratio(i)))
+            painter.drawRect(rect)
+            
+            changed_at = stats.byte_changed_at[i]
+            if changed_at and now - changed_at < highlight_s:
+                painter.setPen(QPen(QColor(Qt.yellow), 3))
+                painter.setBrush(Qt.NoBrush)
+                painter.drawRect(rect.adjusted(1, 1, -1, -1))
+                expiry = changed_at + highlight_s
+                if not self.next_expiry or expiry < self.next_expiry:
+                    self.next_expiry = expiry
+            
+            painter.setFont(self.font_value)
+            painter.setPen(QColor(Qt.white))
+            painter.drawText(rect.adjusted(0, 0, 0, -14), Qt.AlignCenter, f"{data[i]:02X}")
+            
+            painter.setFont(self.font_small)
+            painter.setPen(QColor(Qt.lightGray))
+            painter.drawText(
+                rect.adjusted(0, 0, 0, -2), Qt.AlignHCenter | Qt.AlignBottom,
+                f"B{i}: {stats.byte_changes[i]}x"
+            )
+
+
 class RawDataScreen(QWidget):
     """
     Rohdaten-Bildschirm.
@@ -19,51 +390,32 @@ class RawDataScreen(QWidget):
     Zeigt:
     - Live CAN-Traffic im Terminal-Stil (obere Hälfte)
     - Tabelle mit bekannten CAN-IDs (untere Hälfte)
+    
+    Frames werden in add_can_frame() nur gepuffert bzw. in der ID-Statistik
+    verbucht; refresh() schreibt sie einmal pro UI-Tick gesammelt ins
+    Terminal und in die Tabelle (nur solange der Screen sichtbar ist).
+    Das Terminal hält maximal TERMINAL_LINES Zeilen.
     """
     
-    # Bekannte CAN-IDs und ihre Bedeutung
-    KNOWN_CAN_IDS = {
-        0x210: ("Batterie Status 1", "SOC, Spannung, Strom"),
-        0x251: ("Batterie Status 2", "Ladezustand, Flags"),
-        0x301: ("Batterie Zellen 1-4", "Zellspannungen 1-4"),
-        0x302: ("Batterie Zellen 5-8", "Zellspannungen 5-8"),
-        0x303: ("Batterie Zellen 9-12", "Zellspannungen 9-12"),
-        0x304: ("Batterie Zellen 13-16", "Zellspannungen 13-16"),
-        0x305: ("Batterie Zellen 17-20", "Zellspannungen 17-20"),
-        0x306: ("Batterie Zellen 21-24", "Zellspannungen 21-24"),
-        0x307: ("Batterie Zellen 25-28", "Zellspannungen 25-28"),
-        0x308: ("Batterie Zellen 29-32", "Zellspannungen 29-32"),
-        0x309: ("Batterie Zellen 33-36", "Zellspannungen 33-36"),
-        0x30A: ("Batterie Zellen 37-40", "Zellspannungen 37-40"),
-        0x30B: ("Batterie Zellen 41-44", "Zellspannungen 41-44"),
-        0x30C: ("Batterie Zellen 45-48", "Zellspannungen 45-48"),
-        0x30D: ("Batterie Zellen 49-52", "Zellspannungen 49-52"),
-        0x30E: ("Batterie Zellen 53-56", "Zellspannungen 53-56"),
-        0x30F: ("Batterie Zellen 57-60", "Zellspannungen 57-60"),
-        0x310: ("Batterie Zellen 61-64", "Zellspannungen 61-64"),
-        0x311: ("Batterie Zellen 65-68", "Zellspannungen 65-68"),
-        0x312: ("Batterie Zellen 69-72", "Zellspannungen 69-72"),
-        0x313: ("Batterie Zellen 73-76", "Zellspannungen 73-76"),
-        0x314: ("Batterie Zellen 77-80", "Zellspannungen 77-80"),
-        0x315: ("Batterie Zellen 81-84", "Zellspannungen 81-84"),
-        0x316: ("Batterie Zellen 85-88", "Zellspannungen 85-88"),
-        0x4B0: ("Batterie Temperaturen", "Pack/Ambient/Inlet/Outlet Temp"),
-        0x495: ("Batterie Limits", "Max Lade-/Entladestrom"),
-        0x5E3: ("Motor Status", "Geschwindigkeit, Drehzahl"),
-        0x5E5: ("Motor Leistung", "Spannung, Strom, Leistung"),
-    }
+    # Maximale Zeilen im Terminal (= Größe des Frame-Puffers)
+    TERMINAL_LINES = 500
+    
+    # Intervall für Raten-Statistik (Sekunden)
+    STATS_INTERVAL = 1.0
+    
+    KNOWN_CAN_IDS = KNOWN_CAN_IDS
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.translator = get_translator()
-        self.can_buffer = deque(maxlen=500)  # Letzte 500 Frames
-        self.last_frames = {}  # {can_id: (timestamp, data, count)}
+        self.texts = TranslatedTexts(self.translator)
+        # Noch nicht ins Terminal geschriebene Frames (mehr als eine
+        # Terminal-Seite wird nie gebraucht, ältere fallen heraus)
+        self.pending_frames = deque(maxlen=self.TERMINAL_LINES)
+        self.id_model = CANIdTableModel(self.KNOWN_CAN_IDS, self.translator.get("unknown_can_id"))
+        self.stats_time = time.monotonic()
+        self.total_rate = 0.0
         self._init_ui()
-        
-        # Update timer for statistics
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self._update_stats)
-        self.update_timer.start(1000)  # Jede Sekunde
     
     def _init_ui(self):
         """Erstellt UI-Layout."""
@@ -78,7 +430,7 @@ class RawDataScreen(QWidget):
         main_layout.addWidget(self.status_bar)
         
         # ====== Titel ======
-        title = QLabel(t("raw_data"))
+        title = self.texts.add(QLabel(), "raw_data")
         title.setFont(QFont("Arial", 18, QFont.Bold))
         title.setStyleSheet("color: #00ffcc;")
         title.setAlignment(Qt.AlignCenter)
@@ -93,16 +445,18 @@ class RawDataScreen(QWidget):
         terminal_layout.setContentsMargins(0, 0, 0, 0)
         terminal_layout.setSpacing(3)
         
-        terminal_title = QLabel(t("live_can_traffic"))
+        terminal_title = self.texts.add(QLabel(), "live_can_traffic")
         terminal_title.setFont(QFont("Arial", 12, QFont.Bold))
         terminal_title.setStyleSheet("color: #00ff00;")
         terminal_layout.addWidget(terminal_title)
         
-        self.terminal = QTextEdit()
+        self.terminal = QPlainTextEdit()
         self.terminal.setReadOnly(True)
+        self.terminal.setUndoRedoEnabled(False)
+        self.terminal.setMaximumBlockCount(self.TERMINAL_LINES)  # Älteste Zeilen fallen heraus
         self.terminal.setFont(QFont("Courier", 9))
         self.terminal.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #000000;
                 color: #00ff00;
                 border: 2px solid #00ff00;
@@ -129,14 +483,14 @@ class RawDataScreen(QWidget):
         
         # Statistik-Zeile
         stats_layout = QHBoxLayout()
-        self.stats_label = QLabel(t("can_stats_default"))
+        self.stats_label = self.texts.add(QLabel(), "can_stats_default")
         self.stats_label.setFont(QFont("Arial", 9))
         self.stats_label.setStyleSheet("color: #888888;")
         stats_layout.addWidget(self.stats_label)
         
         stats_layout.addStretch()
         
-        clear_btn_label = QLabel(t("buffer_auto_clear"))
+        clear_btn_label = self.texts.add(QLabel(), "buffer_auto_clear")
         clear_btn_label.setFont(QFont("Arial", 9))
         clear_btn_label.setStyleSheet("color: #666666;")
         stats_layout.addWidget(clear_btn_label)
@@ -152,25 +506,27 @@ class RawDataScreen(QWidget):
         table_layout.setContentsMargins(0, 0, 0, 0)
         table_layout.setSpacing(3)
         
-        table_title = QLabel(t("known_can_ids"))
+        table_title = self.texts.add(QLabel(), "known_can_ids")
         table_title.setFont(QFont("Arial", 12, QFont.Bold))
         table_title.setStyleSheet("color: #ffaa00;")
         table_layout.addWidget(table_title)
         
-        self.id_table = QTableWidget()
-        self.id_table.setColumnCount(5)
-        self.id_table.setHorizontalHeaderLabels([
-            t("can_id_hex"), t("can_id_dec"), t("name"), t("content"), t("last_update")
-        ])
+        self.id_model.set_headers(t(key) for key in CANIdTableModel.HEADER_KEYS)
+        self.id_table = QTableView()
+        self.id_table.setModel(self.id_model)
+        self.id_table.verticalHeader().setVisible(False)
+        self.id_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.id_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.id_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.id_table.setFont(QFont("Arial", 9))
         self.id_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #111111;
                 color: #ffffff;
                 border: 2px solid #444444;
                 gridline-color: #333333;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
             }
             QHeaderView::section {
@@ -200,16 +556,20 @@ class RawDataScreen(QWidget):
         
         # Auto-resize Spalten
         header = self.id_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.Stretch)
-        header.setSectionResizeMode(3, QHeaderView.Stretch)
-        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)
+        # (Live-Spalten mit fester Breite, damit nicht jede Änderung ein
+        # Neuvermessen aller Zeilen auslöst)
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setSectionResizeMode(CANIdTableModel.COL_NAME, QHeaderView.Stretch)
+        header.setSectionResizeMode(CANIdTableModel.COL_CONTENT, QHeaderView.Stretch)
+        self.id_table.resizeColumnsToContents()
         
-        # Fill table
-        self._populate_id_table()
+        self.id_table.selectionModel().currentRowChanged.connect(self._on_id_selected)
+        table_layout.addWidget(self.id_table, 1)
         
-        table_layout.addWidget(self.id_table)
+        # Byte-Diff der ausgewählten ID
+        self.diff_view = ByteDiffView()
+        self.diff_view.set_hint(t("byte_diff_hint"))
+        table_layout.addWidget(self.diff_view)
         
         table_container.setLayout(table_layout)
         splitter.addWidget(table_container)
@@ -222,62 +582,25 @@ class RawDataScreen(QWidget):
         
         self.setLayout(main_layout)
     
-    def _populate_id_table(self):
-        """Füllt die CAN-ID Tabelle mit bekannten IDs."""
-        self.id_table.setRowCount(len(self.KNOWN_CAN_IDS))
-        
-        for row, (can_id, (name, content)) in enumerate(sorted(self.KNOWN_CAN_IDS.items())):
-            # CAN-ID Hex
-            hex_item = QTableWidgetItem(f"0x{can_id:03X}")
-            hex_item.setFont(QFont("Courier", 9, QFont.Bold))
-            hex_item.setForeground(Qt.cyan)
-            self.id_table.setItem(row, 0, hex_item)
-            
-            # CAN-ID Dezimal
-            dec_item = QTableWidgetItem(f"{can_id}")
-            dec_item.setForeground(Qt.lightGray)
-            self.id_table.setItem(row, 1, dec_item)
-            
-            # Name
-            name_item = QTableWidgetItem(name)
-            name_item.setFont(QFont("Arial", 9, QFont.Bold))
-            self.id_table.setItem(row, 2, name_item)
-            
-            # Inhalt
-            content_item = QTableWidgetItem(content)
-            content_item.setForeground(Qt.yellow)
-            self.id_table.setItem(row, 3, content_item)
-            
-            # Letzte Aktualisierung
-            time_item = QTableWidgetItem("---")
-            time_item.setForeground(Qt.gray)
-            self.id_table.setItem(row, 4, time_item)
-    
     def add_can_frame(self, can_id, data, timestamp=None):
         """
-        Fügt einen CAN-Frame zum Terminal hinzu.
+        Nimmt einen CAN-Frame entgegen (Anzeige erst mit refresh()).
         
         Args:
             can_id: CAN-ID (int)
             data: Daten als bytes oder list
-            timestamp: Optional timestamp
+            timestamp: Empfangszeit in Sekunden (Unix-Zeit), Default: jetzt
         """
-        if timestamp is None:
-            timestamp = datetime.now()
-        
-        # In Buffer speichern
-        self.can_buffer.append((timestamp, can_id, data))
+        if not timestamp:
+            timestamp = time.time()
         
-        # Statistik aktualisieren
-        if can_id in self.last_frames:
-            ts, old_data, count = self.last_frames[can_id]
-            self.last_frames[can_id] = (timestamp, data, count + 1)
-        else:
-            self.last_frames[can_id] = (timestamp, data, 1)
-        
-        # Formatiere Daten
-        if isinstance(data, bytes):
-            data_hex = ' '.join(f'{b:02X}' for b in data)
+        self.pending_frames.append((timestamp, can_id, data))
+        self.id_model.frame(can_id, data, timestamp)
+    
+    def _format_frame(self, timestamp, can_id, data) -> str:
+        """Formatierte Terminal-Zeile für einen Frame."""
+        if isinstance(data, (bytes, bytearray)):
+            data_hex = data.hex(" ").upper()
         elif isinstance(data, list):
             data_hex = ' '.join(f'{b:02X}' for b in data)
         else:
@@ -288,58 +611,78 @@ class RawDataScreen(QWidget):
         if can_id in self.KNOWN_CAN_IDS:
             name = f" ({self.KNOWN_CAN_IDS[can_id][0]})"
         
-        # Formatierte Zeile
-        time_str = timestamp.strftime("%H:%M:%S.%f")[:-3]
-        line = f"{time_str}  0x{can_id:03X}{name:<30}  [{len(data)}]  {data_hex}\n"
+        time_str = datetime.fromtimestamp(timestamp).strftime("%H:%M:%S.%f")[:-3]
+        return f"{time_str}  0x{can_id:03X}{name:<30}  [{len(data)}]  {data_hex}"
+    
+    def refresh(self):
+        """
+        Schreibt alle seit dem letzten Aufruf empfangenen Frames in einem
+        Block ins Terminal und meldet die geänderten Tabellenzeilen.
+        Terminal und Tabelle werden nur aktualisiert, solange der Screen
+        sichtbar ist; die Statistik läuft immer weiter.
+        """
+        now = time.monotonic()
+        interval = now - self.stats_time
+        if interval >= self.STATS_INTERVAL:
+            self.stats_time = now
+            self.total_rate = self.id_model.update_rates(interval)
+            if self.isVisible():
+                self._update_stats()
+        
+        if not self.isVisible():
+            return
         
-        # Add to terminal
-        self.terminal.moveCursor(QTextCursor.End)
-        self.terminal.insertPlainText(line)
-        self.terminal.moveCursor(QTextCursor.End)
+        self.id_model.flush()
+        self.diff_view.refresh(time.time())
         
-        # Update table (only for known IDs)
-        self._update_id_table_row(can_id, timestamp)
-    
-    def _update_id_table_row(self, can_id, timestamp):
-        """Aktualisiert Zeitstempel in der ID-Tabelle."""
-        if can_id not in self.KNOWN_CAN_IDS:
+        if not self.pending_frames:
             return
         
-        # Finde Row
-        for row in range(self.id_table.rowCount()):
-            hex_item = self.id_table.item(row, 0)
-            if hex_item and hex_item.text() == f"0x{can_id:03X}":
-                time_str = timestamp.strftime("%H:%M:%S")
-                time_item = QTableWidgetItem(time_str)
-                time_item.setForeground(Qt.green)
-                self.id_table.setItem(row, 4, time_item)
-                break
+        format_frame = self._format_frame
+        text = "\n".join([format_frame(*frame) for frame in self.pending_frames])
+        self.pending_frames.clear()
+        
+        # appendPlainText hängt einen Block an und scrollt mit, wenn das
+        # Terminal am Ende steht
+        self.terminal.appendPlainText(text)
+    
+    def showEvent(self, event):
+        # Beim Einblenden sofort den aufgelaufenen Verkehr zeigen
+        super().showEvent(event)
+        self._update_stats()
+        self.refresh()
+    
+    def _on_id_selected(self, current, previous):
+        """Zeile in der ID-Tabelle gewählt: Bytes dieser ID anzeigen."""
+        if current.isValid():
+            self.diff_view.set_stats(self.id_model.stats_at(current.row()))
+        else:
+            self.diff_view.set_stats(None)
     
     def _update_stats(self):
         """Aktualisiert Statistik-Anzeige."""
-        total_frames = len(self.can_buffer)
-        unique_ids = len(self.last_frames)
-        
-        # Frame-Rate berechnen (Frames der letzten Sekunde)
-        now = datetime.now()
-        recent_frames = [f for f in self.can_buffer 
-                        if (now - f[0]).total_seconds() < 1.0]
-        fps = len(recent_frames)
-        
-        self.stats_label.setText(f"Frames: {total_frames} | IDs: {unique_ids} | Rate: {fps:.1f} fps")
+        model = self.id_model
+        set_label_text(
+            self.stats_label,
+            f"Frames: {model.total_frames} | IDs: {model.active_ids} | Rate: {self.total_rate:.1f} fps"
+        )
     
-    def update(self, state):
+    def bind(self, state) -> list:
         """
-        Aktualisiert Screen mit neuem State.
-        
-        Hinweis: CAN-Frames werden direkt via add_can_frame() hinzugefügt,
-        nicht über update(). Diese Methode existiert für Konsistenz.
+        Bindet die Status-Bar an den VehicleState (Publish/Subscribe).
+        CAN-Frames kommen direkt über add_can_frame().
         """
-        # Status bar (complete state for error checking)
-        self.status_bar.set_state(state)
-        ambient_temp = state.get("pcu_ambient_temp_C")
-        if ambient_temp is not None:
-            self.status_bar.set_ambient_temp(ambient_temp)
+        return self.status_bar.bind(state)
+    
+    def retranslate(self):
+        """Setzt die Texte nach einem Sprachwechsel neu (Puffer und Statistik bleiben)."""
+        t = self.translator.get
+        self.texts.retranslate()
+        self.id_model.set_headers(t(key) for key in CANIdTableModel.HEADER_KEYS)
+        self.id_model.set_unknown_name(t("unknown_can_id"))
+        self.diff_view.set_hint(t("byte_diff_hint"))
+        self.diff_view.update()
+        self._update_stats()
 
 
 # Test
@@ -360,11 +703,15 @@ if __name__ == "__main__":
         can_id = random.choice(test_ids)
         data = bytes([random.randint(0, 255) for _ in range(8)])
         screen.add_can_frame(can_id, data)
+        screen.refresh()
     
     # Timer for test frames
     test_timer = QTimer()
     test_timer.timeout.connect(generate_test_frames)
     test_timer.start(100)  # 10 fps
     
+    # Byte-Diff für 0x210 anzeigen
+    screen.id_table.selectRow(screen.id_model.row_of[0x210])
+    
     screen.show()
     sys.exit(app.exec_())
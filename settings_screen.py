@@ -7,8 +7,10 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont
 from widgets import StatusBar
-from translations import get_translator
+from translations import get_translator, TranslatedTexts
+from network_monitor import get_network_monitor
 from trace_player import TracePlayer
+import signal_db
 import json
 import os
 
@@ -29,13 +31,19 @@ class SettingsScreen(QWidget):
         self.config_file = os.path.expanduser("~/thinkcity-dashboard-v3/config.json")
         self.settings = self.load_settings()
         self.translator = get_translator()
+        self.texts = TranslatedTexts(self.translator)
         self.translator.set_language(self.settings.get("language", "DE"))
+        self.network_monitor = get_network_monitor()
         self.init_ui()
         
+        # WLAN-Status live aus dem Hintergrund-Monitor (nur bei Änderungen)
+        self.network_monitor.status_changed.connect(self.update_wlan_status)
+        
     def load_settings(self):
         """Lade Settings aus JSON-Datei."""
         defaults = {
             "can_interface": "can0",
+            "can_filter_enabled": False,
             "simulation_mode": False,
             "nas_sync_enabled": False,
             "nas_host": "",
@@ -48,18 +56,7 @@ class SettingsScreen(QWidget):
             # Logging Settings
             "logging_enabled": True,
             "logging_interval_sec": 1,
-            "logging_fields": [
-                # Basic (commonly used)
-                "speed_kmh", "soc_pct", "voltage_V", "current_A", "power_kW",
-                "pack_temp_C", "ambient_temp_C", "consumption_wh_km", "range_km", "odo_km",
-                # EnerDel battery health
-                "e_pack_max_cell_V", "e_pack_min_cell_V", "e_pack_avg_cell_V", "e_pack_delta_cell_V",
-                "e_pack_max_temp_C", "e_pack_min_temp_C",
-                # Module voltages
-                "module1_voltage_V", "module2_voltage_V", "module3_voltage_V", "module4_voltage_V",
-                # Error flags (always useful for diagnostics)
-                "iso_error", "emergency", "sys_int_iso_error", "sys_ext_iso_error", "sys_thermal_iso_error"
-            ]
+            "logging_fields": list(signal_db.DEFAULT_LOGGING_FIELDS)
         }
         
         if os.path.exists(self.config_file):
@@ -85,8 +82,6 @@ class SettingsScreen(QWidget):
     
     def init_ui(self):
         """Erstelle UI."""
-        t = self.translator.get  # Shortcut for translations
-        
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(10, 10, 10, 10)
         main_layout.setSpacing(10)
@@ -100,7 +95,7 @@ class SettingsScreen(QWidget):
         title_layout.setContentsMargins(0, 0, 0, 0)
         
         # Titel
-        title = QLabel(t("settings"))
+        title = self.texts.add(QLabel(), "settings")
         title.setFont(QFont("Arial", 28, QFont.Bold))
         title.setAlignment(Qt.AlignCenter)
         title_layout.addWidget(title)
@@ -174,7 +169,7 @@ class SettingsScreen(QWidget):
         button_column.setContentsMargins(10, 0, 0, 0)
         
         # Save button
-        save_btn = QPushButton(t("save"))
+        save_btn = self.texts.add(QPushButton(), "save")
         save_btn.setFont(QFont("Arial", 18, QFont.Bold))
         save_btn.setMinimumSize(150, 100)
         save_btn.clicked.connect(self.on_save)
@@ -192,7 +187,7 @@ class SettingsScreen(QWidget):
         button_column.addWidget(save_btn)
         
         # Cancel button
-        cancel_btn = QPushButton(t("cancel"))
+        cancel_btn = self.texts.add(QPushButton(), "cancel")
         cancel_btn.setFont(QFont("Arial", 18, QFont.Bold))
         cancel_btn.setMinimumSize(150, 100)
         cancel_btn.clicked.connect(self.on_cancel)
@@ -212,7 +207,7 @@ class SettingsScreen(QWidget):
         button_column.addStretch()
         
         # Neustart Button
-        reboot_btn = QPushButton(t("reboot"))
+        reboot_btn = self.texts.add(QPushButton(), "reboot")
         reboot_btn.setFont(QFont("Arial", 16, QFont.Bold))
         reboot_btn.setMinimumSize(150, 90)
         reboot_btn.clicked.connect(self.on_reboot)
@@ -230,7 +225,7 @@ class SettingsScreen(QWidget):
         button_column.addWidget(reboot_btn)
         
         # Herunterfahren Button
-        shutdown_btn = QPushButton(t("shutdown"))
+        shutdown_btn = self.texts.add(QPushButton(), "shutdown")
         shutdown_btn.setFont(QFont("Arial", 16, QFont.Bold))
         shutdown_btn.setMinimumSize(150, 90)
         shutdown_btn.clicked.connect(self.on_shutdown)
@@ -298,14 +293,12 @@ class SettingsScreen(QWidget):
     
     def create_can_group(self):
         """CAN-Interface Settings."""
-        t = self.translator.get
-        
-        group = QGroupBox(t("can_interface"))
+        group = self.texts.add(QGroupBox(), "can_interface")
         layout = QVBoxLayout()
         
         # Interface Auswahl
         interface_layout = QHBoxLayout()
-        interface_layout.addWidget(QLabel(t("interface") + ":"))
+        interface_layout.addWidget(self.texts.add(QLabel(), "interface", "{}:"))
         
         self.can_combo = QComboBox()
         self.can_combo.addItems(["can0", "vcan0"])
@@ -314,14 +307,24 @@ class SettingsScreen(QWidget):
         layout.addLayout(interface_layout)
         
         # Simulation Mode
-        self.sim_checkbox = QCheckBox(t("simulation_mode_label"))
+        self.sim_checkbox = self.texts.add(QCheckBox(), "simulation_mode_label")
         self.sim_checkbox.setChecked(self.settings["simulation_mode"])
         layout.addWidget(self.sim_checkbox)
         
-        info = QLabel(t("simulation_info"))
+        info = self.texts.add(QLabel(), "simulation_info")
         info.setStyleSheet("color: #95a5a6; font-size: 12px;")
         layout.addWidget(info)
         
+        # Kernel-Filter (SocketCAN Acceptance-Filter)
+        self.can_filter_checkbox = self.texts.add(QCheckBox(), "can_filter_label")
+        self.can_filter_checkbox.setChecked(self.settings["can_filter_enabled"])
+        layout.addWidget(self.can_filter_checkbox)
+        
+        filter_info = self.texts.add(QLabel(), "can_filter_info")
+        filter_info.setStyleSheet("color: #95a5a6; font-size: 12px;")
+        filter_info.setWordWrap(True)
+        layout.addWidget(filter_info)
+        
         group.setLayout(layout)
         return group
     
@@ -329,28 +332,28 @@ class SettingsScreen(QWidget):
         """Network Settings (WLAN only)."""
         t = self.translator.get
         
-        group = QGroupBox(t("network_settings"))
+        group = self.texts.add(QGroupBox(), "network_settings")
         layout = QVBoxLayout()
         
         # === WLAN Configuration ===
-        wlan_label = QLabel(t("wlan_config"))
+        wlan_label = self.texts.add(QLabel(), "wlan_config")
         wlan_label.setStyleSheet("font-size: 14px; font-weight: bold; margin-top: 5px;")
         layout.addWidget(wlan_label)
         
         # SSID
         ssid_layout = QHBoxLayout()
-        ssid_layout.addWidget(QLabel(t("ssid") + ":"))
+        ssid_layout.addWidget(self.texts.add(QLabel(), "ssid", "{}:"))
         self.wifi_ssid = QLineEdit(self.settings.get("wifi_ssid", ""))
-        self.wifi_ssid.setPlaceholderText(t("ssid_placeholder"))
+        self.texts.add(self.wifi_ssid, "ssid_placeholder", setter="setPlaceholderText")
         ssid_layout.addWidget(self.wifi_ssid)
         layout.addLayout(ssid_layout)
         
         # Password with Show/Hide
         pwd_layout = QHBoxLayout()
-        pwd_layout.addWidget(QLabel(t("password") + ":"))
+        pwd_layout.addWidget(self.texts.add(QLabel(), "password", "{}:"))
         self.wifi_password = QLineEdit()
         self.wifi_password.setEchoMode(QLineEdit.Password)
-        self.wifi_password.setPlaceholderText(t("password_placeholder"))
+        self.texts.add(self.wifi_password, "password_placeholder", setter="setPlaceholderText")
         
         # Load encrypted WiFi password
         from crypto_utils import get_crypto
@@ -365,26 +368,26 @@ class SettingsScreen(QWidget):
         pwd_layout.addWidget(self.wifi_password)
         
         # Show/Hide Password Button
-        self.show_pwd_btn = QPushButton(t("show"))
+        self.show_pwd_btn = self.texts.add(QPushButton(), "show")
         self.show_pwd_btn.setMaximumWidth(60)
         self.show_pwd_btn.setCheckable(True)
         self.show_pwd_btn.clicked.connect(self.toggle_password_visibility)
         pwd_layout.addWidget(self.show_pwd_btn)
         layout.addLayout(pwd_layout)
         
-        pwd_info = QLabel(t("password_info"))
+        pwd_info = self.texts.add(QLabel(), "password_info")
         pwd_info.setStyleSheet("color: #95a5a6; font-size: 11px;")
         pwd_info.setWordWrap(True)
         layout.addWidget(pwd_info)
         
         # === IP Configuration ===
-        ip_label = QLabel(t("ip_config"))
+        ip_label = self.texts.add(QLabel(), "ip_config")
         ip_label.setStyleSheet("font-size: 14px; font-weight: bold; margin-top: 10px;")
         layout.addWidget(ip_label)
         
         # DHCP / Static
         ip_mode_layout = QHBoxLayout()
-        ip_mode_layout.addWidget(QLabel(t("ip_mode") + ":"))
+        ip_mode_layout.addWidget(self.texts.add(QLabel(), "ip_mode", "{}:"))
         self.ip_mode = QComboBox()
         self.ip_mode.addItems([t("dhcp_auto"), t("static_manual")])
         current_mode = self.settings.get("wlan_ip_mode", "dhcp")
@@ -400,41 +403,41 @@ class SettingsScreen(QWidget):
         
         # IP Address with CIDR
         ip_layout = QHBoxLayout()
-        ip_layout.addWidget(QLabel(t("ip_cidr") + ":"))
+        ip_layout.addWidget(self.texts.add(QLabel(), "ip_cidr", "{}:"))
         self.wlan_ip = QLineEdit(self.settings.get("wlan_ip", "10.42.0.214/24"))
-        self.wlan_ip.setPlaceholderText(t("ip_placeholder"))
+        self.texts.add(self.wlan_ip, "ip_placeholder", setter="setPlaceholderText")
         ip_layout.addWidget(self.wlan_ip)
         static_layout.addLayout(ip_layout)
         
         # Gateway
         gw_layout = QHBoxLayout()
-        gw_layout.addWidget(QLabel(t("gateway") + ":"))
+        gw_layout.addWidget(self.texts.add(QLabel(), "gateway", "{}:"))
         self.wlan_gateway = QLineEdit(self.settings.get("wlan_gateway", "10.42.0.1"))
-        self.wlan_gateway.setPlaceholderText(t("gateway_placeholder"))
+        self.texts.add(self.wlan_gateway, "gateway_placeholder", setter="setPlaceholderText")
         gw_layout.addWidget(self.wlan_gateway)
         static_layout.addLayout(gw_layout)
         
         # DNS1
         dns1_layout = QHBoxLayout()
-        dns1_layout.addWidget(QLabel(t("dns1") + ":"))
+        dns1_layout.addWidget(self.texts.add(QLabel(), "dns1", "{}:"))
         self.wlan_dns1 = QLineEdit(self.settings.get("wlan_dns1", "8.8.8.8"))
-        self.wlan_dns1.setPlaceholderText(t("dns1_placeholder"))
+        self.texts.add(self.wlan_dns1, "dns1_placeholder", setter="setPlaceholderText")
         dns1_layout.addWidget(self.wlan_dns1)
         static_layout.addLayout(dns1_layout)
         
         # DNS2
         dns2_layout = QHBoxLayout()
-        dns2_layout.addWidget(QLabel(t("dns2") + ":"))
+        dns2_layout.addWidget(self.texts.add(QLabel(), "dns2", "{}:"))
         self.wlan_dns2 = QLineEdit(self.settings.get("wlan_dns2", "8.8.4.4"))
-        self.wlan_dns2.setPlaceholderText(t("dns2_placeholder"))
+        self.texts.add(self.wlan_dns2, "dns2_placeholder", setter="setPlaceholderText")
         dns2_layout.addWidget(self.wlan_dns2)
         static_layout.addLayout(dns2_layout)
         
         # NTP Server
         ntp_layout = QHBoxLayout()
-        ntp_layout.addWidget(QLabel(t("ntp") + ":"))
+        ntp_layout.addWidget(self.texts.add(QLabel(), "ntp", "{}:"))
         self.wlan_ntp = QLineEdit(self.settings.get("wlan_ntp", "pool.ntp.org"))
-        self.wlan_ntp.setPlaceholderText(t("ntp_placeholder"))
+        self.texts.add(self.wlan_ntp, "ntp_placeholder", setter="setPlaceholderText")
         ntp_layout.addWidget(self.wlan_ntp)
         static_layout.addLayout(ntp_layout)
         
@@ -445,11 +448,11 @@ class SettingsScreen(QWidget):
         self.on_ip_mode_changed(self.ip_mode.currentIndex())
         
         # === WLAN Status ===
-        status_label = QLabel(t("wlan_status"))
+        status_label = self.texts.add(QLabel(), "wlan_status")
         status_label.setStyleSheet("font-size: 14px; font-weight: bold; margin-top: 10px;")
         layout.addWidget(status_label)
         
-        self.wlan_status = QLabel(t("status_loading"))
+        self.wlan_status = self.texts.add(QLabel(), "status_loading")
         self.wlan_status.setStyleSheet("color: #95a5a6; font-size: 12px;")
         self.wlan_status.setWordWrap(True)
         layout.addWidget(self.wlan_status)
@@ -458,7 +461,7 @@ class SettingsScreen(QWidget):
         self.update_wlan_status()
         
         # === Sync Setting ===
-        self.wifi_only_checkbox = QCheckBox(t("sync_wifi_only"))
+        self.wifi_only_checkbox = self.texts.add(QCheckBox(), "sync_wifi_only")
         self.wifi_only_checkbox.setChecked(self.settings.get("sync_on_wifi_only", True))
         self.wifi_only_checkbox.setStyleSheet("margin-top: 10px;")
         layout.addWidget(self.wifi_only_checkbox)
@@ -486,96 +489,108 @@ class SettingsScreen(QWidget):
             self.nas_password.setEchoMode(QLineEdit.Password)
             self.show_nas_pwd_btn.setText(t("show"))
     
+    def _update_interval_label(self, value):
+        t = self.translator.get
+        self.interval_label.setText(f"{t('log_interval')}: {value} {t('seconds')}")
+    
+    def retranslate(self):
+        """
+        Setzt alle Texte nach einem Sprachwechsel neu. Eingaben, laufende
+        Aufnahme und Replay bleiben erhalten.
+        """
+        t = self.translator.get
+        self.texts.retranslate()
+        
+        # Zustandsabhängige Texte
+        self.ip_mode.setItemText(0, t("dhcp_auto"))
+        self.ip_mode.setItemText(1, t("static_manual"))
+        self.language_combo.setItemText(0, t("language_german"))
+        self.language_combo.setItemText(1, t("language_english"))
+        self.show_pwd_btn.setText(t("hide") if self.show_pwd_btn.isChecked() else t("show"))
+        self.show_nas_pwd_btn.setText(t("hide") if self.show_nas_pwd_btn.isChecked() else t("show"))
+        self._update_interval_label(self.logging_interval_slider.value())
+        for field_name, checkbox in self.field_checkboxes.items():
+            checkbox.setText(signal_db.get_label(field_name, t))
+        self.update_wlan_status()
+        
+        if self.record_stop_btn.isEnabled():
+            self.recording_status_label.setText(f"[REC] {t('recording_active')}")
+            self._update_recording_stats()
+        self._update_recording_filename_preview()
+        self._update_storage_info()
+        
+        player = getattr(self, 'trace_player', None)
+        if player and player.is_playing and not player.is_paused:
+            self.trace_status_label.setText(t("replay_status_playing"))
+        for index in range(self.trace_combo.count()):
+            if not self.trace_combo.itemData(index):
+                self.trace_combo.setItemText(index, t("no_trace_selected") if index == 0 else t("no_traces_found"))
+    
     def on_ip_mode_changed(self, index):
         """Show/Hide static IP fields based on selection."""
         self.static_ip_container.setVisible(index == 1)  # Show only for Static
     
-    def update_wlan_status(self):
-        """Update WLAN connection status."""
-        import subprocess
+    def update_wlan_status(self, status=None):
+        """Update WLAN connection status (gecachter Zustand des NetworkMonitor)."""
         t = self.translator.get
+        if status is None:
+            status = self.network_monitor.status
         
-        try:
-            # Get WLAN device status
-            result = subprocess.run(
-                ["nmcli", "-t", "-f", "DEVICE,STATE,CONNECTION", "device", "status"],
-                capture_output=True, text=True, timeout=2
-            )
-            
+        if not status.present:
             status_text = t("wlan_not_connected")
-            for line in result.stdout.strip().split("\n"):
-                parts = line.split(":")
-                if len(parts) >= 3 and parts[0] == "wlan0":
-                    state = parts[1]
-                    connection = parts[2]
-                    
-                    if state == "connected":
-                        # Get IP address
-                        ip_result = subprocess.run(
-                            ["nmcli", "-t", "-f", "IP4.ADDRESS", "device", "show", "wlan0"],
-                            capture_output=True, text=True, timeout=2
-                        )
-                        ip_addr = "N/A"
-                        for ip_line in ip_result.stdout.strip().split("\n"):
-                            if ip_line.startswith("IP4.ADDRESS"):
-                                ip_addr = ip_line.split(":")[1] if ":" in ip_line else "N/A"
-                                break
-                        
-                        status_text = f"{t('wlan_connected')}: {connection}\nIP: {ip_addr}"
-                    elif state == "disconnected":
-                        status_text = t("wlan_disconnected")
-                    else:
-                        status_text = f"[!] {t('wlan_status')}: {state}"
-                    break
-            
+        elif status.connected:
+            connection = status.ssid or status.interface
+            status_text = f"{t('wlan_connected')}: {connection}\nIP: {status.ipv4}"
+        elif status.operstate in ("down", "dormant"):
+            status_text = t("wlan_disconnected")
+        else:
+            # Link oben, aber (noch) keine IPv4-Adresse, z.B. während DHCP
+            status_text = f"[!] {t('wlan_status')}: {status.operstate}"
+        
+        if self.wlan_status.text() != status_text:
             self.wlan_status.setText(status_text)
-            
-        except Exception as e:
-            self.wlan_status.setText(f"[!] {t('wlan_status')}: {str(e)}")
 
     
     def create_nas_group(self):
         """NAS Sync Settings."""
-        t = self.translator.get
-        
-        group = QGroupBox(t("nas_sync"))
+        group = self.texts.add(QGroupBox(), "nas_sync")
         layout = QVBoxLayout()
         
         # Enable Sync
-        self.nas_enable = QCheckBox(t("nas_enable"))
+        self.nas_enable = self.texts.add(QCheckBox(), "nas_enable")
         self.nas_enable.setChecked(self.settings["nas_sync_enabled"])
         layout.addWidget(self.nas_enable)
         
         # NAS Host
         host_layout = QHBoxLayout()
-        host_layout.addWidget(QLabel(t("nas_host") + ":"))
+        host_layout.addWidget(self.texts.add(QLabel(), "nas_host", "{}:"))
         self.nas_host = QLineEdit(self.settings["nas_host"])
-        self.nas_host.setPlaceholderText(t("nas_host_placeholder"))
+        self.texts.add(self.nas_host, "nas_host_placeholder", setter="setPlaceholderText")
         host_layout.addWidget(self.nas_host)
         layout.addLayout(host_layout)
         
         # NAS Path
         path_layout = QHBoxLayout()
-        path_layout.addWidget(QLabel(t("nas_path") + ":"))
+        path_layout.addWidget(self.texts.add(QLabel(), "nas_path", "{}:"))
         self.nas_path = QLineEdit(self.settings["nas_path"])
-        self.nas_path.setPlaceholderText(t("nas_path_placeholder"))
+        self.texts.add(self.nas_path, "nas_path_placeholder", setter="setPlaceholderText")
         path_layout.addWidget(self.nas_path)
         layout.addLayout(path_layout)
         
         # NAS User
         user_layout = QHBoxLayout()
-        user_layout.addWidget(QLabel(t("nas_user") + ":"))
+        user_layout.addWidget(self.texts.add(QLabel(), "nas_user", "{}:"))
         self.nas_user = QLineEdit(self.settings["nas_user"])
-        self.nas_user.setPlaceholderText(t("nas_user_placeholder"))
+        self.texts.add(self.nas_user, "nas_user_placeholder", setter="setPlaceholderText")
         user_layout.addWidget(self.nas_user)
         layout.addLayout(user_layout)
         
         # NAS Password with Show/Hide
         nas_pwd_layout = QHBoxLayout()
-        nas_pwd_layout.addWidget(QLabel(t("password") + ":"))
+        nas_pwd_layout.addWidget(self.texts.add(QLabel(), "password", "{}:"))
         self.nas_password = QLineEdit()
         self.nas_password.setEchoMode(QLineEdit.Password)
-        self.nas_password.setPlaceholderText(t("nas_password_placeholder"))
+        self.texts.add(self.nas_password, "nas_password_placeholder", setter="setPlaceholderText")
         
         # Load and decrypt existing password if available
         from crypto_utils import get_crypto
@@ -590,18 +605,18 @@ class SettingsScreen(QWidget):
         nas_pwd_layout.addWidget(self.nas_password)
         
         # Show/Hide Password Button
-        self.show_nas_pwd_btn = QPushButton(t("show"))
+        self.show_nas_pwd_btn = self.texts.add(QPushButton(), "show")
         self.show_nas_pwd_btn.setMaximumWidth(60)
         self.show_nas_pwd_btn.setCheckable(True)
         self.show_nas_pwd_btn.clicked.connect(self.toggle_nas_password_visibility)
         nas_pwd_layout.addWidget(self.show_nas_pwd_btn)
         layout.addLayout(nas_pwd_layout)
         
-        nas_pwd_info = QLabel(t("nas_password_info"))
+        nas_pwd_info = self.texts.add(QLabel(), "nas_password_info")
         nas_pwd_info.setStyleSheet("color: #95a5a6; font-size: 11px;")
         layout.addWidget(nas_pwd_info)
         
-        info = QLabel(t("nas_sync_info"))
+        info = self.texts.add(QLabel(), "nas_sync_info")
         info.setStyleSheet("color: #95a5a6; font-size: 12px;")
         layout.addWidget(info)
         
@@ -613,30 +628,31 @@ class SettingsScreen(QWidget):
         from PyQt5.QtWidgets import QSlider, QGridLayout
         t = self.translator.get
         
-        group = QGroupBox(t("data_logger"))
+        group = self.texts.add(QGroupBox(), "data_logger")
         layout = QVBoxLayout()
         
         # Info: Logging ist immer aktiv
-        info_label = QLabel(t("logging_always_active"))
+        info_label = self.texts.add(QLabel(), "logging_always_active")
         info_label.setStyleSheet("color: #95a5a6; font-size: 12px; font-style: italic;")
         layout.addWidget(info_label)
         
         # Datenbankpfad
         db_path_layout = QHBoxLayout()
-        db_path_layout.addWidget(QLabel(t("db_path") + ":"))
+        db_path_layout.addWidget(self.texts.add(QLabel(), "db_path", "{}:"))
         self.db_path = QLineEdit(self.settings["db_path"])
         db_path_layout.addWidget(self.db_path)
         layout.addLayout(db_path_layout)
         
-        db_info = QLabel(t("db_path_info"))
+        db_info = self.texts.add(QLabel(), "db_path_info")
         db_info.setStyleSheet("color: #95a5a6; font-size: 11px;")
         layout.addWidget(db_info)
         
         # Intervall-Slider
         interval_layout = QVBoxLayout()
-        interval_label = QLabel(f"{t('log_interval')}: {self.settings['logging_interval_sec']} {t('seconds')}")
-        interval_label.setStyleSheet("font-size: 14px; margin-top: 10px;")
-        interval_layout.addWidget(interval_label)
+        self.interval_label = QLabel()
+        self.interval_label.setStyleSheet("font-size: 14px; margin-top: 10px;")
+        self._update_interval_label(self.settings["logging_interval_sec"])
+        interval_layout.addWidget(self.interval_label)
         
         self.logging_interval_slider = QSlider(Qt.Horizontal)
         self.logging_interval_slider.setMinimum(1)
@@ -645,13 +661,10 @@ class SettingsScreen(QWidget):
         self.logging_interval_slider.setTickPosition(QSlider.TicksBelow)
         self.logging_interval_slider.setTickInterval(5)
         
-        def update_interval_label(value):
-            interval_label.setText(f"{t('log_interval')}: {value} {t('seconds')}")
-        
-        self.logging_interval_slider.valueChanged.connect(update_interval_label)
+        self.logging_interval_slider.valueChanged.connect(self._update_interval_label)
         interval_layout.addWidget(self.logging_interval_slider)
         
-        interval_info = QLabel(t("interval_info"))
+        interval_info = self.texts.add(QLabel(), "interval_info")
         interval_info.setStyleSheet("color: #95a5a6; font-size: 11px;")
         interval_info.setWordWrap(True)
         interval_layout.addWidget(interval_info)
@@ -659,54 +672,19 @@ class SettingsScreen(QWidget):
         layout.addLayout(interval_layout)
         
         # Datenpunkt-Auswahl
-        fields_label = QLabel(t("data_points") + ":")
+        fields_label = self.texts.add(QLabel(), "data_points", "{}:")
         fields_label.setStyleSheet("font-size: 14px; font-weight: bold; margin-top: 10px;")
         layout.addWidget(fields_label)
         
         # Permanently active fields (not deselectable)
-        permanent_label = QLabel(t("avg_consumption_permanent") + " + SOH")
+        permanent_label = self.texts.add(QLabel(), "avg_consumption_permanent", "{} + SOH")
         permanent_label.setStyleSheet("font-size: 12px; color: #95a5a6; font-style: italic; margin-left: 5px;")
         layout.addWidget(permanent_label)
         
-        # All available fields (organized by category)
+        # All available fields: Reihenfolge, Namen und Einheiten aus dem Signal-Katalog
         available_fields = {
-            # Basic driving data
-            "speed_kmh": t("field_speed"),
-            "soc_pct": t("field_soc"),
-            "range_km": t("field_range"),
-            "odo_km": t("field_odo"),
-            
-            # Power & Energy
-            "voltage_V": t("field_voltage"),
-            "current_A": t("field_current"),
-            "power_kW": t("field_power"),
-            "consumption_wh_km": t("field_consumption"),
-            
-            # Temperatures
-            "pack_temp_C": t("field_pack_temp"),
-            "ambient_temp_C": t("field_ambient_temp"),
-            "e_pack_max_temp_C": "EnerDel Max Temp (°C)",
-            "e_pack_min_temp_C": "EnerDel Min Temp (°C)",
-            
-            # Cell Voltages (EnerDel)
-            "e_pack_max_cell_V": "Zellspannung Max (V)",
-            "e_pack_min_cell_V": "Zellspannung Min (V)",
-            "e_pack_avg_cell_V": "Zellspannung Avg (V)",
-            "e_pack_delta_cell_V": "Zellspannung Delta (V)",
-            
-            # Module Voltages
-            "module1_voltage_V": "Modul 1 Spannung (V)",
-            "module2_voltage_V": "Modul 2 Spannung (V)",
-            "module3_voltage_V": "Modul 3 Spannung (V)",
-            "module4_voltage_V": "Modul 4 Spannung (V)",
-            "modules_total_V": "Module Gesamt (V)",
-            
-            # Error Flags
-            "iso_error": "ISO-Fehler",
-            "emergency": "Notfall",
-            "sys_int_iso_error": "System Int ISO-Fehler",
-            "sys_ext_iso_error": "System Ext ISO-Fehler",
-            "sys_thermal_iso_error": "System Thermal ISO-Fehler",
+            field_name: signal_db.get_label(field_name, t)
+            for field_name in signal_db.LOGGING_FIELDS
         }
         
         # Grid for checkboxes (2 columns)
@@ -734,12 +712,12 @@ class SettingsScreen(QWidget):
         # Buttons for all/none
         select_layout = QHBoxLayout()
         
-        select_all_btn = QPushButton(t("select_all"))
+        select_all_btn = self.texts.add(QPushButton(), "select_all")
         select_all_btn.setMaximumWidth(100)
         select_all_btn.clicked.connect(lambda: [cb.setChecked(True) for cb in self.field_checkboxes.values()])
         select_layout.addWidget(select_all_btn)
         
-        select_none_btn = QPushButton(t("select_none"))
+        select_none_btn = self.texts.add(QPushButton(), "select_none")
         select_none_btn.setMaximumWidth(100)
         select_none_btn.clicked.connect(lambda: [cb.setChecked(False) for cb in self.field_checkboxes.values()])
         select_layout.addWidget(select_none_btn)
@@ -754,12 +732,12 @@ class SettingsScreen(QWidget):
         """Language Settings."""
         t = self.translator.get
         
-        group = QGroupBox(t("language_settings"))
+        group = self.texts.add(QGroupBox(), "language_settings")
         layout = QVBoxLayout()
         
         # Language Selection
         lang_layout = QHBoxLayout()
-        lang_layout.addWidget(QLabel(t("language") + ":"))
+        lang_layout.addWidget(self.texts.add(QLabel(), "language", "{}:"))
         
         self.language_combo = QComboBox()
         self.language_combo.addItems([t("language_german"), t("language_english")])
@@ -774,14 +752,12 @@ class SettingsScreen(QWidget):
     
     def create_trip_computer_group(self):
         """Trip Computer Settings."""
-        t = self.translator.get
-        
-        group = QGroupBox(t("trip_computer"))
+        group = self.texts.add(QGroupBox(), "trip_computer")
         layout = QVBoxLayout()
         
         # Reset Consumption Button
         reset_consumption_layout = QHBoxLayout()
-        reset_consumption_btn = QPushButton(t("reset_consumption"))
+        reset_consumption_btn = self.texts.add(QPushButton(), "reset_consumption")
         reset_consumption_btn.setMinimumHeight(50)
         reset_consumption_btn.setStyleSheet("""
             QPushButton {
@@ -801,16 +777,14 @@ class SettingsScreen(QWidget):
         layout.addLayout(reset_consumption_layout)
         
         # Info text for consumption
-        info_consumption_label = QLabel(t("reset_consumption") + ": " + 
-                           ("Setzt den gespeicherten Durchschnittsverbrauch zurück" if t("language") == "DE" 
-                            else "Resets the stored average consumption"))
+        info_consumption_label = self.texts.add(QLabel(), "reset_consumption_info")
         info_consumption_label.setWordWrap(True)
         info_consumption_label.setStyleSheet("color: #888888; font-size: 11px; margin-bottom: 15px;")
         layout.addWidget(info_consumption_label)
         
         # Reset SOH Button
         reset_soh_layout = QHBoxLayout()
-        reset_soh_btn = QPushButton("SOH " + ("zurücksetzen" if t("language") == "DE" else "Reset"))
+        reset_soh_btn = self.texts.add(QPushButton(), "reset_soh")
         reset_soh_btn.setMinimumHeight(50)
         reset_soh_btn.setStyleSheet("""
             QPushButton {
@@ -830,9 +804,7 @@ class SettingsScreen(QWidget):
         layout.addLayout(reset_soh_layout)
         
         # Info text for SOH
-        info_soh_label = QLabel("SOH: " + 
-                           ("Setzt den State of Health auf 100% zurück (nach Batterietausch)" if t("language") == "DE" 
-                            else "Resets State of Health to 100% (after battery replacement)"))
+        info_soh_label = self.texts.add(QLabel(), "reset_soh_info")
         info_soh_label.setWordWrap(True)
         info_soh_label.setStyleSheet("color: #888888; font-size: 11px;")
         layout.addWidget(info_soh_label)
@@ -842,13 +814,11 @@ class SettingsScreen(QWidget):
     
     def create_can_trace_group(self):
         """Unified CAN Trace section with Recording and Replay."""
-        t = self.translator.get
-        
-        group = QGroupBox(t("can_trace"))
+        group = self.texts.add(QGroupBox(), "can_trace")
         main_layout = QVBoxLayout()
         
         # === Recording Section ===
-        recording_label = QLabel(t("trace_recording_section"))
+        recording_label = self.texts.add(QLabel(), "trace_recording_section")
         recording_label.setStyleSheet("font-size: 16px; font-weight: bold; margin-top: 5px; color: #3498db;")
         main_layout.addWidget(recording_label)
         
@@ -856,7 +826,7 @@ class SettingsScreen(QWidget):
         recording_layout.setContentsMargins(15, 5, 5, 10)
         
         # Status display
-        self.recording_status_label = QLabel(t("not_recording"))
+        self.recording_status_label = self.texts.add(QLabel(), "not_recording")
         self.recording_status_label.setStyleSheet("font-size: 14px; font-weight: bold; padding: 10px;")
         recording_layout.addWidget(self.recording_status_label)
         
@@ -866,15 +836,15 @@ class SettingsScreen(QWidget):
         stats_layout.setContentsMargins(10, 5, 10, 5)
         stats_layout.setSpacing(5)
         
-        self.recording_duration_label = QLabel(f"{t('duration')}: 00:00:00")
+        self.recording_duration_label = self.texts.add(QLabel(), "duration", "{}: 00:00:00")
         self.recording_duration_label.setStyleSheet("font-size: 12px; color: #888;")
         stats_layout.addWidget(self.recording_duration_label)
         
-        self.recording_messages_label = QLabel(f"{t('messages')}: 0")
+        self.recording_messages_label = self.texts.add(QLabel(), "messages", "{}: 0")
         self.recording_messages_label.setStyleSheet("font-size: 12px; color: #888;")
         stats_layout.addWidget(self.recording_messages_label)
         
-        self.recording_filesize_label = QLabel(f"{t('file_size')}: 0 KB")
+        self.recording_filesize_label = self.texts.add(QLabel(), "file_size", "{}: 0 KB")
         self.recording_filesize_label.setStyleSheet("font-size: 12px; color: #888;")
         stats_layout.addWidget(self.recording_filesize_label)
         
@@ -884,7 +854,7 @@ class SettingsScreen(QWidget):
         # Control buttons
         buttons_layout = QHBoxLayout()
         
-        self.record_start_btn = QPushButton(t("start_recording"))
+        self.record_start_btn = self.texts.add(QPushButton(), "start_recording")
         self.record_start_btn.setMinimumHeight(50)
         self.record_start_btn.setStyleSheet("""
             QPushButton {
@@ -906,7 +876,7 @@ class SettingsScreen(QWidget):
         self.record_start_btn.clicked.connect(self.on_start_recording)
         buttons_layout.addWidget(self.record_start_btn)
         
-        self.record_stop_btn = QPushButton(t("stop_recording"))
+        self.record_stop_btn = self.texts.add(QPushButton(), "stop_recording")
         self.record_stop_btn.setMinimumHeight(50)
         self.record_stop_btn.setStyleSheet("""
             QPushButton {
@@ -953,7 +923,7 @@ class SettingsScreen(QWidget):
         main_layout.addWidget(separator)
         
         # === Replay Section ===
-        replay_label = QLabel(t("trace_replay_section"))
+        replay_label = self.texts.add(QLabel(), "trace_replay_section")
         replay_label.setStyleSheet("font-size: 16px; font-weight: bold; margin-top: 5px; color: #3498db;")
         main_layout.addWidget(replay_label)
         
@@ -962,7 +932,7 @@ class SettingsScreen(QWidget):
         
         # Trace File Selection
         trace_file_layout = QHBoxLayout()
-        trace_label = QLabel(t("select_trace") + ":")
+        trace_label = self.texts.add(QLabel(), "select_trace", "{}:")
         trace_label.setMinimumWidth(150)
         trace_file_layout.addWidget(trace_label)
         
@@ -973,14 +943,14 @@ class SettingsScreen(QWidget):
         replay_layout.addLayout(trace_file_layout)
         
         # Loop Playback Checkbox
-        self.loop_checkbox = QCheckBox(t("loop_playback"))
+        self.loop_checkbox = self.texts.add(QCheckBox(), "loop_playback")
         self.loop_checkbox.setChecked(self.settings.get("trace_loop", False))
         replay_layout.addWidget(self.loop_checkbox)
         
         # Replay Control Buttons
         replay_buttons_layout = QHBoxLayout()
         
-        self.trace_start_btn = QPushButton(t("start_replay"))
+        self.trace_start_btn = self.texts.add(QPushButton(), "start_replay")
         self.trace_start_btn.setMinimumHeight(50)
         self.trace_start_btn.setStyleSheet("""
             QPushButton {
@@ -998,7 +968,7 @@ class SettingsScreen(QWidget):
         self.trace_start_btn.clicked.connect(self.on_trace_start)
         replay_buttons_layout.addWidget(self.trace_start_btn)
         
-        self.trace_stop_btn = QPushButton(t("stop_replay"))
+        self.trace_stop_btn = self.texts.add(QPushButton(), "stop_replay")
         self.trace_stop_btn.setMinimumHeight(50)
         self.trace_stop_btn.setStyleSheet("""
             QPushButton {
@@ -1019,12 +989,12 @@ class SettingsScreen(QWidget):
         replay_layout.addLayout(replay_buttons_layout)
         
         # Replay Status
-        self.trace_status_label = QLabel(t("replay_status_stopped"))
+        self.trace_status_label = self.texts.add(QLabel(), "replay_status_stopped")
         self.trace_status_label.setStyleSheet("font-size: 12px; color: #888; margin-top: 5px;")
         replay_layout.addWidget(self.trace_status_label)
         
         # Info text
-        info_label = QLabel(t("trace_info"))
+        info_label = self.texts.add(QLabel(), "trace_info")
         info_label.setWordWrap(True)
         info_label.setStyleSheet("color: #888888; font-size: 11px; margin-top: 10px;")
         replay_layout.addWidget(info_label)
@@ -1036,14 +1006,12 @@ class SettingsScreen(QWidget):
     
     def create_trace_replay_group(self):
         """Trace Replay Settings."""
-        t = self.translator.get
-        
-        group = QGroupBox(t("trace_replay"))
+        group = self.texts.add(QGroupBox(), "trace_replay")
         layout = QVBoxLayout()
         
         # Trace File Selection
         trace_layout = QHBoxLayout()
-        trace_label = QLabel(t("select_trace") + ":")
+        trace_label = self.texts.add(QLabel(), "select_trace", "{}:")
         trace_label.setMinimumWidth(150)
         trace_layout.addWidget(trace_label)
         
@@ -1054,7 +1022,7 @@ class SettingsScreen(QWidget):
         layout.addLayout(trace_layout)
         
         # Loop Playback Checkbox
-        self.loop_checkbox = QCheckBox(t("loop_playback"))
+        self.loop_checkbox = self.texts.add(QCheckBox(), "loop_playback")
         self.loop_checkbox.setChecked(self.settings.get("trace_loop", False))
         layout.addWidget(self.loop_checkbox)
                 # Start/Pause/Stop Buttons
@@ -1072,7 +1040,7 @@ class SettingsScreen(QWidget):
         self.trace_stop_btn.clicked.connect(self.on_trace_stop)
 
         # Info text
-        info_label = QLabel(t("trace_info"))
+        info_label = self.texts.add(QLabel(), "trace_info")
         info_label.setWordWrap(True)
         info_label.setStyleSheet("color: #888888; font-size: 11px; margin-top: 10px;")
         layout.addWidget(info_label)
@@ -1291,6 +1259,7 @@ class SettingsScreen(QWidget):
         """Save settings."""
         self.settings["can_interface"] = self.can_combo.currentText()
         self.settings["simulation_mode"] = self.sim_checkbox.isChecked()
+        self.settings["can_filter_enabled"] = self.can_filter_checkbox.isChecked()
         self.settings["wifi_ssid"] = self.wifi_ssid.text()
         
         # Encrypt and save WiFi password
@@ -1419,9 +1388,8 @@ class SettingsScreen(QWidget):
             # Try to activate connection
             subprocess.run(["nmcli", "connection", "up", ssid], timeout=15)
             
-            # Update status display
-            from PyQt5.QtCore import QTimer
-            QTimer.singleShot(2000, self.update_wlan_status)
+            # Status neu prüfen lassen (Anzeige folgt über status_changed)
+            self.network_monitor.refresh()
             
         except subprocess.TimeoutExpired:
             t = self.translator.get
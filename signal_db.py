@@ -0,0 +1,408 @@
+# signal_db.py
+# Zentraler Signal-Katalog (DBC-Stil) für alle bekannten ThinkCity CAN-Frames.
+# Einzige Quelle für Layout, Skalierung, Einheit und Bezeichnung eines Signals:
+# CANDecoder kompiliert daraus seine Decoder, Raw-Data-Screen und Logging-
+# Einstellungen lesen Namen und Einheiten von hier.
+# Details zu den einzelnen IDs: CAN_REFERENCE.md
+
+from typing import Dict, Optional, Tuple, NamedTuple, Callable, Iterable
+
+
+class Signal(NamedTuple):
+    """
+    Ein Signal innerhalb eines CAN-Frames.
+
+    Wert = ((raw & mask) * factor / divisor) + offset
+    Faktor und Divisor sind getrennt, damit die Floats exakt den
+    bisherigen Berechnungen entsprechen (x / 10.0 ≠ x * 0.1).
+
+    kind:
+      "value" - Zahl (Skalierung wie oben)
+      "flag"  - bool(raw & mask)
+      "enum"  - Nachschlagen in choices (sonst default)
+      "raw"   - Byte-Liste
+      "hex"   - Hex-String (Großbuchstaben)
+      "ascii" - Druckbare Zeichen, Rest als '?'
+    """
+    name: str
+    start: int                      # Byte-Offset im Frame
+    length: int = 1                 # Länge in Bytes (1, 2, 4; raw/hex/ascii beliebig)
+    signed: bool = False
+    byte_order: str = "big"         # "big" (Motorola) oder "little" (Intel)
+    factor: Optional[float] = None
+    divisor: Optional[float] = None
+    offset: Optional[float] = None
+    mask: Optional[int] = None
+    kind: str = "value"
+    unit: str = ""
+    label: str = ""
+    choices: Optional[Dict[int, str]] = None
+    default: Optional[str] = None
+
+
+class Message(NamedTuple):
+    """Ein CAN-Frame mit seinen Signalen."""
+    can_id: int
+    name: str
+    description: str = ""
+    signals: Tuple[Signal, ...] = ()
+
+
+class DerivedSignal(NamedTuple):
+    """Wert, der nicht direkt aus einem Frame kommt (Decoder-Hook, merge_state, Trip-Computer)."""
+    name: str
+    unit: str = ""
+    label: str = ""
+    label_key: Optional[str] = None  # Übersetzungs-Schlüssel (translations.py)
+
+
+# EnerDel Zellspannungs-Skalierung (2.5V / 1024)
+ENERDEL_V_SCALE = 0.00244140625
+
+# Gangwahl 0x264, Bytes 4-5 als 16-bit Wert (nach Live-Trace-Analyse)
+# Format: 01 00 00 4X YY ZZ 00 00 - Byte 3 variiert zwischen 40 und 41 (Status-Flag)
+GEAR_CHOICES = {
+    0x0401: "P",  # Park
+    0x0421: "R",  # Reverse
+    0x1004: "N",  # Neutral
+    0x4006: "D",  # Drive
+    0x0081: "E",  # Eco-Mode  (live: 01 00 00 41 00 81 00 00)
+    0x1008: "E",  # Eco-Mode  (trace: 01 00 00 40 10 08 00 00)
+}
+
+
+def _raw(name: str, label: str = "") -> Signal:
+    """Gesamter Frame als Byte-Liste (noch nicht analysierte IDs)."""
+    return Signal(name, 0, 8, kind="raw", label=label)
+
+
+def _flag(name: str, start: int, mask: int, label: str = "") -> Signal:
+    return Signal(name, start, mask=mask, kind="flag", label=label)
+
+
+MESSAGES: Tuple[Message, ...] = (
+    # ------------------------------------------------------------------
+    # Battery Management Interface (BMI)
+    # ------------------------------------------------------------------
+    Message(0x301, "BMI Hauptdaten", "Strom, Spannung, DOD, Pack-Temp", (
+        Signal("current_A", 0, 2, signed=True, divisor=10.0, unit="A", label="Strom"),
+        Signal("voltage_V", 2, 2, divisor=10.0, unit="V", label="Spannung"),
+        Signal("dod_pct", 4, 2, divisor=10.0, unit="%", label="Entladetiefe (DOD)"),
+        Signal("pack_temp_C", 6, 2, divisor=10.0, unit="°C", label="Akku-Temperatur"),
+    )),
+    Message(0x302, "BMI Fehler & Limits", "Fehler, ISO, Entlade-Limits", (
+        _flag("err_general", 0, 0x01, "Allgemeiner Fehler"),
+        _flag("iso_error", 2, 0x01, "ISO-Fehler"),
+        Signal("volts_min_discharge_V", 4, 2, divisor=10.0, unit="V", label="Min Entlade-Spannung"),
+        Signal("amps_max_discharge_A", 6, 2, signed=True, divisor=10.0, unit="A", label="Max Entlade-Strom"),
+    )),
+    Message(0x303, "BMI Lade-/Entlade-Status", "Lade-Limits, Freigaben", (
+        Signal("max_charge_current_A", 0, 2, signed=True, divisor=10.0, unit="A", label="Max Lade-Strom"),
+        Signal("max_charge_voltage_V", 2, 2, divisor=10.0, unit="V", label="Max Lade-Spannung"),
+        _flag("vehicle_charge_enabled", 4, 0x01, "Fahrzeug-Laden erlaubt"),
+        _flag("regen_brake_enabled", 4, 0x02, "Rekuperation aktiv"),
+        _flag("discharge_enabled", 4, 0x04, "Entladen erlaubt"),
+        _flag("fast_charge_enabled", 4, 0x08, "Schnellladen aktiv"),
+        _flag("dc_dc_enabled", 4, 0x10, "DC/DC aktiv"),
+        _flag("ac_on", 4, 0x20, "Klimaanlage an"),
+        Signal("number_released_batteries", 5, label="Freigegebene Batterien"),
+        _flag("reduced_number_of_batteries", 6, 0x01, "Reduzierte Batteriezahl"),
+        _flag("emergency", 6, 0x08, "Notfall"),
+        _flag("crash", 6, 0x10, "Crash"),
+        _flag("fan_status", 6, 0x20, "Lüfter"),
+        _flag("soc_greater_102", 6, 0x40, "SOC > 102%"),
+        _flag("iso_test_flag", 6, 0x80, "ISO-Test"),
+        _flag("waiting_temp_err", 7, 0x01, "Warte auf Temperatur"),
+    )),
+    Message(0x304, "BMI EOC & Warnungen", "EOC, Heizung, T1/T2", (
+        Signal("sys_voltage_max_generator_V", 0, 2, divisor=10.0, unit="V", label="Max System-Spannung"),
+        Signal("sys_high_est_err_cat", 2, label="Fehlerkategorie"),
+        _flag("sys_eoc", 3, 0x01, "End of Charge"),
+        _flag("reach_eoc_please", 3, 0x02, "EOC bitte erreichen"),
+        _flag("waiting_ok_temp_charge", 3, 0x04, "Warte auf Lade-Temperatur"),
+        _flag("too_many_failed_cells", 3, 0x08, "Zu viele defekte Zellen"),
+        _flag("ac_heater_relay_status", 3, 0x10, "AC-Heizung Relais"),
+        _flag("ac_heater_switch_status", 3, 0x20, "AC-Heizung Schalter"),
+        Signal("t1_C", 4, 2, divisor=10.0, unit="°C", label="Temperatur T1"),
+        Signal("t2_C", 6, 2, divisor=10.0, unit="°C", label="Temperatur T2"),
+    )),
+    Message(0x305, "BMI State", "BMI-State, defekte Zellen", (
+        Signal("charger_pwm_cmd", 0, 2, divisor=10.0, label="Charger PWM"),
+        Signal("sys_bmi_state", 2, mask=0x0F, label="BMI State"),
+        _flag("sys_int_iso_error", 2, 0x10, "System Int ISO-Fehler"),
+        _flag("sys_ext_iso_error", 2, 0x20, "System Ext ISO-Fehler"),
+        _flag("battery_charge_en", 3, 0x01, "Laden freigegeben"),
+        _flag("ocv_meas_in_progress", 3, 0x02, "OCV-Messung läuft"),
+        _flag("no_charge_current", 3, 0x04, "Kein Lade-Strom"),
+        _flag("charge_overvoltage", 3, 0x08, "Lade-Überspannung"),
+        _flag("charge_overcurrent", 3, 0x10, "Lade-Überstrom"),
+        Signal("battery_type", 3, mask=0xE0, factor=0.03125, label="Batterietyp"),
+        Signal("number_of_failed_cells", 4, 2, label="Defekte Zellen"),
+        Signal("sys_bmi_temp_error", 6, mask=0x06, divisor=2.0, label="BMI Temp-Fehler"),
+        Signal("sys_zebra_temp_error", 6, mask=0x18, factor=0.125, label="Zebra Temp-Fehler"),
+        _flag("sys_thermal_iso_error", 6, 0x20, "System Thermal ISO-Fehler"),
+        _flag("waiting_ok_temp_discharge", 6, 0x40, "Warte auf Entlade-Temperatur"),
+    )),
+    Message(0x306, "BMI Zusatzdaten", "Noch zu analysieren", (
+        _raw("bmi6_raw"),
+    )),
+
+    # ------------------------------------------------------------------
+    # Vehicle Control Unit (VCU) / PCU
+    # ------------------------------------------------------------------
+    Message(0x250, "VCU Status 1", "Status-Bytes 0-2", (
+        Signal("vcu_status_1", 0, label="VCU Status 1"),
+        Signal("vcu_status_2", 1, label="VCU Status 2"),
+        Signal("vcu_status_3", 2, label="VCU Status 3"),
+    )),
+    Message(0x251, "VCU Status 2", "Meist 0", (
+        _raw("vcu2_raw"),
+    )),
+    Message(0x263, "PCU General", "Geschwindigkeit, Netz, Umgebung", (
+        Signal("pcu_voltage_V", 3, divisor=10.0, unit="V", label="PCU Spannung"),
+        Signal("speed_kmh", 5, divisor=2.0, unit="km/h", label="Geschwindigkeit"),
+        Signal("pcu_ambient_temp_C", 2, divisor=2.0, unit="°C", label="PCU Umgebungstemperatur"),
+        Signal("mains_voltage_V", 1, unit="V", label="Netzspannung"),
+        Signal("mains_current_A", 0, factor=2.0, divisor=10.0, unit="A", label="Netzstrom"),
+    )),
+    Message(0x264, "Shifter", "Gangwahl", (
+        Signal("shifter_hex", 0, 8, kind="hex", label="Shifter Rohdaten"),
+        Signal("gear", 4, 2, kind="enum", choices=GEAR_CHOICES, default="?", label="Gang"),
+    )),
+    Message(0x265, "VCU Counter", "Counter, Status", (
+        Signal("vcu_counter", 0, 2, label="VCU Counter"),
+        Signal("vcu_status_byte", 5, label="VCU Status"),
+    )),
+    Message(0x300, "VCU Mode", "Modus", (
+        Signal("vcu_mode", 0, label="VCU Modus"),
+        Signal("vcu_reserved", 2, label="VCU Reserviert"),
+    )),
+
+    # ------------------------------------------------------------------
+    # Charger / Power Control
+    # ------------------------------------------------------------------
+    Message(0x310, "Charger Status", "Status, Modus", (
+        Signal("charger_status", 0, label="Charger Status"),
+        Signal("charger_mode", 2, label="Charger Modus"),
+    )),
+    Message(0x311, "Max AC", "Max verfügbarer AC-Strom", (
+        Signal("max_available_AC_A", 1, factor=0.2, unit="A", label="Max AC-Strom"),
+    )),
+    Message(0x352, "Charger Sollwerte", "Spannungs-/Strom-Sollwert", (
+        _flag("charger_enabled", 0, 0x01, "Charger aktiviert"),
+        Signal("charger_voltage_setpoint_V", 2, 2, divisor=10.0, unit="V", label="Charger Soll-Spannung"),
+        Signal("charger_current_setpoint_A", 4, 2, divisor=10.0, unit="A", label="Charger Soll-Strom"),
+    )),
+    Message(0x353, "Charger Ziel", "State, Ziel-Spannung", (
+        Signal("charger_state", 1, label="Charger State"),
+        Signal("charger_target_voltage_V", 6, 2, divisor=10.0, unit="V", label="Charger Ziel-Spannung"),
+    )),
+    Message(0x354, "Charger Timer", "Timer, Timestamp", (
+        Signal("charger_timer_h", 1, unit="h", label="Charger Timer Stunden"),
+        Signal("charger_timer_m", 2, unit="min", label="Charger Timer Minuten"),
+        Signal("charger_timestamp", 4, 2, label="Charger Timestamp"),
+    )),
+    Message(0x355, "Charger Aktiv", "Charger aktiv", (
+        _flag("charger_active", 0, 0x01, "Charger aktiv"),
+    )),
+    Message(0x359, "VCU/Charger Command", "Command, Ready", (
+        Signal("vcu_charger_cmd", 0, label="VCU Charger Command"),
+        _flag("vcu_ready", 5, 0x01, "VCU Ready"),
+    )),
+
+    # ------------------------------------------------------------------
+    # Motor / Inverter
+    # ------------------------------------------------------------------
+    Message(0x3A0, "Motor 1", "Drehzahl", (
+        Signal("motor_rpm_raw", 2, 2, label="Motor Drehzahl (roh)"),
+        Signal("motor_rpm", 2, 2, unit="rpm", label="Motor Drehzahl"),  # Scaling noch zu bestimmen
+    )),
+    Message(0x3A1, "Motor 2", "Drehmoment, Status, Temperatur", (
+        Signal("motor_torque_raw", 0, 2, label="Motor Drehmoment (roh)"),
+        Signal("motor_status_1", 3, label="Motor Status 1"),
+        Signal("motor_status_2", 4, label="Motor Status 2"),
+        Signal("motor_temp_C", 6, unit="°C", label="Motor Temperatur"),  # Scaling unklar
+    )),
+
+    # ------------------------------------------------------------------
+    # HVAC / Climate
+    # ------------------------------------------------------------------
+    Message(0x440, "HVAC Temperaturen", "Soll/Ist (roh)", (
+        Signal("hvac_temp_setpoint_raw", 0, 2, label="HVAC Soll (roh)"),
+        Signal("hvac_temp_actual_raw", 2, 2, label="HVAC Ist (roh)"),
+    )),
+    Message(0x441, "HVAC Status 2", "Meist 0", (_raw("hvac2_raw"),)),
+    Message(0x442, "HVAC Status 3", "Meist 0", (_raw("hvac3_raw"),)),
+    Message(0x443, "HVAC Status 4", "Meist 0", (_raw("hvac4_raw"),)),
+    Message(0x444, "HVAC Mode & Fan", "Modus, Lüfter", (
+        Signal("hvac_mode", 0, label="HVAC Modus"),
+        Signal("hvac_fan_speed", 2, label="HVAC Lüfter"),
+    )),
+
+    # ------------------------------------------------------------------
+    # EnerDel Battery
+    # ------------------------------------------------------------------
+    Message(0x4B0, "Modulspannungen", "4 EnerDel-Module", (
+        Signal("module1_voltage_V", 0, 2, factor=ENERDEL_V_SCALE, unit="V", label="Modul 1 Spannung"),
+        Signal("module2_voltage_V", 2, 2, factor=ENERDEL_V_SCALE, unit="V", label="Modul 2 Spannung"),
+        Signal("module3_voltage_V", 4, 2, factor=ENERDEL_V_SCALE, unit="V", label="Modul 3 Spannung"),
+        Signal("module4_voltage_V", 6, 2, factor=ENERDEL_V_SCALE, unit="V", label="Modul 4 Spannung"),
+    )),
+    Message(0x610, "EnerDel Zellen", "Max/Min Zellspannung, Temperatur", (
+        Signal("e_pack_max_cell_V", 0, 2, factor=ENERDEL_V_SCALE, unit="V", label="Zellspannung Max"),
+        Signal("e_pack_min_cell_V", 2, 2, factor=ENERDEL_V_SCALE, unit="V", label="Zellspannung Min"),
+        Signal("e_pack_max_temp_C", 4, unit="°C", label="EnerDel Max Temp"),
+        Signal("e_pack_min_temp_C", 5, unit="°C", label="EnerDel Min Temp"),
+    )),
+    Message(0x611, "EnerDel SOC", "Zell-Mittelwert, Delta, SOC", (
+        Signal("e_pack_avg_cell_V", 0, 2, factor=ENERDEL_V_SCALE, unit="V", label="Zellspannung Avg"),
+        Signal("e_pack_delta_cell_V", 2, 2, factor=ENERDEL_V_SCALE, unit="V", label="Zellspannung Delta"),
+        Signal("e_cell_v_soc_pct", 4, factor=0.4, unit="%", label="Zellspannungs-SOC"),
+        Signal("e_pack_soc_pct", 5, factor=0.4, unit="%", label="EnerDel SOC"),
+        Signal("e_pack_soc1_pct", 6, factor=0.4, unit="%", label="EnerDel SOC 1"),
+        Signal("e_pack_soc2_pct", 7, factor=0.4, unit="%", label="EnerDel SOC 2"),
+    )),
+
+    # ------------------------------------------------------------------
+    # Diagnostics / Part Numbers
+    # ------------------------------------------------------------------
+    Message(0x30E, "Part Number 1", "ASCII", (
+        Signal("part_number_1", 0, 8, kind="ascii", label="Teilenummer 1"),
+    )),
+    Message(0x30F, "Part Number 2", "ASCII", (
+        Signal("part_number_2", 0, 8, kind="ascii", label="Teilenummer 2"),
+    )),
+    Message(0x721, "Diagnose 3", "Noch zu analysieren", (_raw("diag3_raw"),)),
+    Message(0x722, "Diagnose 4", "Noch zu analysieren", (_raw("diag4_raw"),)),
+    Message(0x723, "Diagnose 5", "Noch zu analysieren", (_raw("diag5_raw"),)),
+
+    # ------------------------------------------------------------------
+    # IDs ohne bekannte Bedeutung (werden angenommen, aber nicht dekodiert)
+    # TODO: Mit Trace-Daten identifizieren
+    # ------------------------------------------------------------------
+    Message(0x023, "Unbekannt", "TODO"),
+    Message(0x210, "Unbekannt", "TODO"),
+    Message(0x408, "Unbekannt", "TODO"),
+    Message(0x409, "Unbekannt", "TODO"),
+    Message(0x40B, "Unbekannt", "TODO"),
+    Message(0x460, "Unbekannt", "TODO"),
+    Message(0x495, "Unbekannt", "TODO"),
+)
+
+# Abgeleitete Werte (Decoder-Hooks, merge_state, Dashboard/Trip-Computer)
+DERIVED_SIGNALS: Tuple[DerivedSignal, ...] = (
+    DerivedSignal("power_kW", "kW", "Leistung", "field_power"),
+    DerivedSignal("soc_pct", "%", "Ladezustand", "field_soc"),
+    DerivedSignal("ambient_temp_C", "°C", "Außentemperatur", "field_ambient_temp"),
+    DerivedSignal("modules_total_V", "V", "Module Gesamt"),
+    DerivedSignal("is_enerdel", "", "EnerDel-Batterie"),
+    DerivedSignal("soh_pct", "%", "State of Health"),
+    DerivedSignal("range_km", "km", "Reichweite", "field_range"),
+    DerivedSignal("odo_km", "km", "Kilometerstand", "field_odo"),
+    DerivedSignal("consumption_wh_km", "Wh/km", "Verbrauch", "field_consumption"),
+    DerivedSignal("soh_pct_instant", "%", "SOH Momentanwert"),
+    DerivedSignal("cell_voltages", "V", "Zellspannungen"),
+    # Trip-Computer
+    DerivedSignal("consumption_now_wh_km", "Wh/km", "Verbrauch aktuell"),
+    DerivedSignal("consumption_trip_wh_km", "Wh/km", "Verbrauch Trip"),
+    DerivedSignal("consumption_total_wh_km", "Wh/km", "Verbrauch gesamt"),
+    DerivedSignal("consumption_now_kwh_100km", "kWh/100km", "Verbrauch aktuell"),
+    DerivedSignal("consumption_kwh_100km", "kWh/100km", "Verbrauch"),
+    DerivedSignal("consumption_trip_kwh_100km", "kWh/100km", "Verbrauch Trip"),
+    DerivedSignal("consumption_total_kwh_100km", "kWh/100km", "Verbrauch gesamt"),
+    DerivedSignal("trip_distance_km", "km", "Trip-Strecke"),
+    DerivedSignal("trip_energy_kwh", "kWh", "Trip-Energie"),
+    DerivedSignal("total_distance_km", "km", "Gesamtstrecke"),
+    DerivedSignal("total_energy_kwh", "kWh", "Gesamtenergie"),
+    DerivedSignal("total_count", "", "Verbrauchs-Samples"),
+)
+
+# Übersetzte Bezeichnungen für CAN-Signale, die in der UI auftauchen
+SIGNAL_LABEL_KEYS: Dict[str, str] = {
+    "speed_kmh": "field_speed",
+    "voltage_V": "field_voltage",
+    "current_A": "field_current",
+    "pack_temp_C": "field_pack_temp",
+}
+
+# Auswählbare Logging-Datenpunkte (Reihenfolge = Anzeige im Settings-Screen)
+LOGGING_FIELDS: Tuple[str, ...] = (
+    # Basic driving data
+    "speed_kmh", "soc_pct", "range_km", "odo_km",
+    # Power & Energy
+    "voltage_V", "current_A", "power_kW", "consumption_wh_km",
+    # Temperatures
+    "pack_temp_C", "ambient_temp_C", "e_pack_max_temp_C", "e_pack_min_temp_C",
+    # Cell Voltages (EnerDel)
+    "e_pack_max_cell_V", "e_pack_min_cell_V", "e_pack_avg_cell_V", "e_pack_delta_cell_V",
+    # Module Voltages
+    "module1_voltage_V", "module2_voltage_V", "module3_voltage_V", "module4_voltage_V",
+    "modules_total_V",
+    # Error Flags
+    "iso_error", "emergency", "sys_int_iso_error", "sys_ext_iso_error", "sys_thermal_iso_error",
+)
+
+# Standard-Auswahl für neue Konfigurationen
+DEFAULT_LOGGING_FIELDS: Tuple[str, ...] = (
+    # Basic (commonly used)
+    "speed_kmh", "soc_pct", "voltage_V", "current_A", "power_kW",
+    "pack_temp_C", "ambient_temp_C", "consumption_wh_km", "range_km", "odo_km",
+    # EnerDel battery health
+    "e_pack_max_cell_V", "e_pack_min_cell_V", "e_pack_avg_cell_V", "e_pack_delta_cell_V",
+    "e_pack_max_temp_C", "e_pack_min_temp_C",
+    # Module voltages
+    "module1_voltage_V", "module2_voltage_V", "module3_voltage_V", "module4_voltage_V",
+    # Error flags (always useful for diagnostics)
+    "iso_error", "emergency", "sys_int_iso_error", "sys_ext_iso_error", "sys_thermal_iso_error",
+)
+
+
+# Lookup-Tabellen (einmalig beim Import aufgebaut)
+MESSAGES_BY_ID: Dict[int, Message] = {msg.can_id: msg for msg in MESSAGES}
+
+_SIGNALS_BY_NAME: Dict[str, object] = {
+    sig.name: sig for msg in MESSAGES for sig in msg.signals
+}
+_SIGNALS_BY_NAME.update({sig.name: sig for sig in DERIVED_SIGNALS})
+
+
+def get_message(can_id: int) -> Optional[Message]:
+    """Message-Definition für eine CAN-ID (None wenn unbekannt)."""
+    return MESSAGES_BY_ID.get(can_id)
+
+
+def get_signal(name: str):
+    """Signal- oder DerivedSignal-Definition nach Name (None wenn unbekannt)."""
+    return _SIGNALS_BY_NAME.get(name)
+
+
+def get_unit(name: str) -> str:
+    """Einheit eines Signals ("" wenn unbekannt oder einheitenlos)."""
+    sig = _SIGNALS_BY_NAME.get(name)
+    return sig.unit if sig else ""
+
+
+def get_label(name: str, translate: Optional[Callable[[str], str]] = None,
+              with_unit: bool = True) -> str:
+    """
+    Anzeigename eines Signals, optional übersetzt und mit Einheit.
+    z.B. "Modul 1 Spannung (V)"
+    """
+    sig = _SIGNALS_BY_NAME.get(name)
+    if sig is None:
+        return name
+
+    label_key = getattr(sig, "label_key", None) or SIGNAL_LABEL_KEYS.get(name)
+    if translate and label_key:
+        label = translate(label_key)
+    else:
+        label = sig.label or name
+
+    if with_unit and sig.unit:
+        label = f"{label} ({sig.unit})"
+    return label
+
+
+def known_ids() -> Iterable[int]:
+    """Alle CAN-IDs im Katalog."""
+    return MESSAGES_BY_ID.keys()
@@ -25,6 +25,16 @@ class SOHTracker:
         # Minimum change to trigger DB save (avoid excessive writes)
         self.min_delta_for_save = 0.5  # 0.5%
         
+        # Smoothing max. 1x pro Sekunde (update() wird pro UI-Tick aufgerufen)
+        self.min_update_interval = 1.0
+        self.last_smoothing_time = 0.0
+        
+        # Letzter echter Momentanwert vom Decoder. Unveränderte CAN-Frames
+        # werden nicht erneut gemerged, state["soh_pct"] enthält dann unseren
+        # eigenen geglätteten Wert - der darf nicht als Momentanwert zählen.
+        self.last_instant_soh: Optional[float] = None
+        self._last_written_soh: Optional[float] = None
+        
         # Current smoothed SOH value
         self.soh_pct = initial_soh
         self.last_saved_soh = initial_soh
@@ -62,32 +72,35 @@ class SOHTracker:
             Updated state dict with smoothed 'soh_pct'
         """
         # Get instantaneous SOH (calculated from current delta)
-        instant_soh = state.get("soh_pct")
-        
-        if instant_soh is None:
-            # No data available - return current smoothed value
-            state["soh_pct"] = self.soh_pct
-            return state
+        value = state.get("soh_pct")
+        if value is not None and value != self._last_written_soh:
+            # Neuer Wert vom Decoder (nicht der zuletzt von uns geschriebene)
+            self.last_instant_soh = value
+        instant_soh = self.last_instant_soh
         
-        # Validate instant_soh range
-        if not (70.0 <= instant_soh <= 100.0):
-            # Invalid value - keep current
+        if instant_soh is None or not (70.0 <= instant_soh <= 100.0):
+            # No (valid) data available - return current smoothed value
             state["soh_pct"] = self.soh_pct
+            self._last_written_soh = self.soh_pct
             return state
         
-        # Apply exponential smoothing
-        # new_soh = old_soh * (1 - alpha) + instant_soh * alpha
-        self.soh_pct = self.soh_pct * (1.0 - self.alpha) + instant_soh * self.alpha
-        
-        # Clamp to valid range
-        self.soh_pct = max(70.0, min(100.0, self.soh_pct))
+        now = time.time()
+        if now - self.last_smoothing_time >= self.min_update_interval:
+            # Apply exponential smoothing
+            # new_soh = old_soh * (1 - alpha) + instant_soh * alpha
+            self.soh_pct = self.soh_pct * (1.0 - self.alpha) + instant_soh * self.alpha
+            
+            # Clamp to valid range
+            self.soh_pct = max(70.0, min(100.0, self.soh_pct))
+            
+            self.last_smoothing_time = now
+            self.update_count += 1
+            self.last_update_time = now
         
         # Update state with smoothed value
         state["soh_pct"] = self.soh_pct
         state["soh_pct_instant"] = instant_soh  # Keep instant for debugging
-        
-        self.update_count += 1
-        self.last_update_time = time.time()
+        self._last_written_soh = self.soh_pct
         
         # SOH wird automatisch in DB gespeichert durch dashboard.py _log_sample()
         # (wie auch consumption - keine separate Speicherung mehr nötig)
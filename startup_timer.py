@@ -0,0 +1,107 @@
+# startup_timer.py
+# Startzeit-Messung: Prozessstart bis zum ersten Frame, aufgeteilt nach Phasen
+#
+# Das Dashboard ruft mark() am Ende jeder Startphase auf und report() nach
+# dem ersten Paint des Main-Screens. Der Bericht geht ins Log und wird als
+# JSON-Zeile an ~/thinkcity-dashboard-v3/startup_times.jsonl angehängt,
+# damit sich die Boot-Zeit auf dem Pi über Updates hinweg verfolgen lässt.
+
+import os
+import json
+import time
+import logging
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def process_age() -> Optional[float]:
+    """
+    Sekunden seit dem Start dieses Prozesses (Interpreter-Start, Imports
+    bis zum Aufruf), None wenn /proc nicht verfügbar ist.
+    """
+    try:
+        with open("/proc/self/stat", "r") as f:
+            # Feld 22 = starttime (Ticks seit Boot); comm (Feld 2) kann
+            # Leerzeichen enthalten, daher ab der letzten Klammer zählen
+            fields = f.read().rsplit(")", 1)[1].split()
+        start_ticks = int(fields[19])
+        return system_uptime() - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, TypeError):
+        return None
+
+
+def system_uptime() -> Optional[float]:
+    """Sekunden seit dem Systemstart, None wenn nicht verfügbar."""
+    try:
+        with open("/proc/uptime", "r") as f:
+            return float(f.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class StartupTimer:
+    """
+    Misst die Dauer der Startphasen.
+
+    Die erste Phase ("python") reicht vom Prozessstart bis zum Erzeugen des
+    Timers, jede weitere von der vorherigen Marke bis zu mark(name).
+    """
+
+    LOG_FILE = os.path.expanduser("~/thinkcity-dashboard-v3/startup_times.jsonl")
+
+    def __init__(self):
+        self.start = time.monotonic()
+        self.last = self.start
+        self.phases: List[Tuple[str, float]] = []
+        self.reported = False
+
+        age = process_age()
+        if age is not None and age >= 0:
+            self.phases.append(("python", age))
+
+    def mark(self, phase: str):
+        """Beendet eine Phase (Dauer seit der letzten Marke)."""
+        now = time.monotonic()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def total(self) -> float:
+        """Summe aller Phasen in Sekunden."""
+        return sum(duration for _, duration in self.phases)
+
+    def report(self, log_file: Optional[str] = None):
+        """Loggt die Phasen und hängt eine JSON-Zeile an die Log-Datei an (einmalig)."""
+        if self.reported:
+            return
+        self.reported = True
+
+        breakdown = ", ".join(f"{name} {duration * 1000:.0f}" for name, duration in self.phases)
+        logger.info(f"Startup: {self.total() * 1000:.0f} ms to first paint ({breakdown} ms)")
+
+        record = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "total_ms": round(self.total() * 1000, 1),
+            "phases_ms": {name: round(duration * 1000, 1) for name, duration in self.phases},
+            "uptime_s": system_uptime(),  # Boot bis erster Frame (auf dem Pi)
+        }
+        log_file = log_file or self.LOG_FILE
+        try:
+            os.makedirs(os.path.dirname(log_file), exist_ok=True)
+            with open(log_file, "a") as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError as e:
+            logger.warning(f"Startup timing not saved: {e}")
+
+
+# Globale Instanz
+_startup_timer: Optional[StartupTimer] = None
+
+
+def get_startup_timer() -> StartupTimer:
+    """Gibt die globale StartupTimer-Instanz zurück (wird beim ersten Aufruf erzeugt)."""
+    global _startup_timer
+    if _startup_timer is None:
+        _startup_timer = StartupTimer()
+    return _startup_timer
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""Test script for the schema migration of a pre-versioning database (v0 -> current)."""
+
+import os
+import time
+import sqlite3
+import tempfile
+from datetime import datetime, timedelta
+
+# Lokalzeit != UTC, sonst fällt eine fehlende UTC-Umrechnung nicht auf (Pi: Europe/Berlin)
+os.environ["TZ"] = "Europe/Berlin"
+if hasattr(time, "tzset"):
+    time.tzset()
+
+from db_manager import DBManager, SCHEMA_VERSION, to_epoch_ms
+from trip_computer import TripComputer
+from soh_tracker import SOHTracker
+
+# Schema vor der Versionierung (Text-Zeitstempel, user_version = 0)
+BASELINE_SCHEMA = """
+    CREATE TABLE trips (
+        trip_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        start_time TEXT NOT NULL,
+        end_time TEXT,
+        start_odo_km REAL,
+        end_odo_km REAL,
+        distance_km REAL,
+        avg_consumption_wh_km REAL,
+        avg_consumption_kwh_100km REAL,
+        start_soc_pct REAL,
+        end_soc_pct REAL,
+        energy_used_kwh REAL,
+        max_power_kw REAL,
+        min_power_kw REAL,
+        avg_speed_kmh REAL,
+        max_speed_kmh REAL,
+        synced INTEGER DEFAULT 0
+    );
+    CREATE TABLE samples (
+        sample_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        trip_id INTEGER NOT NULL,
+        timestamp TEXT NOT NULL,
+        speed_kmh REAL,
+        soc_pct REAL,
+        voltage_V REAL,
+        current_A REAL,
+        power_kW REAL,
+        pack_temp_C REAL,
+        ambient_temp_C REAL,
+        latitude REAL,
+        longitude REAL,
+        consumption_wh_km REAL,
+        consumption_total_wh_km REAL,
+        total_distance_km REAL,
+        total_energy_kwh REAL,
+        total_count INTEGER,
+        range_km REAL,
+        soh_pct REAL,
+        synced INTEGER DEFAULT 0,
+        FOREIGN KEY (trip_id) REFERENCES trips (trip_id)
+    );
+    CREATE INDEX idx_samples_trip ON samples(trip_id);
+    CREATE INDEX idx_samples_timestamp ON samples(timestamp);
+    CREATE INDEX idx_trips_synced ON trips(synced);
+    CREATE INDEX idx_samples_synced ON samples(synced);
+"""
+
+
+def iso(dt: datetime) -> str:
+    """Zeitstempel wie im alten Code (datetime.now().isoformat())."""
+    return dt.isoformat()
+
+
+def build_baseline_db(path: str, last_sample: datetime):
+    """
+    Alte Datenbank: Trip 1 beendet (synced), Trip 2 offen (hartes Abschalten),
+    letztes Sample von Trip 2 um last_sample.
+    """
+    conn = sqlite3.connect(path)
+    conn.executescript(BASELINE_SCHEMA)
+
+    trip1_start = last_sample - timedelta(days=2)
+    conn.execute("""
+        INSERT INTO trips (start_time, end_time, start_odo_km, end_odo_km, distance_km,
+                           avg_consumption_wh_km, avg_consumption_kwh_100km,
+                           start_soc_pct, end_soc_pct, max_speed_kmh, synced)
+        VALUES (?, ?, 1000.0, 1012.0, 12.0, 150.0, 15.0, 90.0, 80.0, 70.0, 1)
+    """, (iso(trip1_start), iso(trip1_start + timedelta(minutes=20))))
+    trip2_start = last_sample - timedelta(seconds=9)
+    conn.execute("""
+        INSERT INTO trips (start_time, start_odo_km, start_soc_pct)
+        VALUES (?, 1050.0, 75.0)
+    """, (iso(trip2_start),))
+
+    samples = []
+    for i in range(10):
+        samples.append((1, trip1_start + timedelta(seconds=i, milliseconds=250), 50.0 + i, 89.0))
+    for i in range(10):
+        samples.append((2, trip2_start + timedelta(seconds=i, milliseconds=500), 30.0 + i, 74.0))
+    for n, (trip_id, ts, speed, soc) in enumerate(samples):
+        conn.execute("""
+            INSERT INTO samples (trip_id, timestamp, speed_kmh, soc_pct, power_kW,
+                                 consumption_wh_km, consumption_total_wh_km,
+                                 total_distance_km, total_energy_kwh, total_count, soh_pct)
+            VALUES (?, ?, ?, ?, 5.0, 140.0, ?, ?, ?, ?, ?)
+        """, (trip_id, iso(ts), speed, soc, 145.0 + n * 0.1, 500.0 + n, 72.5 + n * 0.1,
+              1000 + n, 92.0 - n * 0.01))
+    conn.commit()
+    conn.close()
+    return samples
+
+
+def check(label: str, condition: bool):
+    print(f"  {'OK  ' if condition else 'FAIL'} {label}")
+    assert condition, label
+
+
+print("Testing migration of a pre-versioning database:")
+print("=" * 60)
+
+with tempfile.TemporaryDirectory() as tmp:
+    # 1) Offener Trip innerhalb des Idle-Timeouts -> wird fortgesetzt
+    path = os.path.join(tmp, "thinkcity.db")
+    last_sample = datetime.now().replace(microsecond=0) - timedelta(seconds=60)
+    samples = build_baseline_db(path, last_sample)
+
+    db = DBManager(path)
+    conn = sqlite3.connect(path)
+
+    check(f"user_version == {SCHEMA_VERSION}",
+          conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION)
+    check("old timestamp column is gone",
+          "timestamp" not in [row[1] for row in conn.execute("PRAGMA table_info(samples)")])
+
+    rows = conn.execute("SELECT sample_id, trip_id, ts, speed_kmh FROM samples ORDER BY sample_id").fetchall()
+    check("all samples kept with their sample_id", [row[0] for row in rows] == list(range(1, 21)))
+    check("timestamps converted to epoch ms",
+          all(row[2] == to_epoch_ms(ts) for row, (_, ts, _, _) in zip(rows, samples)))
+    check("values unchanged", [row[3] for row in rows] == [speed for _, _, speed, _ in samples])
+
+    trip1 = conn.execute("SELECT start_ts, end_ts, synced FROM trips WHERE trip_id = 1").fetchone()
+    trip1_start = last_sample - timedelta(days=2)
+    check("finished trip converted",
+          trip1 == (to_epoch_ms(trip1_start), to_epoch_ms(trip1_start + timedelta(minutes=20)), 1))
+    check("rollups built", conn.execute("SELECT COUNT(*) FROM rollup_1m").fetchone()[0] > 0)
+
+    check("open trip resumed", db.current_trip_id == 2)
+    check("open trip still open",
+          conn.execute("SELECT end_ts FROM trips WHERE trip_id = 2").fetchone()[0] is None)
+    check("last sample time restored", db.last_sample_time == samples[-1][1])
+
+    tc = TripComputer(db_manager=db)
+    check("totals restored",
+          (tc.total_count, tc.total_distance_km) == (1019, 519.0)
+          and abs(tc.total_avg_consumption - 146.9) < 1e-9
+          and abs(tc.total_energy_kwh - 74.4) < 1e-9)
+    soh = SOHTracker(db_manager=db)
+    check("SOH restored", abs(soh.soh_pct - 91.81) < 1e-9)
+
+    # Neue Samples laufen im fortgesetzten Trip weiter, IDs nach den alten
+    db.write_samples([(datetime.now(), {"speed_kmh": 42.0, "soc_pct": 73.0})])
+    row = conn.execute("SELECT sample_id, trip_id FROM samples ORDER BY sample_id DESC LIMIT 1").fetchone()
+    check("new sample appended to trip 2", row == (21, 2))
+    conn.close()
+    db.close()
+
+    # Zweiter Start: Version aktuell, keine erneute Migration
+    db = DBManager(path)
+    check("reopen keeps data", len(db.get_trip_samples(2)) == 11)
+    db.close()
+
+    # 2) Offener Trip älter als der Idle-Timeout -> wird zum letzten Sample beendet
+    path = os.path.join(tmp, "thinkcity_old.db")
+    last_sample = datetime.now().replace(microsecond=0) - timedelta(hours=1)
+    samples = build_baseline_db(path, last_sample)
+
+    db = DBManager(path)
+    conn = sqlite3.connect(path)
+    check("stale open trip not resumed", db.current_trip_id is None)
+    check("stale open trip closed at its last sample",
+          conn.execute("SELECT end_ts FROM trips WHERE trip_id = 2").fetchone()[0]
+          == to_epoch_ms(samples[-1][1]))
+    conn.close()
+    db.close()
+
+print("=" * 60)
+print("Migration OK")
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+bench_decoder.py
+Micro-Benchmark für CANDecoder: Frames/s für parse() und parse()+merge_state().
+
+Usage:
+  python3 tools/bench_decoder.py [trace.trc] [--repeat N] [--baseline GIT_REF]
+
+Zusätzlich wird parse_if_changed() (Change-Detection je CAN-ID) gemessen
+und die Trefferquote ausgegeben - auf echten Traces zeigt das, wie viele
+Frames unverändert sind und nicht dekodiert werden müssen.
+
+Ohne Trace-Datei wird ein synthetischer Trace mit allen vom Decoder
+unterstützten IDs erzeugt. Mit --baseline wird zusätzlich can_decoder.py
+aus dem angegebenen Git-Stand geladen und gegen den aktuellen Stand
+gemessen (Vorher/Nachher-Vergleich).
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import subprocess
+import importlib.util
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from trace_parser import PCANTraceParser
+
+
+def load_frames(trace_file=None, count=50000):
+    """Lädt (can_id, data) Paare aus einem Trace oder erzeugt synthetische."""
+    if trace_file:
+        parser = PCANTraceParser(trace_file)
+        return [(can_id, data) for _, can_id, data in parser.parse()]
+
+    from can_decoder import CANDecoder
+    rng = random.Random(42)
+    ids = sorted(CANDecoder().get_known_ids())
+    # Etwas unbekannter Traffic, wie auf dem echten Bus
+    ids += [0x5E3, 0x7DF]
+
+    # Pro ID ein paar feste Payloads; wie auf dem echten Bus bleibt eine ID
+    # meist mehrere Frames lang unverändert, bevor die Payload wechselt
+    payloads = {
+        can_id: [bytes(rng.randrange(256) for _ in range(8)) for _ in range(4)]
+        for can_id in ids
+    }
+    current = {can_id: values[0] for can_id, values in payloads.items()}
+    frames = []
+    for _ in range(count):
+        can_id = rng.choice(ids)
+        if rng.random() < 0.3:
+            current[can_id] = rng.choice(payloads[can_id])
+        frames.append((can_id, current[can_id]))
+    return frames
+
+
+def load_decoder_class(git_ref=None):
+    """Lädt CANDecoder aus dem Arbeitsverzeichnis oder einem Git-Stand."""
+    if git_ref is None:
+        from can_decoder import CANDecoder
+        return CANDecoder
+
+    source = subprocess.run(
+        ["git", "-C", REPO_DIR, "show", f"{git_ref}:can_decoder.py"],
+        capture_output=True, text=True, check=True
+    ).stdout
+    spec = importlib.util.spec_from_loader(f"can_decoder_{git_ref}", loader=None)
+    module = importlib.util.module_from_spec(spec)
+    exec(compile(source, f"{git_ref}:can_decoder.py", "exec"), module.__dict__)
+    return module.CANDecoder
+
+
+def run_once(decoder_cls, frames):
+    """Ein Lauf: gibt (parse_sekunden, parse_merge_sekunden) zurück."""
+    decoder = decoder_cls()
+    parse = decoder.parse
+    start = time.perf_counter()
+    for can_id, data in frames:
+        parse(can_id, data)
+    parse_time = time.perf_counter() - start
+
+    decoder = decoder_cls()
+    parse = decoder.parse
+    merge = decoder.merge_state
+    state = {}
+    start = time.perf_counter()
+    for can_id, data in frames:
+        decoded = parse(can_id, data)
+        if decoded:
+            state = merge(state, decoded)
+    merge_time = time.perf_counter() - start
+
+    return parse_time, merge_time
+
+
+def run_cached(decoder_cls, frames, repeat):
+    """
+    parse_if_changed()+merge_state() mit Change-Detection.
+    Gibt (frames_per_s des besten Laufs, Cache-Statistik) zurück.
+    """
+    best = float("inf")
+    stats = {}
+    for _ in range(repeat + 1):  # erster Lauf = Aufwärmen
+        decoder = decoder_cls()
+        parse = decoder.parse_if_changed
+        merge = decoder.merge_state
+        state = {}
+        start = time.perf_counter()
+        for can_id, data in frames:
+            decoded = parse(can_id, data, 1.0)
+            if decoded:
+                state = merge(state, decoded)
+        best = min(best, time.perf_counter() - start)
+        stats = decoder.get_cache_stats()
+    return len(frames) / best, stats
+
+
+def bench(decoder_classes, frames, repeat):
+    """
+    Misst alle Decoder abwechselnd (fairer bei CPU-Takt-Schwankungen).
+    Gibt pro Decoder (parse_fps, parse_merge_fps) des besten Laufs zurück.
+    """
+    # Aufwärmen (Imports, Caches, CPU-Takt)
+    for decoder_cls in decoder_classes:
+        run_once(decoder_cls, frames)
+
+    best = [[float("inf"), float("inf")] for _ in decoder_classes]
+    for _ in range(repeat):
+        for i, decoder_cls in enumerate(decoder_classes):
+            parse_time, merge_time = run_once(decoder_cls, frames)
+            best[i][0] = min(best[i][0], parse_time)
+            best[i][1] = min(best[i][1], merge_time)
+
+    return [(len(frames) / p, len(frames) / m) for p, m in best]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="CANDecoder micro-benchmark")
+    arg_parser.add_argument("trace", nargs="?", help="PCAN .trc file (default: synthetic)")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="runs per measurement")
+    arg_parser.add_argument("--baseline", metavar="GIT_REF", help="compare against can_decoder.py from this git ref")
+    args = arg_parser.parse_args()
+
+    frames = load_frames(args.trace)
+    source = os.path.basename(args.trace) if args.trace else "synthetic"
+    print(f"Frames: {len(frames)} ({source}), best of {args.repeat}")
+    print(f"{'decoder':<20} {'parse [frames/s]':>18} {'parse+merge [frames/s]':>24}")
+
+    results = []
+    if args.baseline:
+        results.append((args.baseline, load_decoder_class(args.baseline)))
+    results.append(("working tree", load_decoder_class()))
+
+    measured = bench([decoder_cls for _, decoder_cls in results], frames, args.repeat)
+    for (name, _), (parse_fps, merge_fps) in zip(results, measured):
+        print(f"{name:<20} {parse_fps:>18,.0f} {merge_fps:>24,.0f}")
+
+    if len(measured) == 2:
+        (base_parse, base_merge), (cur_parse, cur_merge) = measured
+        print(f"{'speedup':<20} {cur_parse / base_parse:>17.2f}x {cur_merge / base_merge:>23.2f}x")
+    
+    # Change-Detection (unveränderte Payloads überspringen)
+    cached_fps, stats = run_cached(load_decoder_class(), frames, args.repeat)
+    print(f"\nparse_if_changed+merge: {cached_fps:,.0f} frames/s "
+          f"({cached_fps / measured[-1][1]:.2f}x vs. parse+merge)")
+    print(f"cache: {stats['hits']} hits, {stats['misses']} misses "
+          f"({stats['hit_rate']:.1%} unchanged)")
+
+
+if __name__ == "__main__":
+    main()
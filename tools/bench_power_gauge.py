@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+bench_power_gauge.py
+Offscreen-Benchmark für PowerGauge: ms pro Frame beim Zeichnen.
+
+Usage:
+  python3 tools/bench_power_gauge.py [--frames N] [--size WxH] [--baseline GIT_REF]
+
+Gemessen wird (mit QT_QPA_PLATFORM=offscreen, kein Display nötig):
+  - full:  repaint() des kompletten Widgets mit wechselndem Wert
+           (reine Zeichenkosten pro Frame)
+  - drive: set_power() + Event-Verarbeitung mit einem Fahrprofil bei 10 Hz
+           (leichtes Rauschen, Konstantfahrt, Beschleunigen/Rekuperieren) -
+           so wie im Dashboard; zählt zusätzlich die tatsächlichen Repaints
+
+Mit --baseline wird widgets.py aus dem angegebenen Git-Stand geladen und
+gegen den aktuellen Stand gemessen (z.B. --baseline HEAD~1).
+"""
+
+import os
+import sys
+import math
+import time
+import random
+import argparse
+import subprocess
+import importlib.util
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+
+
+def load_gauge_class(git_ref=None):
+    """Lädt PowerGauge aus dem Arbeitsverzeichnis oder einem Git-Stand."""
+    if git_ref is None:
+        from widgets import PowerGauge
+        return PowerGauge
+
+    source = subprocess.run(
+        ["git", "-C", REPO_DIR, "show", f"{git_ref}:widgets.py"],
+        capture_output=True, text=True, check=True
+    ).stdout
+    spec = importlib.util.spec_from_loader(f"widgets_{git_ref}", loader=None)
+    module = importlib.util.module_from_spec(spec)
+    exec(compile(source, f"{git_ref}:widgets.py", "exec"), module.__dict__)
+    return module.PowerGauge
+
+
+def counting(gauge_cls):
+    """Unterklasse, die paintEvent-Aufrufe zählt."""
+    class CountingGauge(gauge_cls):
+        paints = 0
+
+        def paintEvent(self, event):
+            CountingGauge.paints += 1
+            super().paintEvent(event)
+
+    return CountingGauge
+
+
+def drive_profile(frames, seed=42):
+    """Leistungswerte (kW) bei 10 Hz: Stand, Konstantfahrt, Beschleunigen, Rekuperieren."""
+    rng = random.Random(seed)
+    values = []
+    for i in range(frames):
+        phase = (i // 300) % 4
+        if phase == 0:
+            base = 0.4                                  # Stand (Nebenverbraucher)
+        elif phase == 1:
+            base = 8.0                                  # Konstantfahrt
+        elif phase == 2:
+            base = 8.0 + 30.0 * math.sin(i / 40.0) ** 2  # Beschleunigen
+        else:
+            base = -12.0 * abs(math.sin(i / 50.0))      # Rekuperieren
+        values.append(round(base + rng.gauss(0.0, 0.05), 2))
+    return values
+
+
+def bench_full(app, gauge_cls, frames, size):
+    """repaint() mit wechselndem Wert: gibt ms pro Frame zurück."""
+    gauge = gauge_cls()
+    gauge.resize(*size)
+    gauge.show()
+    app.processEvents()
+
+    start = time.perf_counter()
+    for i in range(frames):
+        gauge.power_kw = -50.0 + (i * 7.3) % 250.0
+        gauge.repaint()
+    elapsed = time.perf_counter() - start
+    gauge.close()
+    return elapsed * 1000.0 / frames
+
+
+def bench_drive(app, gauge_cls, frames, size):
+    """Fahrprofil: gibt (ms pro Frame, Anzahl Repaints) zurück."""
+    cls = counting(gauge_cls)
+    gauge = cls()
+    gauge.resize(*size)
+    gauge.show()
+    app.processEvents()
+    cls.paints = 0
+
+    values = drive_profile(frames)
+    start = time.perf_counter()
+    for power in values:
+        gauge.set_power(power)
+        app.processEvents()
+    elapsed = time.perf_counter() - start
+    gauge.close()
+    return elapsed * 1000.0 / frames, cls.paints
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="PowerGauge offscreen paint benchmark")
+    arg_parser.add_argument("--frames", type=int, default=2000, help="frames per measurement")
+    arg_parser.add_argument("--size", default="600x300", help="widget size WxH")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="runs per measurement")
+    arg_parser.add_argument("--baseline", metavar="GIT_REF", help="compare against widgets.py from this git ref")
+    args = arg_parser.parse_args()
+
+    size = tuple(int(v) for v in args.size.lower().split("x"))
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    results = []
+    if args.baseline:
+        results.append((args.baseline, load_gauge_class(args.baseline)))
+    results.append(("working tree", load_gauge_class()))
+
+    print(f"PowerGauge {size[0]}x{size[1]}, {args.frames} frames, best of {args.repeat} "
+          f"(platform: {app.platformName()})")
+    print(f"{'widgets':<20} {'full [ms/frame]':>16} {'drive [ms/frame]':>17} {'repaints':>9}")
+
+    measured = []
+    for name, gauge_cls in results:
+        bench_full(app, gauge_cls, 50, size)  # Aufwärmen (Fonts, Caches)
+        full = min(bench_full(app, gauge_cls, args.frames, size) for _ in range(args.repeat))
+        drive = [bench_drive(app, gauge_cls, args.frames, size) for _ in range(args.repeat)]
+        drive_ms = min(ms for ms, _ in drive)
+        paints = drive[0][1]
+        measured.append((full, drive_ms))
+        print(f"{name:<20} {full:>16.3f} {drive_ms:>17.3f} {paints:>9}")
+
+    if len(measured) == 2:
+        (base_full, base_drive), (cur_full, cur_drive) = measured
+        print(f"{'speedup':<20} {base_full / cur_full:>15.2f}x {base_drive / cur_drive:>16.2f}x")
+
+
+if __name__ == "__main__":
+    main()
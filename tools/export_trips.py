@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+export_trips.py
+Exportiert Trips oder einen Zeitraum aus der Dashboard-Datenbank als
+Parquet/Arrow (mit pyarrow) oder gzip-CSV für die Offline-Analyse.
+
+Usage:
+  python3 tools/export_trips.py OUTPUT [--db PATH] [--trip ID ...] [--unsynced]
+                                [--since DATE] [--until DATE]
+                                [--format parquet|arrow|csv] [--columns a,b,...]
+
+Beispiele:
+  # Alle noch nicht gesicherten Trips als Parquet
+  python3 tools/export_trips.py export/trips.parquet --unsynced
+
+  # Zeitraum als CSV (ohne pyarrow)
+  python3 tools/export_trips.py export/nov.csv.gz --since 2025-11-01 --until 2025-11-30
+
+Die Datenbank wird nur gelesen und kann dabei vom Dashboard beschrieben
+werden. Ohne --trip/--unsynced werden alle Samples im Zeitraum exportiert.
+"""
+
+import os
+import sys
+import sqlite3
+import argparse
+import logging
+from datetime import datetime
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from db_manager import DBManager
+from trip_export import TripExporter, FORMATS, PYARROW_AVAILABLE, format_for_path, default_format
+
+
+def parse_date(value: str) -> datetime:
+    """YYYY-MM-DD oder YYYY-MM-DDTHH:MM[:SS] (lokale Zeit)."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date: {value}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Export trips to Parquet/Arrow/CSV")
+    arg_parser.add_argument("output", help="output file (.parquet, .arrow, .csv.gz)")
+    arg_parser.add_argument("--db", help="database path (default: $TC_DB_PATH)")
+    arg_parser.add_argument("--trip", type=int, action="append", dest="trips", metavar="ID",
+                            help="trip id (repeatable)")
+    arg_parser.add_argument("--unsynced", action="store_true", help="all finished, not yet synced trips")
+    arg_parser.add_argument("--since", type=parse_date, help="start of time range")
+    arg_parser.add_argument("--until", type=parse_date, help="end of time range")
+    arg_parser.add_argument("--format", choices=FORMATS, help="default: from file extension")
+    arg_parser.add_argument("--columns", help="comma-separated signals (default: all)")
+    arg_parser.add_argument("--chunk-size", type=int, default=16384, help="rows per row group")
+    args = arg_parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    fmt = args.format or format_for_path(args.output) or default_format()
+    if fmt in ("parquet", "arrow") and not PYARROW_AVAILABLE:
+        arg_parser.error("pyarrow not installed (pip3 install pyarrow), use --format csv")
+
+    try:
+        db = DBManager(args.db, read_only=True)
+    except (RuntimeError, OSError, sqlite3.Error) as e:
+        arg_parser.error(str(e))
+
+    trip_ids = args.trips
+    if args.unsynced:
+        trip_ids = (trip_ids or []) + [
+            trip["trip_id"] for trip in db.iter_trips(synced=False, start=args.since, end=args.until)
+        ]
+        if not trip_ids:
+            print("No unsynced trips")
+            return
+
+    columns = args.columns.split(",") if args.columns else None
+    exporter = TripExporter(db, columns=columns, chunk_size=args.chunk_size)
+    result = exporter.export(
+        args.output, fmt=fmt, trip_ids=trip_ids, start=args.since, end=args.until
+    )
+
+    db_size = os.path.getsize(db.db_path)
+    print(f"{result['rows']} samples -> {args.output} ({result['format']})")
+    print(f"{result['bytes'] / 1024:.0f} KB in {result['seconds']:.1f} s "
+          f"(database: {db_size / 1024:.0f} KB)")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,9 @@ import json
 import time
 import subprocess
 import socket
+import sqlite3
 from datetime import datetime
+from urllib.request import pathname2url
 
 CONFIG_FILE = os.path.expanduser("~/thinkcity-dashboard-v3/config.json")
 LOG_FILE = os.path.expanduser("~/thinkcity-dashboard-v3/nas_sync.log")
@@ -78,6 +80,25 @@ def check_nas_reachable(host, timeout=5):
         log(f"NAS reachability check error: {e}")
         return False
 
+def checkpoint_database(db_path):
+    """
+    Schreibt das WAL des Dashboards in die DB-Datei zurück, damit die
+    kopierte .db alle Commits enthält (-wal/-shm werden nicht kopiert).
+    mode=rw legt bei falschem Pfad keine leere DB an.
+    """
+    try:
+        uri = f"file:{pathname2url(os.path.abspath(db_path))}?mode=rw"
+        conn = sqlite3.connect(uri, uri=True, timeout=10)
+        try:
+            busy, wal_pages, done_pages = conn.execute(
+                "PRAGMA wal_checkpoint(FULL)"
+            ).fetchone()
+        finally:
+            conn.close()
+        log(f"WAL checkpoint: {done_pages}/{wal_pages} pages (busy={busy})")
+    except sqlite3.Error as e:
+        log(f"WAL checkpoint error: {e}")
+
 def sync_database(config):
     """Synchronisiere Datenbank via rsync."""
     db_path = config.get('db_path', '/home/pi/thinkcity-dashboard-v3/thinkcity.db')
@@ -91,6 +112,7 @@ def sync_database(config):
     
     try:
         # rsync mit SSH (oder SMB/CIFS wenn mount)
+        checkpoint_database(db_path)
         log(f"Syncing {db_path} to {remote_file}...")
         
         # Option 1: rsync via SSH
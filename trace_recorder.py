@@ -56,6 +56,9 @@ class TraceRecorder:
         
         # Auto-stop threshold (MB)
         self.min_free_space_mb = 100
+        
+        # Optional callback(active: bool) on start/stop, e.g. to widen CAN filters
+        self.on_recording_changed: Optional[Callable[[bool], None]] = None
     
     def start_recording(self, filename: Optional[str] = None) -> bool:
         """
@@ -118,6 +121,8 @@ class TraceRecorder:
                 self.recording_thread = threading.Thread(target=self._writer_thread, daemon=True)
                 self.recording_thread.start()
                 
+                self._notify_recording_changed(True)
+                
                 print(f"✓ Recording started: {os.path.basename(self.current_filepath)}")
                 return True
                 
@@ -168,6 +173,8 @@ class TraceRecorder:
                 'end_time': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             }
             
+            self._notify_recording_changed(False)
+            
             print(f"✓ Recording stopped: {stats['filename']}")
             print(f"  Duration: {stats['duration_seconds']:.1f}s")
             print(f"  Messages: {stats['message_count']}")
@@ -233,6 +240,15 @@ class TraceRecorder:
         except Full:
             print("Warning: Recording queue full, dropping message")
     
+    def _notify_recording_changed(self, active: bool):
+        """Informs the registered callback about start/stop."""
+        if self.on_recording_changed is None:
+            return
+        try:
+            self.on_recording_changed(active)
+        except Exception as e:
+            print(f"Warning: recording callback failed: {e}")
+    
     def get_free_space_mb(self) -> float:
         """Get free storage space in MB."""
         try:
@@ -171,8 +171,8 @@ TRANSLATIONS = {
         "EN": "Frames: 0 | IDs: 0 | Rate: 0.0 fps"
     },
     "buffer_auto_clear": {
-        "DE": "💡 Puffer wird automatisch bei 500 Frames geleert",
-        "EN": "💡 Buffer auto-clears at 500 frames"
+        "DE": "💡 Terminal zeigt die letzten 500 Frames",
+        "EN": "💡 Terminal keeps the last 500 frames"
     },
     "known_can_ids": {
         "DE": "📋 Bekannte CAN-IDs",
@@ -198,6 +198,30 @@ TRANSLATIONS = {
         "DE": "Letzte Aktualisierung",
         "EN": "Last Update"
     },
+    "frame_count": {
+        "DE": "Frames",
+        "EN": "Frames"
+    },
+    "frame_rate": {
+        "DE": "Rate (fps)",
+        "EN": "Rate (fps)"
+    },
+    "cycle_time": {
+        "DE": "Zyklus (ms)",
+        "EN": "Cycle (ms)"
+    },
+    "jitter": {
+        "DE": "Jitter (ms)",
+        "EN": "Jitter (ms)"
+    },
+    "unknown_can_id": {
+        "DE": "Unbekannt",
+        "EN": "Unknown"
+    },
+    "byte_diff_hint": {
+        "DE": "CAN-ID in der Tabelle wählen, um geänderte Bytes zu sehen",
+        "EN": "Select a CAN ID in the table to see changing bytes"
+    },
     "can_terminal": {
         "DE": "CAN Terminal",
         "EN": "CAN Terminal"
@@ -416,6 +440,14 @@ TRANSLATIONS = {
         "DE": "Info: Im Simulations-Modus werden zufällige Demo-Daten generiert",
         "EN": "Info: Simulation mode generates random demo data"
     },
+    "can_filter_label": {
+        "DE": "Kernel-Filter (nur bekannte CAN-IDs empfangen)",
+        "EN": "Kernel filter (receive known CAN IDs only)"
+    },
+    "can_filter_info": {
+        "DE": "Info: Reduziert die CPU-Last. Während einer Trace-Aufnahme wird automatisch der komplette Bus empfangen",
+        "EN": "Info: Reduces CPU load. The full bus is received automatically while a trace recording is running"
+    },
     
     # Network Settings
     "network_settings": {
@@ -633,8 +665,8 @@ TRANSLATIONS = {
         "EN": "Speed"
     },
     "field_soc": {
-        "DE": "Ladezustand (SOC)",
-        "EN": "State of Charge (SOC)"
+        "DE": "Ladezustand",
+        "EN": "State of Charge"
     },
     "field_voltage": {
         "DE": "Spannung",
@@ -657,8 +689,8 @@ TRANSLATIONS = {
         "EN": "Ambient Temperature"
     },
     "field_consumption": {
-        "DE": "Verbrauch Wh/km",
-        "EN": "Consumption Wh/km"
+        "DE": "Verbrauch",
+        "EN": "Consumption"
     },
     "field_range": {
         "DE": "Reichweite",
@@ -704,6 +736,18 @@ TRANSLATIONS = {
         "DE": "Ø Verbrauch zurücksetzen",
         "EN": "Reset Avg Consumption"
     },
+    "reset_consumption_info": {
+        "DE": "Ø Verbrauch zurücksetzen: Setzt den gespeicherten Durchschnittsverbrauch zurück",
+        "EN": "Reset Avg Consumption: Resets the stored average consumption"
+    },
+    "reset_soh": {
+        "DE": "SOH zurücksetzen",
+        "EN": "SOH Reset"
+    },
+    "reset_soh_info": {
+        "DE": "SOH: Setzt den State of Health auf 100% zurück (nach Batterietausch)",
+        "EN": "SOH: Resets State of Health to 100% (after battery replacement)"
+    },
     "reset_consumption_confirm": {
         "DE": "Durchschnittlichen Verbrauch wirklich zurücksetzen?\n\nAlle gespeicherten Statistiken gehen verloren!",
         "EN": "Really reset average consumption?\n\nAll saved statistics will be lost!"
@@ -886,26 +930,86 @@ class Translator:
                 language = "DE"
         
         self.language = language
+        self.listeners = []  # callback(language) bei Sprachwechsel
+        self._build_table()
+    
+    def _build_table(self):
+        """Flache Tabelle key -> Text für die aktive Sprache (Fallback DE)."""
+        table = {}
+        for key, texts in TRANSLATIONS.items():
+            text = texts.get(self.language, texts.get("DE"))
+            if text is not None:
+                table[key] = text
+        self.table = table
     
     def set_language(self, language):
-        """Change current language."""
-        if language in ["DE", "EN"]:
-            self.language = language
-        else:
+        """Change current language (listeners are notified if it changed)."""
+        if language not in ["DE", "EN"]:
             print(f"Warning: Language '{language}' not supported, using 'DE'")
-            self.language = "DE"
+            language = "DE"
+        if language == self.language:
+            return
+        
+        self.language = language
+        self._build_table()
+        for callback in list(self.listeners):
+            callback(language)
+    
+    def add_listener(self, callback):
+        """callback(language) wird nach jedem Sprachwechsel aufgerufen."""
+        if callback not in self.listeners:
+            self.listeners.append(callback)
+    
+    def remove_listener(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
     
     def get(self, key, fallback=None):
         """Get translation for key in current language."""
-        if key in TRANSLATIONS:
-            return TRANSLATIONS[key].get(self.language, TRANSLATIONS[key].get("DE", fallback or key))
-        return fallback or key
+        text = self.table.get(key)
+        if text is None:
+            return fallback or key
+        return text
     
     def __call__(self, key, fallback=None):
         """Allow calling translator directly: t('key')"""
         return self.get(key, fallback)
 
 
+class TranslatedTexts:
+    """
+    Übersetzbare Texte eines Screens.
+    
+    add() setzt den Text sofort und merkt sich Widget, Setter, Key und
+    Vorlage; retranslate() setzt nach einem Sprachwechsel alle Texte neu,
+    ohne die Widgets neu zu erzeugen.
+    """
+    
+    def __init__(self, translator=None):
+        self.translator = translator or get_translator()
+        self.entries = []  # (widget, setter-Name, key, Vorlage)
+    
+    def add(self, widget, key, template="{}", setter=None):
+        """
+        Registriert einen Text und gibt das Widget zurück, z.B.
+        title = texts.add(QLabel(), "settings")
+        texts.add(QLabel(), "password", "{}:")
+        texts.add(line_edit, "ssid_placeholder", setter="setPlaceholderText")
+        """
+        if setter is None:
+            # QGroupBox hat setTitle statt setText
+            setter = "setText" if hasattr(widget, "setText") else "setTitle"
+        self.entries.append((widget, setter, key, template))
+        getattr(widget, setter)(template.format(self.translator.get(key)))
+        return widget
+    
+    def retranslate(self):
+        """Setzt alle registrierten Texte in der aktiven Sprache."""
+        get = self.translator.get
+        for widget, setter, key, template in self.entries:
+            getattr(widget, setter)(template.format(get(key)))
+
+
 # Global translator instance
 _translator = Translator()
 
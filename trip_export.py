@@ -0,0 +1,202 @@
+# trip_export.py
+# Export von Trips oder Zeiträumen aus der Dashboard-DB für die Offline-Analyse
+#
+# Formate:
+#   parquet - spaltenweise, komprimiert (pyarrow), eine Row-Group pro Block
+#   arrow   - Arrow IPC / Feather v2 (pyarrow), ein Record-Batch pro Block
+#   csv     - gzip-komprimiertes CSV (Fallback ohne pyarrow)
+#
+# Die Samples werden blockweise aus DBManager.iter_sample_chunks gelesen und
+# sofort geschrieben, der Speicherbedarf hängt nur von chunk_size ab.
+# CLI: tools/export_trips.py
+
+import os
+import csv
+import gzip
+import json
+import math
+import time
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Iterable, Iterator
+
+import signal_db
+from db_manager import DBManager, NUMPY_AVAILABLE, from_epoch_ms
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+FORMATS = ("parquet", "arrow", "csv")
+
+# Ganzzahlige Spalten, alle anderen sind float64 (NaN/null = kein Wert)
+INTEGER_COLUMNS = ("trip_id", "ts")
+
+
+def default_format() -> str:
+    """Parquet wenn pyarrow installiert ist, sonst CSV."""
+    return "parquet" if PYARROW_AVAILABLE else "csv"
+
+
+def format_for_path(path: str) -> Optional[str]:
+    """Format aus der Dateiendung (None wenn unbekannt)."""
+    lower = path.lower()
+    if lower.endswith(".parquet"):
+        return "parquet"
+    if lower.endswith((".arrow", ".feather", ".ipc")):
+        return "arrow"
+    if lower.endswith((".csv", ".csv.gz")):
+        return "csv"
+    return None
+
+
+class TripExporter:
+    """
+    Schreibt Samples ausgewählter Trips bzw. eines Zeitraums in eine Datei.
+
+    Spalten: trip_id, ts (Epoch-ms), danach die gewählten Signale. Einheiten
+    stehen bei Parquet/Arrow in den Schema-Metadaten ("units").
+    """
+
+    def __init__(
+        self,
+        db_manager: DBManager,
+        columns: Optional[Iterable[str]] = None,
+        chunk_size: int = 16384,
+        compression: str = "zstd"
+    ):
+        self.db_manager = db_manager
+        self.columns = list(columns) if columns else db_manager.get_signal_names()
+        self.chunk_size = chunk_size
+        self.compression = compression
+
+    def export(
+        self,
+        path: str,
+        fmt: Optional[str] = None,
+        trip_ids: Optional[Iterable[int]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Exportiert die Samples der Trips (oder, ohne trip_ids, aller Samples
+        im Zeitraum start..end).
+
+        Returns:
+            Statistik: format, rows, trips, bytes, seconds
+        """
+        fmt = fmt or format_for_path(path) or default_format()
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown export format: {fmt}")
+        if fmt != "csv" and not PYARROW_AVAILABLE:
+            raise RuntimeError(f"pyarrow not installed, {fmt} export not available (use csv)")
+
+        begin = time.monotonic()
+        trip_ids = list(trip_ids) if trip_ids is not None else None
+        chunks = self._iter_chunks(trip_ids, start, end)
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        if fmt == "csv":
+            rows = self._write_csv(path, chunks)
+        else:
+            rows = self._write_arrow(path, fmt, chunks)
+
+        return {
+            "format": fmt,
+            "rows": rows,
+            "trips": len(trip_ids) if trip_ids is not None else None,
+            "bytes": os.path.getsize(path),
+            "seconds": time.monotonic() - begin,
+        }
+
+    def _iter_chunks(
+        self,
+        trip_ids: Optional[List[int]],
+        start: Optional[datetime],
+        end: Optional[datetime]
+    ) -> Iterator[Dict[str, Any]]:
+        """Spaltenweise Blöcke (ohne sample_id), Trip für Trip."""
+        columns = ["trip_id"] + [name for name in self.columns if name not in ("trip_id", "ts")]
+        for trip_id in (trip_ids if trip_ids is not None else [None]):
+            for chunk in self.db_manager.iter_sample_chunks(
+                trip_id, columns, start, end, self.chunk_size, as_numpy=NUMPY_AVAILABLE
+            ):
+                chunk.pop("sample_id")
+                yield chunk
+
+    def _names(self) -> List[str]:
+        return ["trip_id", "ts"] + [name for name in self.columns if name not in ("trip_id", "ts")]
+
+    def _schema(self) -> "pa.Schema":
+        fields = [
+            pa.field(name, pa.int64() if name in INTEGER_COLUMNS else pa.float64())
+            for name in self._names()
+        ]
+        units = {name: signal_db.get_unit(name) for name in self._names() if signal_db.get_unit(name)}
+        metadata = {
+            "source": "thinkcity-dashboard",
+            "ts": "epoch milliseconds (UTC)",
+            "units": json.dumps(units),
+        }
+        return pa.schema(fields, metadata=metadata)
+
+    def _record_batch(self, chunk: Dict[str, Any], schema: "pa.Schema") -> "pa.RecordBatch":
+        arrays = []
+        for field in schema:
+            column = chunk[field.name]
+            if not NUMPY_AVAILABLE:
+                column = column.tolist()
+            # NaN (kein Wert) wird in Parquet/Arrow zu null
+            arrays.append(pa.array(column, type=field.type, from_pandas=True))
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def _write_arrow(self, path: str, fmt: str, chunks: Iterator[Dict[str, Any]]) -> int:
+        """Parquet (Row-Group pro Block) oder Arrow IPC (Record-Batch pro Block)."""
+        schema = self._schema()
+        rows = 0
+        if fmt == "parquet":
+            writer = pq.ParquetWriter(path, schema, compression=self.compression)
+        else:
+            options = pa.ipc.IpcWriteOptions(compression=self.compression)
+            writer = pa.ipc.new_file(path, schema, options=options)
+
+        try:
+            for chunk in chunks:
+                batch = self._record_batch(chunk, schema)
+                if fmt == "parquet":
+                    writer.write_table(pa.Table.from_batches([batch]), row_group_size=self.chunk_size)
+                else:
+                    writer.write_batch(batch)
+                rows += batch.num_rows
+        finally:
+            writer.close()
+        return rows
+
+    def _write_csv(self, path: str, chunks: Iterator[Dict[str, Any]]) -> int:
+        """gzip-CSV mit Kopfzeile, zusätzlich lesbare Zeit; leere Felder = kein Wert."""
+        names = self._names()
+        rows = 0
+        with gzip.open(path, "wt", newline="", compresslevel=6) as f:
+            writer = csv.writer(f)
+            writer.writerow(["time"] + names)
+            for chunk in chunks:
+                columns = [chunk[name] for name in names]
+                for values in zip(*columns):
+                    writer.writerow(
+                        [from_epoch_ms(int(values[1])).isoformat(timespec="milliseconds")]
+                        + [_csv_value(value) for value in values]
+                    )
+                rows += len(columns[0])
+        return rows
+
+
+def _csv_value(value) -> str:
+    """NaN als leeres Feld, ganze Zahlen ohne Nachkommastellen."""
+    value = float(value)
+    if math.isnan(value):
+        return ""
+    if value.is_integer():
+        return str(int(value))
+    return repr(value)
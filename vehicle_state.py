@@ -0,0 +1,216 @@
+# vehicle_state.py
+# Fahrzeug-Zustand mit Versionszähler und Publish/Subscribe.
+# Bleibt ein dict (Subklasse), damit Decoder, Trip-Computer, SOH-Tracker und
+# Screens unverändert mit get()/[]/update() arbeiten.
+# Widgets können einzelne Keys abonnieren (subscribe) und bekommen geänderte
+# Werte gesammelt einmal pro UI-Tick (publish).
+
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """
+    Abo auf einen oder mehrere State-Keys.
+    callback(*werte) wird mit den Werten in Key-Reihenfolge aufgerufen
+    (None für fehlende Keys) - nur wenn sich mindestens ein Wert seit dem
+    letzten Aufruf geändert hat.
+    """
+
+    __slots__ = ("keys", "callback", "last", "active")
+
+    def __init__(self, keys: Tuple[str, ...], callback: Callable[..., None]):
+        self.keys = keys
+        self.callback = callback
+        self.last: Optional[Tuple[Any, ...]] = None  # zuletzt ausgelieferte Werte
+        self.active = True
+
+    def __repr__(self) -> str:
+        return f"Subscription({self.keys!r}, active={self.active})"
+
+
+class VehicleState(dict):
+    """
+    Zustand aller Fahrzeugwerte.
+
+    - Lesen wie bei einem dict (get, [], in, items); get() und [] laufen
+      über die dict-Implementierung, kosten durch die Subklasse aber etwas
+      mehr als bei einem reinen dict
+    - Schreiben (update, []) erhöht version einmal pro Änderungsaufruf und
+      merkt sich bei bestehenden Abos die geänderten Keys für publish();
+      update() kostet dadurch etwa das Doppelte von dict.update
+    - Publish/Subscribe: subscribe() bindet Callbacks an Keys, publish()
+      liefert alle seit dem letzten Aufruf geänderten Werte gesammelt aus
+      (einmal pro Frame statt pro CAN-Nachricht)
+
+    Hinweis: Listen-Werte (z.B. cell_voltages) ersetzen statt in-place
+    ändern, sonst erkennt publish() die Änderung nicht.
+    """
+
+    __slots__ = ("version", "_subs_by_key", "_dirty", "_pending")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.version = 0
+        # Abos je Key, seit dem letzten publish() geänderte Keys und
+        # (re-)aktivierte Abos, die beim nächsten publish() geprüft werden
+        self._subs_by_key: Dict[str, List[Subscription]] = {}
+        self._dirty: Set[str] = set()
+        self._pending: List[Subscription] = []
+        if args or kwargs:
+            self.update(*args, **kwargs)
+
+    # --- Schreibzugriffe (mit Version) ------------------------------------
+
+    def __setitem__(self, key: str, value: Any):
+        dict.__setitem__(self, key, value)
+        self.version += 1
+        if self._subs_by_key:
+            self._dirty.add(key)
+
+    def __delitem__(self, key: str):
+        dict.__delitem__(self, key)
+        self.version += 1
+        if self._subs_by_key:
+            self._dirty.add(key)
+
+    def update(self, other=(), **kwargs):
+        """Übernimmt mehrere Werte (eine Version)."""
+        if kwargs or not isinstance(other, dict):
+            other = dict(other, **kwargs)
+        dict.update(self, other)
+        self.version += 1
+        if self._subs_by_key:
+            self._dirty.update(other)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def pop(self, key: str, *default) -> Any:
+        if key in self:
+            self.version += 1
+            if self._subs_by_key:
+                self._dirty.add(key)
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        item = dict.popitem(self)
+        self.version += 1
+        if self._subs_by_key:
+            self._dirty.add(item[0])
+        return item
+
+    def clear(self):
+        if self._subs_by_key:
+            self._dirty.update(self)
+        dict.clear(self)
+        self.version += 1
+
+    def copy(self) -> "VehicleState":
+        """Kopie der Werte (ohne Abos)."""
+        new = VehicleState()
+        dict.update(new, self)
+        new.version = self.version
+        return new
+
+    def __reduce__(self):
+        return (VehicleState, (dict(self),))
+
+    def __repr__(self) -> str:
+        return f"VehicleState(version={self.version}, {dict.__repr__(self)})"
+
+    # --- Zusatzfunktionen ------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Kopie als normales dict (z.B. für DB-Logging oder JSON)."""
+        return dict(self)
+
+    # --- Publish/Subscribe -----------------------------------------------
+
+    def subscribe(self, keys: Union[str, Iterable[str]],
+                  callback: Callable[..., None]) -> Subscription:
+        """
+        Abonniert einen oder mehrere Keys.
+
+        Der Callback bekommt beim nächsten publish() die aktuellen Werte
+        (auch wenn sie noch fehlen → None), danach nur noch bei Änderungen.
+        """
+        keys = (keys,) if isinstance(keys, str) else tuple(keys)
+        sub = Subscription(keys, callback)
+        for key in keys:
+            self._subs_by_key.setdefault(key, []).append(sub)
+        self._pending.append(sub)
+        return sub
+
+    def unsubscribe(self, subscriptions: Iterable[Subscription]):
+        """Entfernt Abos (z.B. wenn ein Screen gelöscht wird)."""
+        for sub in subscriptions:
+            sub.active = False
+            for key in sub.keys:
+                subs = self._subs_by_key.get(key)
+                if subs and sub in subs:
+                    subs.remove(sub)
+                    if not subs:
+                        del self._subs_by_key[key]
+
+    def set_active(self, subscriptions: Iterable[Subscription], active: bool):
+        """
+        Pausiert/aktiviert Abos (z.B. für nicht sichtbare Screens).
+        Beim Aktivieren werden verpasste Änderungen mit dem nächsten
+        publish() nachgeliefert.
+        """
+        for sub in subscriptions:
+            if active and not sub.active:
+                self._pending.append(sub)
+            sub.active = active
+
+    def resend(self, subscriptions: Iterable[Subscription]):
+        """
+        Liefert die aktuellen Werte beim nächsten publish() erneut aus,
+        auch wenn sie sich nicht geändert haben (z.B. nach Sprachwechsel).
+        Pausierte Abos bekommen sie beim Aktivieren.
+        """
+        for sub in subscriptions:
+            sub.last = None
+            if sub.active:
+                self._pending.append(sub)
+
+    def publish(self) -> int:
+        """
+        Liefert alle seit dem letzten Aufruf geänderten Werte an die
+        aktiven Abos aus (ein Aufruf pro Abo, auch wenn mehrere Keys
+        geändert wurden). Gibt die Anzahl der Callback-Aufrufe zurück.
+        """
+        if not self._dirty and not self._pending:
+            return 0
+
+        dirty, self._dirty = self._dirty, set()
+        # Reihenfolge: erst (re-)aktivierte Abos, dann geänderte Keys;
+        # dict.fromkeys entfernt Duplikate
+        candidates = dict.fromkeys(self._pending)
+        self._pending = []
+        subs_by_key = self._subs_by_key
+        for key in dirty:
+            subs = subs_by_key.get(key)
+            if subs:
+                candidates.update(dict.fromkeys(subs))
+
+        get = self.get
+        delivered = 0
+        for sub in candidates:
+            if not sub.active:
+                continue
+            values = tuple([get(key) for key in sub.keys])
+            if values == sub.last:
+                continue  # Wert zurückgesetzt/gleich geblieben → kein Repaint
+            sub.last = values
+            delivered += 1
+            try:
+                sub.callback(*values)
+            except Exception:
+                logger.exception(f"State subscriber for {sub.keys} failed")
+        return delivered
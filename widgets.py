@@ -1,10 +1,27 @@
 # widgets.py
 # Reusable UI widgets for ThinkCity Dashboard
 
+# Alle Setter lösen nur dann ein Repaint aus, wenn sich die Anzeige
+# tatsächlich ändert - die Screens rufen sie über State-Abos auf.
+
 from PyQt5.QtWidgets import QWidget
-from PyQt5.QtCore import Qt, QRect, QPoint, QRectF
-from PyQt5.QtGui import QPainter, QColor, QPen, QBrush, QFont, QPainterPath, QLinearGradient
+from PyQt5.QtCore import Qt, QRect, QPoint, QPointF, QRectF, QTimer
+from PyQt5.QtGui import QPainter, QColor, QPen, QBrush, QFont, QPainterPath, QLinearGradient, QPixmap
+from datetime import datetime
 import math
+import time
+
+
+def set_label_text(label, text: str):
+    """QLabel.setText nur bei geändertem Text (spart Layout + Repaint)."""
+    if label.text() != text:
+        label.setText(text)
+
+
+def set_label_style(label, style: str):
+    """QLabel.setStyleSheet nur bei geändertem Stil (Re-Polish ist teuer)."""
+    if label.styleSheet() != style:
+        label.setStyleSheet(style)
 
 
 class PowerGauge(QWidget):
@@ -17,6 +34,14 @@ class PowerGauge(QWidget):
     - -50 to 0 kW: Linear (25% des Bogens)
     - 0 to +30 kW: Linear (40% des Bogens) - wichtigster Bereich
     - +30 to +200 kW: Komprimiert (35% des Bogens)
+    
+    Rendering:
+    - Statischer Teil (Hintergrund, Farbsegmente, Skala, "kW") wird einmal
+      in ein QPixmap gezeichnet und erst bei Größenänderung neu erzeugt
+    - Pro Frame nur Pixmap blitten + Zeiger + Zahlenwert
+    - Kein Repaint, solange sich der Zeiger-Endpunkt gegenüber dem zuletzt
+      gezeichneten um weniger als 1 Pixel bewegt und der Text gleich bleibt;
+      sonst nur der Bereich von altem/neuem Zeiger und Text
     """
     
     def __init__(self, parent=None):
@@ -25,11 +50,67 @@ class PowerGauge(QWidget):
         self.min_power = -50.0
         self.max_power = 200.0
         self.setMinimumSize(300, 180)
+        
+        self._background = None  # QPixmap mit dem statischen Teil
+        self._needle_end = None  # Zuletzt gezeichneter Zeiger-Endpunkt (QPointF)
+        self._text = self._format_power(self.power_kw)  # Zuletzt gezeichneter Text
     
     def set_power(self, power_kw: float):
-        """Setzt Leistungswert und triggert Redraw."""
-        self.power_kw = max(self.min_power, min(self.max_power, power_kw))
-        self.update()
+        """Setzt Leistungswert; Repaint nur wenn sich Zeiger-Pixel oder Text ändern."""
+        power_kw = max(self.min_power, min(self.max_power, power_kw))
+        if power_kw == self.power_kw:
+            return
+        self.power_kw = power_kw
+        
+        center, radius = self._geometry()
+        needle_end = self._needle_point(center, radius, power_kw)
+        drawn = self._needle_end
+        if drawn is not None and self._format_power(power_kw) == self._text:
+            dx = needle_end.x() - drawn.x()
+            dy = needle_end.y() - drawn.y()
+            if dx * dx + dy * dy < 1.0:
+                return  # Bewegung < 1 Pixel, Zahl unverändert
+        
+        dirty = self._dynamic_rect(center, needle_end)
+        if drawn is not None:
+            dirty = dirty.united(self._dynamic_rect(center, drawn))
+        self.update(dirty)
+    
+    def resizeEvent(self, event):
+        # Statischen Teil bei nächster Gelegenheit in neuer Größe zeichnen
+        self._background = None
+        self._needle_end = None
+        super().resizeEvent(event)
+    
+    @staticmethod
+    def _format_power(power_kw: float) -> str:
+        return f"{power_kw:+.0f}"
+    
+    def _geometry(self):
+        """Mittelpunkt und Radius des Bogens für die aktuelle Größe."""
+        w = self.width()
+        h = self.height()
+        center = QPoint(w // 2, h - 20)
+        radius = min(w, h * 2) // 2 - 40
+        return center, radius
+    
+    def _needle_point(self, center: QPoint, radius: int, power: float) -> QPointF:
+        """Zeiger-Endpunkt (Subpixel-genau, gezeichnet wird mit Antialiasing)."""
+        power_pct = self._power_to_angle_pct(power)
+        needle_angle = math.radians(180 - 180.0 * power_pct)
+        needle_length = radius - 15
+        return QPointF(
+            center.x() + needle_length * math.cos(needle_angle),
+            center.y() - needle_length * math.sin(needle_angle)
+        )
+    
+    def _text_rect(self, center: QPoint) -> QRect:
+        return QRect(self.width() - 180, center.y() - 60, 160, 60)
+    
+    def _dynamic_rect(self, center: QPoint, needle_end: QPointF) -> QRect:
+        """Bereich, den Zeiger (inkl. Mittelpunkt) und Zahlenwert belegen."""
+        needle = QRectF(QPointF(center), needle_end).normalized().toAlignedRect()
+        return needle.adjusted(-12, -12, 12, 12).united(self._text_rect(center))
     
     def _power_to_angle_pct(self, power: float) -> float:
         """
@@ -50,18 +131,22 @@ class PowerGauge(QWidget):
             # full power: 30 kW = 65%, 200 kW = 100%
             return 0.65 + 0.35 * ((power - 30.0) / 170.0)
     
-    def paintEvent(self, event):
-        painter = QPainter(self)
+    def _render_background(self) -> QPixmap:
+        """Zeichnet den statischen Teil (einmal pro Größe)."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Hintergrund
-        painter.fillRect(self.rect(), QColor(20, 20, 20))
+        painter.fillRect(QRect(0, 0, self.width(), self.height()), QColor(20, 20, 20))
         
         # Dimensionen
         w = self.width()
         h = self.height()
-        center = QPoint(w // 2, h - 20)
-        radius = min(w, h * 2) // 2 - 40
+        center, radius = self._geometry()
         
         rect = QRect(center.x() - radius, center.y() - radius,
                      radius * 2, radius * 2)
@@ -72,20 +157,35 @@ class PowerGauge(QWidget):
         # Skala-Striche mit Beschriftung zeichnen
         self._draw_scale(painter, center, radius, w, h)
         
+        # Einheit "kW" kleiner unter dem Zahlenwert
+        font_unit = QFont("Arial", 18)
+        painter.setFont(font_unit)
+        painter.setPen(QColor(150, 150, 150))
+        unit_rect = QRect(w - 180, center.y(), 160, 30)
+        painter.drawText(unit_rect, Qt.AlignRight | Qt.AlignVCenter, "kW")
+        
+        painter.end()
+        return pixmap
+    
+    def paintEvent(self, event):
+        if self._background is None:
+            self._background = self._render_background()
+        
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Statischer Teil (Clip auf den angeforderten Bereich macht Qt)
+        painter.drawPixmap(0, 0, self._background)
+        
         # Zeiger-Position berechnen
-        power_pct = self._power_to_angle_pct(self.power_kw)
-        angle_deg = 180.0 * power_pct
-        needle_angle = math.radians(180 - angle_deg)
-        needle_length = radius - 15
-        needle_end = QPoint(
-            center.x() + int(needle_length * math.cos(needle_angle)),
-            center.y() - int(needle_length * math.sin(needle_angle))
-        )
+        center, radius = self._geometry()
+        needle_end = self._needle_point(center, radius, self.power_kw)
+        self._needle_end = needle_end
         
         # Pointer line (white, clearly visible)
         pen = QPen(Qt.white, 4, Qt.SolidLine)
         painter.setPen(pen)
-        painter.drawLine(center, needle_end)
+        painter.drawLine(QPointF(center), needle_end)
         
         # Center point (white)
         painter.setBrush(QBrush(Qt.white))
@@ -97,17 +197,8 @@ class PowerGauge(QWidget):
         font = QFont("Arial", 36, QFont.Bold)
         painter.setFont(font)
         
-        text = f"{self.power_kw:+.0f}"
-        text_rect = QRect(w - 180, center.y() - 60, 160, 60)
-        painter.drawText(text_rect, Qt.AlignRight | Qt.AlignVCenter, text)
-        
-        # Einheit "kW" kleiner darunter
-        font_unit = QFont("Arial", 18)
-        painter.setFont(font_unit)
-        painter.setPen(QColor(150, 150, 150))
-        unit_rect = QRect(w - 180, center.y(), 160, 30)
-        painter.drawText(unit_rect, Qt.AlignRight | Qt.AlignVCenter, "kW")
-    
+        self._text = self._format_power(self.power_kw)
+        painter.drawText(self._text_rect(center), Qt.AlignRight | Qt.AlignVCenter, self._text)
     
     def _draw_colored_segments(self, painter, rect, center, radius):
         """Zeichnet statische farbige Segmente auf der Skala."""
@@ -203,22 +294,42 @@ class DigitalDisplay(QWidget):
         self.unit = unit
         self.value = 0.0
         self.decimals = 1
+        self.value_text = self._format(self.value)
         self.color = QColor(0, 255, 200)  # Cyan
         self.setMinimumSize(140, 100)
     
+    def _format(self, value: float) -> str:
+        return f"{value:.{self.decimals}f}"
+    
     def set_value(self, value: float):
-        """Setzt Wert und triggert Redraw."""
+        """Setzt Wert und triggert Redraw (nur wenn sich die Anzeige ändert)."""
         self.value = value
-        self.update()
+        text = self._format(value)
+        if text != self.value_text:
+            self.value_text = text
+            self.update()
     
     def set_color(self, color: QColor):
         """Setzt Farbe der Anzeige."""
+        if color == self.color:
+            return
         self.color = color
         self.update()
     
+    def set_label(self, label: str):
+        """Setzt die Beschriftung (z.B. nach Sprachwechsel)."""
+        if label == self.label:
+            return
+        self.label = label
+        self.update()
+    
     def set_decimals(self, decimals: int):
         """Setzt Anzahl Dezimalstellen."""
         self.decimals = decimals
+        text = self._format(self.value)
+        if text != self.value_text:
+            self.value_text = text
+            self.update()
     
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -250,9 +361,8 @@ class DigitalDisplay(QWidget):
         painter.setFont(font_value)
         painter.setPen(self.color)
         
-        value_text = f"{self.value:.{self.decimals}f}"
         value_rect = QRect(0, 30, w, 45)
-        painter.drawText(value_rect, Qt.AlignCenter, value_text)
+        painter.drawText(value_rect, Qt.AlignCenter, self.value_text)
         
         # Einheit (mittel, unten)
         font_unit = QFont("Arial", 14)
@@ -266,42 +376,93 @@ class StatusBar(QWidget):
     """
     Status-Leiste oben auf allen Screens: Datum, Uhrzeit, Außentemperatur.
     Zeigt kritische Warnungen mit reder Umrandung und Icon.
+    
+    Die Uhr läuft über einen eigenen Timer (nur solange sichtbar), Werte
+    kommen über State-Abos (bind) - neu gezeichnet wird nur, wenn sich Uhrzeit,
+    Warnung, Temperatur oder ein Status-Icon ändert bzw. etwas blinkt.
     """
     
+    # State-Keys für die Fehlerprüfung (_get_critical_warning)
+    WARNING_KEYS = ("iso_error", "emergency", "cell_voltages", "pack_temp_C", "waiting_temp_err")
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.ambient_temp = None
         self.state = {}  # Stores current state for error checking
+        self.warning = (None, None)  # Ergebnis von _get_critical_warning
         self.wifi_connected = False  # WLAN-Status
         self.replay_active = False  # Trace-Replay aktiv
         self.recording_active = False  # Trace-Recording aktiv
+        self.time_str = ""  # Zuletzt gezeichnete Uhrzeit
         self.setFixedHeight(30)  # Schmaler!
         self.setMinimumWidth(400)
+        
+        # Uhr/Blinken: 2 Hz, läuft nur solange die Leiste sichtbar ist
+        self.clock_timer = QTimer(self)
+        self.clock_timer.timeout.connect(self._on_clock_tick)
+    
+    def bind(self, state) -> list:
+        """Abonniert die benötigten Keys auf dem VehicleState, gibt die Abos zurück."""
+        return [
+            state.subscribe(self.WARNING_KEYS, self._on_warning_values),
+            state.subscribe("pcu_ambient_temp_C", self._on_ambient_temp),
+        ]
+    
+    def _on_warning_values(self, *values):
+        self.set_state(dict(zip(self.WARNING_KEYS, values)))
+    
+    def _on_ambient_temp(self, temp_c):
+        if temp_c is not None:
+            self.set_ambient_temp(temp_c)
     
     def set_ambient_temp(self, temp_c: float):
         """Setzt Außentemperatur."""
+        old = self.ambient_temp
         self.ambient_temp = temp_c
-        self.update()
+        if old is None or f"{old:.1f}" != f"{temp_c:.1f}":
+            self.update()
     
     def set_state(self, state: dict):
-        """Setzt kompletten State for Fehlerprüfung."""
+        """Setzt State for Fehlerprüfung (Repaint nur wenn sich die Warnung ändert)."""
         self.state = state
-        self.update()
+        warning = self._get_critical_warning()
+        if warning != self.warning:
+            self.warning = warning
+            self.update()
     
     def set_wifi_status(self, connected: bool):
         """Setzt WLAN-Verbindungsstatus."""
-        self.wifi_connected = connected
-        self.update()
+        if connected != self.wifi_connected:
+            self.wifi_connected = connected
+            self.update()
     
     def set_replay_status(self, active: bool):
         """Setzt Trace-Replay Status."""
-        self.replay_active = active
-        self.update()
+        if active != self.replay_active:
+            self.replay_active = active
+            self.update()
     
     def set_recording_status(self, active: bool):
         """Setzt Trace-Recording Status."""
-        self.recording_active = active
-        self.update()
+        if active != self.recording_active:
+            self.recording_active = active
+            self.update()
+    
+    def showEvent(self, event):
+        self._on_clock_tick()
+        self.clock_timer.start(500)
+        super().showEvent(event)
+    
+    def hideEvent(self, event):
+        self.clock_timer.stop()
+        super().hideEvent(event)
+    
+    def _on_clock_tick(self):
+        """Repaint bei neuer Sekunde oder solange Warnung/[REC] blinkt."""
+        time_str = datetime.now().strftime("%H:%M:%S")
+        blinking = self.warning[0] is not None or self.recording_active
+        if blinking or time_str != self.time_str:
+            self.update()
     
     def _get_critical_warning(self):
         """
@@ -349,15 +510,14 @@ class StatusBar(QWidget):
         return (None, None)
     
     def paintEvent(self, event):
-        from datetime import datetime
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
         w = self.width()
         h = self.height()
         
-        # Check critical warning
-        warning_text, warning_icon = self._get_critical_warning()
+        # Critical warning (berechnet in set_state)
+        warning_text, warning_icon = self.warning
         has_warning = warning_text is not None
         
         # Hintergrund (red bei Warnung!)
@@ -373,6 +533,7 @@ class StatusBar(QWidget):
         now = datetime.now()
         date_str = now.strftime("%d.%m.%Y")
         time_str = now.strftime("%H:%M:%S")
+        self.time_str = time_str
         
         # LINKS: Datum
         font_date = QFont("Arial", 11)
@@ -386,7 +547,6 @@ class StatusBar(QWidget):
             font_warning = QFont("Arial", 11, QFont.Bold)
             painter.setFont(font_warning)
             # Blinkendes Icon (nur Text, keine echten Icons in Qt ohne Bilder)
-            import time
             blink = int(time.time() * 2) % 2 == 0  # 2x pro Sekunde
             if blink:
                 painter.drawText(120, 0, 180, h, Qt.AlignLeft | Qt.AlignVCenter, warning_text)
@@ -407,7 +567,6 @@ class StatusBar(QWidget):
         
         # Recording-Icon (wenn aktiv) - BLINKT!
         if self.recording_active:
-            import time
             blink = int(time.time() * 2) % 2 == 0  # 2x pro Sekunde blinken
             if blink:
                 painter.setPen(QColor(230, 50, 50))  # Bright Red
@@ -458,8 +617,10 @@ class GearDisplay(QWidget):
     
     def set_gear(self, gear: str):
         """Setzt Fahrmodus."""
-        self.gear = gear if gear else "?"
-        self.update()
+        gear = gear if gear else "?"
+        if gear != self.gear:
+            self.gear = gear
+            self.update()
     
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -511,8 +672,10 @@ class BatteryBar(QWidget):
     
     def set_soc(self, soc_pct: float):
         """Setzt SOC-Wert (0-100%)."""
-        self.soc_pct = max(0.0, min(100.0, soc_pct))
-        self.update()
+        soc_pct = max(0.0, min(100.0, soc_pct))
+        if soc_pct != self.soc_pct:
+            self.soc_pct = soc_pct
+            self.update()
     
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -590,8 +753,9 @@ class TouchButton(QWidget):
     
     def setText(self, text: str):
         """Ändert den Button-Text."""
-        self.text = text
-        self.update()
+        if text != self.text:
+            self.text = text
+            self.update()
     
     def mousePressEvent(self, event):
         self.pressed = True